@@ -50,161 +50,203 @@ echo IiIiCm1haW4ucHkKLS0tLS0tLQpHxYLDs3dueSBza3J5cHQgcHJvamVrdHUgS1NlRiBBUEkgMi4
 echo LgpQb2JpZXJhIGZha3R1cnkgd3lzdGF3aW9uZSBpIG90cnp5bWFuZSwgemFwaXN1amUgZG8gRXhj
 echo ZWwuCgpVcnVjaG9taWVuaWU6CiAgICBweXRob24gbWFpbi5weQoKV3ltYWdhbmEga29uZmlndXJh
 echo Y2phIHcgcGxpa3UgLmVudiAoc2tvcGl1aiB6IC5lbnYuZXhhbXBsZSkuCiIiIgoKaW1wb3J0IGxv
-echo Z2dpbmcKaW1wb3J0IG9zCmltcG9ydCBzeXMKaW1wb3J0IHRpbWUKZnJvbSBwYXRobGliIGltcG9y
-echo dCBQYXRoCgpmcm9tIGRvdGVudiBpbXBvcnQgbG9hZF9kb3RlbnYKaW1wb3J0IG9wZW5weXhsCmZy
-echo b20gb3BlbnB5eGwuc3R5bGVzIGltcG9ydCBGb250LCBQYXR0ZXJuRmlsbCwgQWxpZ25tZW50CmZy
-echo b20gb3BlbnB5eGwudXRpbHMgaW1wb3J0IGdldF9jb2x1bW5fbGV0dGVyCgpmcm9tIGtzZWZfYXV0
-echo aCBpbXBvcnQgS1NlRkF1dGgsIEtTZUZBdXRoRXJyb3IKZnJvbSBrc2VmX2ludm9pY2VzIGltcG9y
-echo dCBLU2VGSW52b2ljZXMsIEtTZUZJbnZvaWNlRXJyb3IKCiMgLS0tLS0tLS0tLS0tLS0tLS0tLS0t
-echo LS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tCiMgS29uZmlndXJh
-echo Y2phIGxvZ293YW5pYQojIC0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0t
-echo LS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLQpsb2dnaW5nLmJhc2ljQ29uZmlnKAogICAgbGV2ZWw9
-echo bG9nZ2luZy5JTkZPLAogICAgZm9ybWF0PSIlKGFzY3RpbWUpcyAgJShsZXZlbG5hbWUpLThzICAl
-echo KG1lc3NhZ2UpcyIsCiAgICBkYXRlZm10PSIlSDolTTolUyIsCikKbG9nZ2VyID0gbG9nZ2luZy5n
-echo ZXRMb2dnZXIoX19uYW1lX18pCgojIC0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0t
-echo LS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLQojIFdjenl0YWogLmVudgojIC0tLS0tLS0t
+echo Z2dpbmcKaW1wb3J0IG9zCmltcG9ydCBzeXMKaW1wb3J0IHRpbWUKZnJvbSBjb25jdXJyZW50LmZ1
+echo dHVyZXMgaW1wb3J0IFRocmVhZFBvb2xFeGVjdXRvciwgYXNfY29tcGxldGVkCmZyb20gb3BlcmF0
+echo b3IgaW1wb3J0IGl0ZW1nZXR0ZXIKZnJvbSBwYXRobGliIGltcG9ydCBQYXRoCgpmcm9tIGRvdGVu
+echo diBpbXBvcnQgbG9hZF9kb3RlbnYKCmZyb20ga3NlZl9hdXRoIGltcG9ydCBLU2VGQXV0aCwgS1Nl
+echo RkF1dGhFcnJvcgpmcm9tIGtzZWZfaW52b2ljZXMgaW1wb3J0IEtTZUZJbnZvaWNlcywgS1NlRklu
+echo dm9pY2VFcnJvciwgU1VCSkVDVF9UWVBFX0xBQkVMUwoKIyAtLS0tLS0tLS0tLS0tLS0tLS0tLS0t
+echo LS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0KIyBLb25maWd1cmFj
+echo amEgbG9nb3dhbmlhCiMgLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0t
+echo LS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tCmxvZ2dpbmcuYmFzaWNDb25maWcoCiAgICBsZXZlbD1s
+echo b2dnaW5nLklORk8sCiAgICBmb3JtYXQ9IiUoYXNjdGltZSlzICAlKGxldmVsbmFtZSktOHMgICUo
+echo bWVzc2FnZSlzIiwKICAgIGRhdGVmbXQ9IiVIOiVNOiVTIiwKKQpsb2dnZXIgPSBsb2dnaW5nLmdl
+echo dExvZ2dlcihfX25hbWVfXykKCiMgLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0t
+echo LS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tCiMgV2N6eXRhaiAuZW52CiMgLS0tLS0tLS0t
 echo LS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0t
-echo LQpsb2FkX2RvdGVudihQYXRoKF9fZmlsZV9fKS5wYXJlbnQgLyAiLmVudiIpCgpOSVAgICAgICAg
-echo ICAgID0gb3MuZ2V0ZW52KCJLU0VGX05JUCIsICIiKS5zdHJpcCgpClRPS0VOICAgICAgICAgPSBv
-echo cy5nZXRlbnYoIktTRUZfVE9LRU4iLCAiIikuc3RyaXAoKQpFTlYgICAgICAgICAgID0gb3MuZ2V0
-echo ZW52KCJLU0VGX0VOViIsICJ0ZXN0Iikuc3RyaXAoKS5sb3dlcigpCkRBVEVfRlJPTV9TVFIgPSBv
-echo cy5nZXRlbnYoIkRBVEVfRlJPTSIsICIyMDI1LTAxLTAxIikuc3RyaXAoKQpEQVRFX1RPX1NUUiAg
-echo ID0gb3MuZ2V0ZW52KCJEQVRFX1RPIiwgICAiMjAyNS0xMi0zMSIpLnN0cmlwKCkKUEFHRV9TSVpF
-echo ICAgICA9IGludChvcy5nZXRlbnYoIlBBR0VfU0laRSIsICIxMDAiKSkKCkJBU0VfVVJMUyA9IHsK
-echo ICAgICJ0ZXN0IjogImh0dHBzOi8vYXBpLXRlc3Qua3NlZi5tZi5nb3YucGwvYXBpL3YyIiwKICAg
-echo ICJwcm9kIjogImh0dHBzOi8vYXBpLmtzZWYubWYuZ292LnBsL2FwaS92MiIsCn0KQkFTRV9VUkwg
-echo PSBCQVNFX1VSTFMuZ2V0KEVOViwgQkFTRV9VUkxTWyJ0ZXN0Il0pCgpPVVRQVVRfRklMRSA9IFBh
-echo dGgoX19maWxlX18pLnBhcmVudCAvICJmYWt0dXJ5X2tzZWYueGxzeCIKCgojIC0tLS0tLS0tLS0t
-echo LS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLQoj
-echo IEtvbHVtbnkga3TDs3JlIGNoY2VteSBwb2themHEhyB3IEV4Y2VsdQojIEtsdWN6ZSBvZHBvd2lh
-echo ZGFqxIUgcG9sb20gendyYWNhbnltIHByemV6IEtTZUYgQVBJCiMgLS0tLS0tLS0tLS0tLS0tLS0t
-echo LS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tCklOVk9JQ0Vf
-echo Q09MVU1OUyA9IFsKICAgICgiX3R5cCIsICAgICAgICAgICJUeXAgZmFrdHVyeSIpLAogICAgKCJr
-echo c2VmTnVtYmVyIiwgICAgIk51bWVyIEtTZUYiKSwKICAgICgiaW52b2ljZU51bWJlciIsICJOdW1l
-echo ciBmYWt0dXJ5IiksCiAgICAoImludm9pY2VUeXBlIiwgICAiUm9kemFqIGZha3R1cnkiKSwKICAg
-echo ICgiaXNzdWVEYXRlIiwgICAgICJEYXRhIHd5c3Rhd2llbmlhIiksCiAgICAoImludm9pY2luZ0Rh
-echo dGUiLCAiRGF0YSBwcnp5asSZY2lhIHcgS1NlRiIpLAogICAgKCJzZWxsZXJfbmFtZSIsICAgIld5
-echo c3Rhd2NhIOKAlCBuYXp3YSIpLAogICAgKCJzZWxsZXJfbmlwIiwgICAgIld5c3Rhd2NhIOKAlCBO
-echo SVAiKSwKICAgICgiYnV5ZXJfbmFtZSIsICAgICJOYWJ5d2NhIOKAlCBuYXp3YSIpLAogICAgKCJi
-echo dXllcl9uaXAiLCAgICAgIk5hYnl3Y2Eg4oCUIE5JUCIpLAogICAgKCJuZXRBbW91bnQiLCAgICAg
-echo Ikt3b3RhIG5ldHRvIiksCiAgICAoInZhdEFtb3VudCIsICAgICAiS3dvdGEgVkFUIiksCiAgICAo
-echo Imdyb3NzQW1vdW50IiwgICAiS3dvdGEgYnJ1dHRvIiksCiAgICAoImN1cnJlbmN5IiwgICAgICAi
-echo V2FsdXRhIiksCl0KCgpkZWYgZmxhdHRlbl9pbnZvaWNlKGludjogZGljdCkgLT4gZGljdDoKICAg
-echo ICIiIgogICAgU3DFgmFzemN6YSB6YWduaWXFvGTFvG9uZSBwb2xhIGZha3R1cnkgZG8gamVkbm9w
-echo b3ppb21vd2VnbyBzxYJvd25pa2EuCiAgICBLU2VGIEFQSSAyLjAgendyYWNhIHNlbGxlci5uYW1l
-echo LCBzZWxsZXIubmlwLCBidXllci5uYW1lLCBidXllci5pZGVudGlmaWVyLnZhbHVlIGl0cC4KICAg
-echo ICIiIgogICAgZmxhdDogZGljdCA9IHt9CgogICAgZm9yIGtleSwgXyBpbiBJTlZPSUNFX0NPTFVN
-echo TlM6CiAgICAgICAgaWYga2V5ID09ICJzZWxsZXJfbmFtZSI6CiAgICAgICAgICAgIGZsYXRba2V5
-echo XSA9IChpbnYuZ2V0KCJzZWxsZXIiKSBvciB7fSkuZ2V0KCJuYW1lIiwgIiIpCiAgICAgICAgZWxp
-echo ZiBrZXkgPT0gInNlbGxlcl9uaXAiOgogICAgICAgICAgICBmbGF0W2tleV0gPSAoaW52LmdldCgi
-echo c2VsbGVyIikgb3Ige30pLmdldCgibmlwIiwgIiIpCiAgICAgICAgZWxpZiBrZXkgPT0gImJ1eWVy
-echo X25hbWUiOgogICAgICAgICAgICBmbGF0W2tleV0gPSAoaW52LmdldCgiYnV5ZXIiKSBvciB7fSku
-echo Z2V0KCJuYW1lIiwgIiIpCiAgICAgICAgZWxpZiBrZXkgPT0gImJ1eWVyX25pcCI6CiAgICAgICAg
-echo ICAgICMgYnV5ZXIuaWRlbnRpZmllci52YWx1ZSAoTklQIG5hYnl3Y3kgemFnbmllxbxkxbxvbnkg
-echo Z8WCxJliaWVqKQogICAgICAgICAgICBmbGF0W2tleV0gPSAoKGludi5nZXQoImJ1eWVyIikgb3Ig
-echo e30pLmdldCgiaWRlbnRpZmllciIpIG9yIHt9KS5nZXQoInZhbHVlIiwgIiIpCiAgICAgICAgZWxz
-echo ZToKICAgICAgICAgICAgZmxhdFtrZXldID0gaW52LmdldChrZXksICIiKQoKICAgIHJldHVybiBm
-echo bGF0CgoKIyAtLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0t
-echo LS0tLS0tLS0tLS0tLS0tLS0KIyBaYXBpcyBkbyBFeGNlbAojIC0tLS0tLS0tLS0tLS0tLS0tLS0t
-echo LS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLQpIRUFERVJfRklM
-echo TCAgPSBQYXR0ZXJuRmlsbCgic29saWQiLCBmZ0NvbG9yPSIxRjRFNzkiKSAgIyBjaWVtbm9uaWVi
-echo aWVza2kKSEVBREVSX0ZPTlQgID0gRm9udChjb2xvcj0iRkZGRkZGIiwgYm9sZD1UcnVlLCBzaXpl
-echo PTExKQpBTFRfUk9XX0ZJTEwgPSBQYXR0ZXJuRmlsbCgic29saWQiLCBmZ0NvbG9yPSJENkU0RjAi
-echo KSAgIyBqYXNub2LFgsSZa2l0bnkKCgpkZWYgd3JpdGVfc2hlZXQod3MsIGludm9pY2VzOiBsaXN0
-echo W2RpY3RdLCB0aXRsZTogc3RyKSAtPiBOb25lOgogICAgIiIiWmFwaXN1amUgbGlzdMSZIGZha3R1
-echo ciBkbyBhcmt1c3phIEV4Y2VsIHogZm9ybWF0b3dhbmllbS4iIiIKCiAgICBjb2xfa2V5cyAgID0g
-echo W2NbMF0gZm9yIGMgaW4gSU5WT0lDRV9DT0xVTU5TXQogICAgY29sX2xhYmVscyA9IFtjWzFdIGZv
-echo ciBjIGluIElOVk9JQ0VfQ09MVU1OU10KCiAgICAjIE5hZ8WCw7N3ZWsKICAgIHdzLmFwcGVuZChj
-echo b2xfbGFiZWxzKQogICAgZm9yIGNvbF9pZHgsIF8gaW4gZW51bWVyYXRlKGNvbF9sYWJlbHMsIHN0
-echo YXJ0PTEpOgogICAgICAgIGNlbGwgPSB3cy5jZWxsKHJvdz0xLCBjb2x1bW49Y29sX2lkeCkKICAg
-echo ICAgICBjZWxsLmZpbGwgPSBIRUFERVJfRklMTAogICAgICAgIGNlbGwuZm9udCA9IEhFQURFUl9G
-echo T05UCiAgICAgICAgY2VsbC5hbGlnbm1lbnQgPSBBbGlnbm1lbnQoaG9yaXpvbnRhbD0iY2VudGVy
-echo IiwgdmVydGljYWw9ImNlbnRlciIsIHdyYXBfdGV4dD1UcnVlKQoKICAgIHdzLnJvd19kaW1lbnNp
-echo b25zWzFdLmhlaWdodCA9IDI4CgogICAgIyBEYW5lCiAgICBmb3Igcm93X2lkeCwgaW52IGluIGVu
-echo dW1lcmF0ZShpbnZvaWNlcywgc3RhcnQ9Mik6CiAgICAgICAgZmxhdCA9IGZsYXR0ZW5faW52b2lj
-echo ZShpbnYpCiAgICAgICAgZm9yIGNvbF9pZHgsIGtleSBpbiBlbnVtZXJhdGUoY29sX2tleXMsIHN0
-echo YXJ0PTEpOgogICAgICAgICAgICBjZWxsID0gd3MuY2VsbChyb3c9cm93X2lkeCwgY29sdW1uPWNv
-echo bF9pZHgpCiAgICAgICAgICAgIGNlbGwudmFsdWUgPSBmbGF0LmdldChrZXksICIiKQogICAgICAg
-echo ICAgICBjZWxsLmFsaWdubWVudCA9IEFsaWdubWVudCh2ZXJ0aWNhbD0idG9wIiwgd3JhcF90ZXh0
-echo PUZhbHNlKQogICAgICAgICAgICBpZiByb3dfaWR4ICUgMiA9PSAwOgogICAgICAgICAgICAgICAg
-echo Y2VsbC5maWxsID0gQUxUX1JPV19GSUxMCgogICAgIyBTemVyb2tvxZtjaSBrb2x1bW4KICAgIGNv
-echo bHVtbl93aWR0aHMgPSBbMjgsIDM2LCAyMiwgMTgsIDE4LCAyMiwgMzYsIDE2LCAzNiwgMTYsIDE0
-echo LCAxNCwgMTQsIDEwXQogICAgZm9yIGNvbF9pZHgsIHdpZHRoIGluIGVudW1lcmF0ZShjb2x1bW5f
-echo d2lkdGhzLCBzdGFydD0xKToKICAgICAgICB3cy5jb2x1bW5fZGltZW5zaW9uc1tnZXRfY29sdW1u
-echo X2xldHRlcihjb2xfaWR4KV0ud2lkdGggPSB3aWR0aAoKICAgICMgWmFtcm/FvGVuaWUgbmFnxYLD
-echo s3drYQogICAgd3MuZnJlZXplX3BhbmVzID0gIkEyIgoKICAgICMgQXV0b2ZpbHRyCiAgICB3cy5h
-echo dXRvX2ZpbHRlci5yZWYgPSB3cy5kaW1lbnNpb25zCgoKZGVmIHNhdmVfdG9fZXhjZWwod3lzdGF3
-echo aW9uZTogbGlzdFtkaWN0XSwgb3RyenltYW5lOiBsaXN0W2RpY3RdLCBwYXRoOiBQYXRoKSAtPiBO
-echo b25lOgogICAgIiIiVHdvcnp5IHBsaWsgRXhjZWwgeiBkd29tYSBhcmt1c3phbWkuIiIiCiAgICB3
-echo YiA9IG9wZW5weXhsLldvcmtib29rKCkKCiAgICAjIEFya3VzeiAxIOKAlCBXeXN0YXdpb25lCiAg
-echo ICB3czEgPSB3Yi5hY3RpdmUKICAgIHdzMS50aXRsZSA9ICJXeXN0YXdpb25lIgogICAgd3JpdGVf
-echo c2hlZXQod3MxLCB3eXN0YXdpb25lLCAiV3lzdGF3aW9uZSIpCgogICAgIyBBcmt1c3ogMiDigJQg
-echo T3RyenltYW5lCiAgICB3czIgPSB3Yi5jcmVhdGVfc2hlZXQoIk90cnp5bWFuZSIpCiAgICB3cml0
-echo ZV9zaGVldCh3czIsIG90cnp5bWFuZSwgIk90cnp5bWFuZSIpCgogICAgIyBBcmt1c3ogMyDigJQg
-echo UG9kc3Vtb3dhbmllCiAgICB3czMgPSB3Yi5jcmVhdGVfc2hlZXQoIlBvZHN1bW93YW5pZSIpCiAg
-echo ICB3czMuYXBwZW5kKFsiS1NlRiBBUEkgMi4wIOKAlCBQb2JpZXJhbmllIGZha3R1ciJdKQogICAg
-echo d3MzLmFwcGVuZChbXSkKICAgIHdzMy5hcHBlbmQoWyJOSVAgZmlybXk6IiwgICAgICAgTklQXSkK
-echo ICAgIHdzMy5hcHBlbmQoWyLFmnJvZG93aXNrbzoiLCAgICAgIEVOVi51cHBlcigpXSkKICAgIHdz
-echo My5hcHBlbmQoWyJaYWtyZXMgZGF0OiIsICAgICAgZiJ7REFURV9GUk9NX1NUUn0g4oCUIHtEQVRF
-echo X1RPX1NUUn0iXSkKICAgIHdzMy5hcHBlbmQoWyJGYWt0dXIgd3lzdGF3aW9ueWNoOiIsIGxlbih3
-echo eXN0YXdpb25lKV0pCiAgICB3czMuYXBwZW5kKFsiRmFrdHVyIG90cnp5bWFueWNoOiIsICBsZW4o
-echo b3RyenltYW5lKV0pCiAgICB3czMuYXBwZW5kKFsixYHEhWN6bmllOiIsICAgICAgICAgICAgIGxl
-echo bih3eXN0YXdpb25lKSArIGxlbihvdHJ6eW1hbmUpXSkKCiAgICB3czMuY29sdW1uX2RpbWVuc2lv
-echo bnNbIkEiXS53aWR0aCA9IDI4CiAgICB3czMuY29sdW1uX2RpbWVuc2lvbnNbIkIiXS53aWR0aCA9
-echo IDMwCiAgICB3czNbIkExIl0uZm9udCA9IEZvbnQoYm9sZD1UcnVlLCBzaXplPTE0KQoKICAgIHdi
-echo LnNhdmUocGF0aCkKCgojIC0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0t
-echo LS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLQojIE1BSU4KIyAtLS0tLS0tLS0tLS0tLS0tLS0tLS0t
-echo LS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0KZGVmIG1haW4oKSAt
-echo PiBOb25lOgogICAgbG9nZ2VyLmluZm8oIj0iICogNTUpCiAgICBsb2dnZXIuaW5mbygiICBLU2VG
-echo IEFQSSAyLjAg4oCUIFBvYmllcmFuaWUgZmFrdHVyIikKICAgIGxvZ2dlci5pbmZvKCI9IiAqIDU1
-echo KQoKICAgICMgV2FsaWRhY2phIGtvbmZpZ3VyYWNqaQogICAgaWYgbm90IE5JUCBvciBub3QgVE9L
-echo RU46CiAgICAgICAgbG9nZ2VyLmVycm9yKAogICAgICAgICAgICAiQnJhayBrb25maWd1cmFjamkh
-echo IFV6dXBlxYJuaWogcGxpayAuZW52IChLU0VGX05JUCBpIEtTRUZfVE9LRU4pLlxuIgogICAgICAg
-echo ICAgICAiU2tvcGl1aiAuZW52LmV4YW1wbGUg4oaSIC5lbnYgaSB1enVwZcWCbmlqIHdhcnRvxZtj
-echo aS4iCiAgICAgICAgKQogICAgICAgIHN5cy5leGl0KDEpCgogICAgbG9nZ2VyLmluZm8oZiJOSVA6
-echo IHtOSVB9IHwgxZpyb2Rvd2lza286IHtFTlYudXBwZXIoKX0gfCBaYWtyZXM6IHtEQVRFX0ZST01f
-echo U1RSfSDigJQge0RBVEVfVE9fU1RSfSIpCgogICAgIyAtLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0t
-echo LS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0KICAgICMgMS4gVXdpZXJ6
-echo eXRlbG5pZW5pZQogICAgIyAtLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0t
-echo LS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0KICAgIGF1dGggPSBLU2VGQXV0aChuaXA9TklQLCBr
-echo c2VmX3Rva2VuPVRPS0VOLCBlbnY9RU5WKQogICAgdHJ5OgogICAgICAgIGF1dGguYXV0aGVudGlj
-echo YXRlKCkKICAgIGV4Y2VwdCBLU2VGQXV0aEVycm9yIGFzIGU6CiAgICAgICAgbG9nZ2VyLmVycm9y
-echo KGYiQsWCxIVkIHV3aWVyenl0ZWxuaWVuaWE6IHtlfSIpCiAgICAgICAgc3lzLmV4aXQoMSkKCiAg
-echo ICBhdXRoX2hlYWRlcnMgPSBhdXRoLmdldF9hdXRoX2hlYWRlcnMoKQogICAgdGltZS5zbGVlcCgx
-echo KSAgIyBrcsOzdGtpZSBvcMOzxbpuaWVuaWUgcG8gdXdpZXJ6eXRlbG5pZW5pdQoKICAgICMgLS0t
+echo CmxvYWRfZG90ZW52KFBhdGgoX19maWxlX18pLnBhcmVudCAvICIuZW52IikKCk5JUCAgICAgICAg
+echo ICAgPSBvcy5nZXRlbnYoIktTRUZfTklQIiwgIiIpLnN0cmlwKCkKVE9LRU4gICAgICAgICA9IG9z
+echo LmdldGVudigiS1NFRl9UT0tFTiIsICIiKS5zdHJpcCgpCkVOViAgICAgICAgICAgPSBvcy5nZXRl
+echo bnYoIktTRUZfRU5WIiwgInRlc3QiKS5zdHJpcCgpLmxvd2VyKCkKREFURV9GUk9NX1NUUiA9IG9z
+echo LmdldGVudigiREFURV9GUk9NIiwgIjIwMjUtMDEtMDEiKS5zdHJpcCgpCkRBVEVfVE9fU1RSICAg
+echo PSBvcy5nZXRlbnYoIkRBVEVfVE8iLCAgICIyMDI1LTEyLTMxIikuc3RyaXAoKQpQQUdFX1NJWkUg
+echo ICAgID0gaW50KG9zLmdldGVudigiUEFHRV9TSVpFIiwgIjEwMCIpKQoKQkFTRV9VUkxTID0gewog
+echo ICAgInRlc3QiOiAiaHR0cHM6Ly9hcGktdGVzdC5rc2VmLm1mLmdvdi5wbC9hcGkvdjIiLAogICAg
+echo InByb2QiOiAiaHR0cHM6Ly9hcGkua3NlZi5tZi5nb3YucGwvYXBpL3YyIiwKfQpCQVNFX1VSTCA9
+echo IEJBU0VfVVJMUy5nZXQoRU5WLCBCQVNFX1VSTFNbInRlc3QiXSkKCk9VVFBVVF9GSUxFID0gUGF0
+echo aChfX2ZpbGVfXykucGFyZW50IC8gImZha3R1cnlfa3NlZi54bHN4IgoKCiMgLS0tLS0tLS0tLS0t
+echo LS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tCiMg
+echo S29sdW1ueSBrdMOzcmUgY2hjZW15IHBva2F6YcSHIHcgRXhjZWx1CiMgS2x1Y3plIG9kcG93aWFk
+echo YWrEhSBwb2xvbSB6d3JhY2FueW0gcHJ6ZXogS1NlRiBBUEkKIyAtLS0tLS0tLS0tLS0tLS0tLS0t
+echo LS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0KSU5WT0lDRV9D
+echo T0xVTU5TID0gWwogICAgKCJfdHlwIiwgICAgICAgICAgIlR5cCBmYWt0dXJ5IiksCiAgICAoImtz
+echo ZWZOdW1iZXIiLCAgICAiTnVtZXIgS1NlRiIpLAogICAgKCJpbnZvaWNlTnVtYmVyIiwgIk51bWVy
+echo IGZha3R1cnkiKSwKICAgICgiaW52b2ljZVR5cGUiLCAgICJSb2R6YWogZmFrdHVyeSIpLAogICAg
+echo KCJpc3N1ZURhdGUiLCAgICAgIkRhdGEgd3lzdGF3aWVuaWEiKSwKICAgICgiaW52b2ljaW5nRGF0
+echo ZSIsICJEYXRhIHByenlqxJljaWEgdyBLU2VGIiksCiAgICAoInNlbGxlcl9uYW1lIiwgICAiV3lz
+echo dGF3Y2Eg4oCUIG5hendhIiksCiAgICAoInNlbGxlcl9uaXAiLCAgICAiV3lzdGF3Y2Eg4oCUIE5J
+echo UCIpLAogICAgKCJidXllcl9uYW1lIiwgICAgIk5hYnl3Y2Eg4oCUIG5hendhIiksCiAgICAoImJ1
+echo eWVyX25pcCIsICAgICAiTmFieXdjYSDigJQgTklQIiksCiAgICAoIm5ldEFtb3VudCIsICAgICAi
+echo S3dvdGEgbmV0dG8iKSwKICAgICgidmF0QW1vdW50IiwgICAgICJLd290YSBWQVQiKSwKICAgICgi
+echo Z3Jvc3NBbW91bnQiLCAgICJLd290YSBicnV0dG8iKSwKICAgICgiY3VycmVuY3kiLCAgICAgICJX
+echo YWx1dGEiKSwKXQoKCl9FTVBUWTogZGljdCA9IHt9ICAjIHdzcMOzbG55IHB1c3R5IHPFgm93bmlr
+echo IGRsYSBicmFrdWrEhWN5Y2ggcMOzbCB6YWduaWXFvGTFvG9ueWNoIOKAlCBETyBOT1QgTVVUQVRF
+echo CgoKZGVmIGZsYXR0ZW5faW52b2ljZShpbnY6IGRpY3QsIGxhYmVsOiBzdHIgPSAiIikgLT4gZGlj
+echo dDoKICAgICIiIgogICAgU3DFgmFzemN6YSB6YWduaWXFvGTFvG9uZSBwb2xhIGZha3R1cnkgZG8g
+echo amVkbm9wb3ppb21vd2VnbyBzxYJvd25pa2EuCiAgICBLU2VGIEFQSSAyLjAgendyYWNhIHNlbGxl
+echo ci5uYW1lLCBzZWxsZXIubmlwLCBidXllci5uYW1lLCBidXllci5pZGVudGlmaWVyLnZhbHVlIGl0
+echo cC4KICAgIFphd2llcmEgd3N6eXN0a2llIGtsdWN6ZSB6IElOVk9JQ0VfQ09MVU1OUzsgX3R5cCB0
+echo byBldHlraWV0YSBhcmt1c3phLgogICAgIiIiCiAgICBnZXQgICAgPSBpbnYuZ2V0CiAgICBzZWxs
+echo ZXIgPSBnZXQoInNlbGxlciIpIG9yIF9FTVBUWQogICAgYnV5ZXIgID0gZ2V0KCJidXllciIpIG9y
+echo IF9FTVBUWQogICAgIyBidXllci5pZGVudGlmaWVyLnZhbHVlIChOSVAgbmFieXdjeSB6YWduaWXF
+echo vGTFvG9ueSBnxYLEmWJpZWopCiAgICBidXllcl9pZCA9IGJ1eWVyLmdldCgiaWRlbnRpZmllciIp
+echo IG9yIF9FTVBUWQogICAgcmV0dXJuIHsKICAgICAgICAiX3R5cCI6ICAgICAgICAgIGxhYmVsLAog
+echo ICAgICAgICJrc2VmTnVtYmVyIjogICAgZ2V0KCJrc2VmTnVtYmVyIiwgIiIpLAogICAgICAgICJp
+echo bnZvaWNlTnVtYmVyIjogZ2V0KCJpbnZvaWNlTnVtYmVyIiwgIiIpLAogICAgICAgICJpbnZvaWNl
+echo VHlwZSI6ICAgZ2V0KCJpbnZvaWNlVHlwZSIsICIiKSwKICAgICAgICAiaXNzdWVEYXRlIjogICAg
+echo IGdldCgiaXNzdWVEYXRlIiwgIiIpLAogICAgICAgICJpbnZvaWNpbmdEYXRlIjogZ2V0KCJpbnZv
+echo aWNpbmdEYXRlIiwgIiIpLAogICAgICAgICJzZWxsZXJfbmFtZSI6ICAgc2VsbGVyLmdldCgibmFt
+echo ZSIsICIiKSwKICAgICAgICAic2VsbGVyX25pcCI6ICAgIHNlbGxlci5nZXQoIm5pcCIsICIiKSwK
+echo ICAgICAgICAiYnV5ZXJfbmFtZSI6ICAgIGJ1eWVyLmdldCgibmFtZSIsICIiKSwKICAgICAgICAi
+echo YnV5ZXJfbmlwIjogICAgIGJ1eWVyX2lkLmdldCgidmFsdWUiLCAiIiksCiAgICAgICAgIm5ldEFt
+echo b3VudCI6ICAgICBnZXQoIm5ldEFtb3VudCIsICIiKSwKICAgICAgICAidmF0QW1vdW50IjogICAg
+echo IGdldCgidmF0QW1vdW50IiwgIiIpLAogICAgICAgICJncm9zc0Ftb3VudCI6ICAgZ2V0KCJncm9z
+echo c0Ftb3VudCIsICIiKSwKICAgICAgICAiY3VycmVuY3kiOiAgICAgIGdldCgiY3VycmVuY3kiLCAi
+echo IiksCiAgICB9CgoKIyAtLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0t
+echo LS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0KIyBaYXBpcyBkbyBFeGNlbAojIC0tLS0tLS0tLS0tLS0t
+echo LS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLQpIRUFE
+echo RVJfRk9STUFUICA9IHsKICAgICJib2xkIjogVHJ1ZSwgImZvbnRfY29sb3IiOiAiI0ZGRkZGRiIs
+echo ICJmb250X3NpemUiOiAxMSwKICAgICJiZ19jb2xvciI6ICIjMUY0RTc5IiwgICMgY2llbW5vbmll
+echo Ymllc2tpCiAgICAiYWxpZ24iOiAiY2VudGVyIiwgInZhbGlnbiI6ICJ2Y2VudGVyIiwgInRleHRf
+echo d3JhcCI6IFRydWUsCn0KREFUQV9GT1JNQVQgICAgPSB7InZhbGlnbiI6ICJ0b3AifQpBTFRfUk9X
+echo X0ZPUk1BVCA9IHsqKkRBVEFfRk9STUFULCAiYmdfY29sb3IiOiAiI0Q2RTRGMCJ9ICAjIGphc25v
+echo YsWCxJlraXRueQpUSVRMRV9GT1JNQVQgICA9IHsiYm9sZCI6IFRydWUsICJmb250X3NpemUiOiAx
+echo NH0KCkZPUk1BVFMgPSB7CiAgICAiaGVhZGVyIjogIEhFQURFUl9GT1JNQVQsCiAgICAiZGF0YSI6
+echo ICAgIERBVEFfRk9STUFULAogICAgImFsdF9yb3ciOiBBTFRfUk9XX0ZPUk1BVCwKICAgICJ0aXRs
+echo ZSI6ICAgVElUTEVfRk9STUFULAp9CgpDT0xVTU5fV0lEVEhTID0gWzI4LCAzNiwgMjIsIDE4LCAx
+echo OCwgMjIsIDM2LCAxNiwgMzYsIDE2LCAxNCwgMTQsIDE0LCAxMF0KQ09MVU1OX0tFWVMgICA9IFtj
+echo WzBdIGZvciBjIGluIElOVk9JQ0VfQ09MVU1OU10KQ09MVU1OX0xBQkVMUyA9IFtjWzFdIGZvciBj
+echo IGluIElOVk9JQ0VfQ09MVU1OU10KIyBXYXJ0b8WbY2kgd2llcnN6YSB3IGtvbGVqbm/Fm2NpIElO
+echo Vk9JQ0VfQ09MVU1OUyDigJQgcG8ga2x1Y3p1LCBuaWUgcG8ga29sZWpub8WbY2kgc8WCb3duaWth
+echo Cl9yb3dfdmFsdWVzICAgPSBpdGVtZ2V0dGVyKCpDT0xVTU5fS0VZUykKTEFTVF9DT0wgICAgICA9
+echo IGxlbihJTlZPSUNFX0NPTFVNTlMpIC0gMSAgIyBpbmRla3Mgb3N0YXRuaWVqIGtvbHVtbnkgKG9k
+echo IDApIOKAlCBkbGEgYXV0b2ZpbHRyYQoKCmRlZiB3cml0ZV9zaGVldCh3cywgaW52b2ljZXM6IGxp
+echo c3RbZGljdF0sIHRpdGxlOiBzdHIsIGxhYmVsOiBzdHIsIGZvcm1hdHM6IGRpY3QpIC0+IE5vbmU6
+echo CiAgICAiIiIKICAgIFphcGlzdWplIGxpc3TEmSBmYWt0dXIgZG8gYXJrdXN6YSBFeGNlbCB6IGZv
+echo cm1hdG93YW5pZW0uCiAgICBXb3JrYm9vayB3IHRyeWJpZSBjb25zdGFudF9tZW1vcnkg4oCUIHdp
+echo ZXJzemUgemFwaXN5d2FuZSBzxIUgcG8ga29sZWkKICAgIGkgb2QgcmF6dSB6cnp1Y2FuZSBuYSBk
+echo eXNrLCB3acSZYyBrb2x1bW55LCB3eXNva2/Fm8SHIG5hZ8WCw7N3a2EKICAgIGkgemFtcm/FvGVu
+echo aWUgdXN0YXdpYW15IHByemVkIHBpZXJ3c3p5bSB3aWVyc3plbS4KICAgIEtvbHVtbmEg4oCeVHlw
+echo IGZha3R1cnnigJ0gdG8gc3RhxYJhIGxhYmVsLCB3c3DDs2xuYSBkbGEgY2HFgmVnbyBhcmt1c3ph
+echo LgogICAgIiIiCgogICAgIyBTemVyb2tvxZtjaSBrb2x1bW4KICAgIGZvciBjb2xfaWR4LCB3aWR0
+echo aCBpbiBlbnVtZXJhdGUoQ09MVU1OX1dJRFRIUyk6CiAgICAgICAgd3Muc2V0X2NvbHVtbihjb2xf
+echo aWR4LCBjb2xfaWR4LCB3aWR0aCkKCiAgICAjIFphbXJvxbxlbmllIG5hZ8WCw7N3a2EKICAgIHdz
+echo LmZyZWV6ZV9wYW5lcygxLCAwKQoKICAgICMgTmFnxYLDs3dlawogICAgd3Muc2V0X3JvdygwLCAy
+echo OCkKICAgIHdzLndyaXRlX3JvdygwLCAwLCBDT0xVTU5fTEFCRUxTLCBmb3JtYXRzWyJoZWFkZXIi
+echo XSkKCiAgICAjIERhbmUKICAgIGRhdGFfZm10LCBhbHRfZm10ID0gZm9ybWF0c1siZGF0YSJdLCBm
+echo b3JtYXRzWyJhbHRfcm93Il0KICAgIGZvciByb3dfaWR4LCBpbnYgaW4gZW51bWVyYXRlKGludm9p
+echo Y2VzLCBzdGFydD0xKToKICAgICAgICAjIGNvIGRydWdpIHdpZXJzeiB3eXBlxYJuaW9ueSAod2ll
+echo cnN6ZSAyLCA0LCAuLi4gdyBudW1lcmFjamkgRXhjZWxhKQogICAgICAgIGZtdCA9IGFsdF9mbXQg
+echo aWYgcm93X2lkeCAlIDIgZWxzZSBkYXRhX2ZtdAogICAgICAgIHdzLndyaXRlX3Jvdyhyb3dfaWR4
+echo LCAwLCBfcm93X3ZhbHVlcyhmbGF0dGVuX2ludm9pY2UoaW52LCBsYWJlbCkpLCBmbXQpCgogICAg
+echo IyBBdXRvZmlsdHIg4oCUIHpha3JlcyB6bmFueSB6IGfDs3J5OiBuYWfFgsOzd2VrICsgbGVuKGlu
+echo dm9pY2VzKSB3aWVyc3p5LCBiZXogc2thbm93YW5pYSBhcmt1c3phCiAgICB3cy5hdXRvZmlsdGVy
+echo KDAsIDAsIGxlbihpbnZvaWNlcyksIExBU1RfQ09MKQoKCmRlZiBhZGRfZm9ybWF0cyh3YikgLT4g
+echo ZGljdDoKICAgICIiIgogICAgUmVqZXN0cnVqZSB3c3p5c3RraWUgZm9ybWF0eSB3IHNrb3Jvc3p5
+echo Y2llIGplZGVuIHJheiDigJQga29tw7Nya2kgb2R3b8WCdWrEhSBzacSZCiAgICBkbyBuaWNoIHBy
+echo emV6IGluZGVrcyB3IHN0eWxlcy54bWwsIMW8YWRlbiBmb3JtYXQgbmllIGplc3QgdHdvcnpvbnkg
+echo dyBwxJl0bGkuCiAgICAiIiIKICAgIHJldHVybiB7bmFtZTogd2IuYWRkX2Zvcm1hdChzcGVjKSBm
+echo b3IgbmFtZSwgc3BlYyBpbiBGT1JNQVRTLml0ZW1zKCl9CgoKZGVmIHNhdmVfdG9fZXhjZWwod3lz
+echo dGF3aW9uZTogbGlzdFtkaWN0XSwgb3RyenltYW5lOiBsaXN0W2RpY3RdLCBwYXRoOiBQYXRoKSAt
+echo PiBOb25lOgogICAgIiIiVHdvcnp5IHBsaWsgRXhjZWwgeiBkd29tYSBhcmt1c3phbWkuIiIiCiAg
+echo ICBpbXBvcnQgeGxzeHdyaXRlciAgIyBpbXBvcnRvd2FuZSBkb3BpZXJvIHByenkgemFwaXNpZSDi
+echo gJQgc3p5YnN6eSBzdGFydCwgZ2R5IHNrcnlwdCBrb8WEY3p5IHNpxJkgd2N6ZcWbbmllagoKICAg
+echo IHdiID0geGxzeHdyaXRlci5Xb3JrYm9vayhzdHIocGF0aCksIHsKICAgICAgICAiY29uc3RhbnRf
+echo bWVtb3J5IjogVHJ1ZSwKICAgICAgICAic3RyaW5nc190b19mb3JtdWxhcyI6IEZhbHNlLAogICAg
+echo ICAgICJzdHJpbmdzX3RvX3VybHMiOiBGYWxzZSwKICAgIH0pCiAgICBmb3JtYXRzID0gYWRkX2Zv
+echo cm1hdHMod2IpCgogICAgIyBBcmt1c3ogMSDigJQgV3lzdGF3aW9uZQogICAgd3MxID0gd2IuYWRk
+echo X3dvcmtzaGVldCgiV3lzdGF3aW9uZSIpCiAgICB3cml0ZV9zaGVldCh3czEsIHd5c3Rhd2lvbmUs
+echo ICJXeXN0YXdpb25lIiwgU1VCSkVDVF9UWVBFX0xBQkVMU1siU3ViamVjdDEiXSwgZm9ybWF0cykK
+echo CiAgICAjIEFya3VzeiAyIOKAlCBPdHJ6eW1hbmUKICAgIHdzMiA9IHdiLmFkZF93b3Jrc2hlZXQo
+echo Ik90cnp5bWFuZSIpCiAgICB3cml0ZV9zaGVldCh3czIsIG90cnp5bWFuZSwgIk90cnp5bWFuZSIs
+echo IFNVQkpFQ1RfVFlQRV9MQUJFTFNbIlN1YmplY3QyIl0sIGZvcm1hdHMpCgogICAgIyBBcmt1c3og
+echo MyDigJQgUG9kc3Vtb3dhbmllCiAgICB3czMgPSB3Yi5hZGRfd29ya3NoZWV0KCJQb2RzdW1vd2Fu
+echo aWUiKQogICAgd3MzLnNldF9jb2x1bW4oMCwgMCwgMjgpCiAgICB3czMuc2V0X2NvbHVtbigxLCAx
+echo LCAzMCkKICAgIHN1bW1hcnkgPSBbCiAgICAgICAgWyJLU2VGIEFQSSAyLjAg4oCUIFBvYmllcmFu
+echo aWUgZmFrdHVyIl0sCiAgICAgICAgW10sCiAgICAgICAgWyJOSVAgZmlybXk6IiwgICAgICAgTklQ
+echo XSwKICAgICAgICBbIsWacm9kb3dpc2tvOiIsICAgICAgRU5WLnVwcGVyKCldLAogICAgICAgIFsi
+echo WmFrcmVzIGRhdDoiLCAgICAgIGYie0RBVEVfRlJPTV9TVFJ9IOKAlCB7REFURV9UT19TVFJ9Il0s
+echo CiAgICAgICAgWyJGYWt0dXIgd3lzdGF3aW9ueWNoOiIsIGxlbih3eXN0YXdpb25lKV0sCiAgICAg
+echo ICAgWyJGYWt0dXIgb3RyenltYW55Y2g6IiwgIGxlbihvdHJ6eW1hbmUpXSwKICAgICAgICBbIsWB
+echo xIVjem5pZToiLCAgICAgICAgICAgICBsZW4od3lzdGF3aW9uZSkgKyBsZW4ob3RyenltYW5lKV0s
+echo CiAgICBdCiAgICB3czMud3JpdGUoMCwgMCwgc3VtbWFyeVswXVswXSwgZm9ybWF0c1sidGl0bGUi
+echo XSkKICAgIGZvciByb3dfaWR4LCByb3cgaW4gZW51bWVyYXRlKHN1bW1hcnlbMTpdLCBzdGFydD0x
+echo KToKICAgICAgICB3czMud3JpdGVfcm93KHJvd19pZHgsIDAsIHJvdykKCiAgICB3Yi5jbG9zZSgp
+echo CgoKIyAtLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0t
+echo LS0tLS0tLS0tLS0tLS0KIyBNQUlOCiMgLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0t
+echo LS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tCmRlZiBtYWluKCkgLT4gTm9uZToKICAg
+echo IGxvZ2dlci5pbmZvKCI9IiAqIDU1KQogICAgbG9nZ2VyLmluZm8oIiAgS1NlRiBBUEkgMi4wIOKA
+echo lCBQb2JpZXJhbmllIGZha3R1ciIpCiAgICBsb2dnZXIuaW5mbygiPSIgKiA1NSkKCiAgICAjIFdh
+echo bGlkYWNqYSBrb25maWd1cmFjamkKICAgIGlmIG5vdCBOSVAgb3Igbm90IFRPS0VOOgogICAgICAg
+echo IGxvZ2dlci5lcnJvcigKICAgICAgICAgICAgIkJyYWsga29uZmlndXJhY2ppISBVenVwZcWCbmlq
+echo IHBsaWsgLmVudiAoS1NFRl9OSVAgaSBLU0VGX1RPS0VOKS5cbiIKICAgICAgICAgICAgIlNrb3Bp
+echo dWogLmVudi5leGFtcGxlIOKGkiAuZW52IGkgdXp1cGXFgm5paiB3YXJ0b8WbY2kuIgogICAgICAg
+echo ICkKICAgICAgICBzeXMuZXhpdCgxKQoKICAgIGxvZ2dlci5pbmZvKCJOSVA6ICVzIHwgxZpyb2Rv
+echo d2lza286ICVzIHwgWmFrcmVzOiAlcyDigJQgJXMiLCBOSVAsIEVOVi51cHBlcigpLCBEQVRFX0ZS
+echo T01fU1RSLCBEQVRFX1RPX1NUUikKCiAgICAjIC0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0t
+echo LS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLQogICAgIyAxLiBVd2llcnp5dGVs
+echo bmllbmllCiAgICAjIC0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0t
+echo LS0tLS0tLS0tLS0tLS0tLS0tLS0tLQogICAgYXV0aCA9IEtTZUZBdXRoKG5pcD1OSVAsIGtzZWZf
+echo dG9rZW49VE9LRU4sIGVudj1FTlYpCiAgICB0cnk6CiAgICAgICAgYXV0aC5hdXRoZW50aWNhdGUo
+echo KQogICAgZXhjZXB0IEtTZUZBdXRoRXJyb3IgYXMgZToKICAgICAgICBsb2dnZXIuZXJyb3IoIkLF
+echo gsSFZCB1d2llcnp5dGVsbmllbmlhOiAlcyIsIGUpCiAgICAgICAgc3lzLmV4aXQoMSkKCiAgICBh
+echo dXRoX2hlYWRlcnMgPSBhdXRoLmdldF9hdXRoX2hlYWRlcnMoKQogICAgdGltZS5zbGVlcCgxKSAg
+echo IyBrcsOzdGtpZSBvcMOzxbpuaWVuaWUgcG8gdXdpZXJ6eXRlbG5pZW5pdQoKICAgICMgLS0tLS0t
 echo LS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0t
-echo LS0tLS0tCiAgICAjIDIuIFByenlnb3Rvd2FuaWUgZGF0IHcgZm9ybWFjaWUgSVNPIDg2MDEKICAg
-echo ICMgLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0t
-echo LS0tLS0tLS0tLS0tCiAgICBkYXRlX2Zyb20gPSBLU2VGSW52b2ljZXMudG9faXNvKERBVEVfRlJP
-echo TV9TVFIsIGVuZF9vZl9kYXk9RmFsc2UpCiAgICBkYXRlX3RvICAgPSBLU2VGSW52b2ljZXMudG9f
-echo aXNvKERBVEVfVE9fU1RSLCAgIGVuZF9vZl9kYXk9VHJ1ZSkKICAgIGxvZ2dlci5pbmZvKGYiWmFr
-echo cmVzIGRhdCBJU086IHtkYXRlX2Zyb219ICDihpIgIHtkYXRlX3RvfSIpCgogICAgIyAtLS0tLS0t
+echo LS0tCiAgICAjIDIuIFByenlnb3Rvd2FuaWUgZGF0IHcgZm9ybWFjaWUgSVNPIDg2MDEKICAgICMg
+echo LS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0t
+echo LS0tLS0tLS0tCiAgICBkYXRlX2Zyb20gPSBLU2VGSW52b2ljZXMudG9faXNvKERBVEVfRlJPTV9T
+echo VFIsIGVuZF9vZl9kYXk9RmFsc2UpCiAgICBkYXRlX3RvICAgPSBLU2VGSW52b2ljZXMudG9faXNv
+echo KERBVEVfVE9fU1RSLCAgIGVuZF9vZl9kYXk9VHJ1ZSkKICAgIGxvZ2dlci5pbmZvKCJaYWtyZXMg
+echo ZGF0IElTTzogJXMgIOKGkiAgJXMiLCBkYXRlX2Zyb20sIGRhdGVfdG8pCgogICAgIyAtLS0tLS0t
 echo LS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0t
 echo LS0KICAgICMgMy4gUG9iaWVyYW5pZSBmYWt0dXIKICAgICMgLS0tLS0tLS0tLS0tLS0tLS0tLS0t
 echo LS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tCiAgICAjIGF1dGgg
 echo cHJ6ZWthemFueSBkbyBrbGllbnRhIOKAlCBvYnPFgnXFvHkgd3lnYcWbbmnEmWNpZSB0b2tlbmEg
-echo KDQwMSkgYXV0b21hdHljem5pZQogICAgY2xpZW50ID0gS1NlRkludm9pY2VzKGJhc2VfdXJsPUJB
-echo U0VfVVJMLCBhdXRoX2hlYWRlcnM9YXV0aF9oZWFkZXJzLCBwYWdlX3NpemU9UEFHRV9TSVpFLCBh
-echo dXRoPWF1dGgpCgogICAgd3lzdGF3aW9uZTogbGlzdFtkaWN0XSA9IFtdCiAgICBvdHJ6eW1hbmU6
-echo ICBsaXN0W2RpY3RdID0gW10KCiAgICB0cnk6CiAgICAgICAgbG9nZ2VyLmluZm8oIlxuLS0tIEZB
-echo S1RVUlkgV1lTVEFXSU9ORSAtLS0iKQogICAgICAgIHd5c3Rhd2lvbmUgPSBjbGllbnQuZmV0Y2hf
-echo YWxsKCJTdWJqZWN0MSIsIGRhdGVfZnJvbSwgZGF0ZV90bykKCiAgICAgICAgbG9nZ2VyLmluZm8o
-echo IlxuLS0tIEZBS1RVUlkgT1RSWllNQU5FIC0tLSIpCiAgICAgICAgb3RyenltYW5lID0gY2xpZW50
-echo LmZldGNoX2FsbCgiU3ViamVjdDIiLCBkYXRlX2Zyb20sIGRhdGVfdG8pCgogICAgZXhjZXB0IEtT
-echo ZUZJbnZvaWNlRXJyb3IgYXMgZToKICAgICAgICBsb2dnZXIuZXJyb3IoZiJCxYLEhWQgcG9iaWVy
-echo YW5pYSBmYWt0dXI6IHtlfSIpCiAgICAgICAgc3lzLmV4aXQoMSkKCiAgICAjIC0tLS0tLS0tLS0t
-echo LS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLQog
-echo ICAgIyA0LiBaYXBpcyBkbyBFeGNlbAogICAgIyAtLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0t
-echo LS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0KICAgIGxvZ2dlci5pbmZvKGYi
-echo XG5aYXBpc3l3YW5pZSBkbyBwbGlrdToge09VVFBVVF9GSUxFLm5hbWV9IC4uLiIpCiAgICBzYXZl
+echo KDQwMSkgYXV0b21hdHljem5pZTsKICAgICMgd3Nww7NsbmEgc2VzamEgSFRUUCA9IGplZG5hIHB1
+echo bGEgcG/FgsSFY3plxYQgZGxhIHV3aWVyenl0ZWxuaWVuaWEgaSBwb2JpZXJhbmlhCiAgICBjbGll
+echo bnQgPSBLU2VGSW52b2ljZXMoYmFzZV91cmw9QkFTRV9VUkwsIGF1dGhfaGVhZGVycz1hdXRoX2hl
+echo YWRlcnMsIHBhZ2Vfc2l6ZT1QQUdFX1NJWkUsCiAgICAgICAgICAgICAgICAgICAgICAgICAgYXV0
+echo aD1hdXRoLCBzZXNzaW9uPWF1dGguc2Vzc2lvbikKCiAgICAjIFd5c3Rhd2lvbmUgKFN1YmplY3Qx
+echo KSBpIG90cnp5bWFuZSAoU3ViamVjdDIpIHRvIG5pZXphbGXFvG5lIHphcHl0YW5pYSDigJQKICAg
+echo ICMgcG9iaWVyYW5lIHcgZHfDs2NoIHfEhXRrYWNoLCB3acSZYyBvY3pla2l3YW5pYSBtacSZZHp5
+echo IG9rbmFtaSBuYWvFgmFkYWrEhSBzacSZCiAgICByZXN1bHRzOiBkaWN0W3N0ciwgbGlzdFtkaWN0
+echo XV0gPSB7fQoKICAgIGxvZ2dlci5pbmZvKCJcbi0tLSBGQUtUVVJZIFdZU1RBV0lPTkUgSSBPVFJa
+echo WU1BTkUgKHLDs3dub2xlZ2xlKSAtLS0iKQogICAgcG9vbCA9IFRocmVhZFBvb2xFeGVjdXRvciht
+echo YXhfd29ya2Vycz0yKQogICAgdHJ5OgogICAgICAgIGZ1dHVyZXMgPSB7CiAgICAgICAgICAgIHBv
+echo b2wuc3VibWl0KGNsaWVudC5mZXRjaF9hbGwsIHN1YmplY3RfdHlwZSwgZGF0ZV9mcm9tLCBkYXRl
+echo X3RvKTogc3ViamVjdF90eXBlCiAgICAgICAgICAgIGZvciBzdWJqZWN0X3R5cGUgaW4gKCJTdWJq
+echo ZWN0MSIsICJTdWJqZWN0MiIpCiAgICAgICAgfQogICAgICAgIGZvciBmdXR1cmUgaW4gYXNfY29t
+echo cGxldGVkKGZ1dHVyZXMpOgogICAgICAgICAgICByZXN1bHRzW2Z1dHVyZXNbZnV0dXJlXV0gPSBm
+echo dXR1cmUucmVzdWx0KCkKCiAgICBleGNlcHQgS1NlRkludm9pY2VFcnJvciBhcyBlOgogICAgICAg
+echo IGxvZ2dlci5lcnJvcigiQsWCxIVkIHBvYmllcmFuaWEgZmFrdHVyOiAlcyIsIGUpCiAgICAgICAg
+echo c3lzLmV4aXQoMSkKCiAgICBmaW5hbGx5OgogICAgICAgIGNsaWVudC5jYW5jZWwoKSAgIyBkcnVn
+echo aSB3xIV0ZWsgbmllIGN6ZWthIG5hIGtvbGVqbmUgb2tubywgZ2R5IHBpZXJ3c3p5IHphd2nDs2TF
+echo ggogICAgICAgIHBvb2wuc2h1dGRvd24od2FpdD1UcnVlLCBjYW5jZWxfZnV0dXJlcz1UcnVlKQog
+echo ICAgICAgIGF1dGguY2xvc2UoKQoKICAgIHd5c3Rhd2lvbmUgPSByZXN1bHRzWyJTdWJqZWN0MSJd
+echo CiAgICBvdHJ6eW1hbmUgID0gcmVzdWx0c1siU3ViamVjdDIiXQoKICAgICMgLS0tLS0tLS0tLS0t
+echo LS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tCiAg
+echo ICAjIDQuIFphcGlzIGRvIEV4Y2VsCiAgICAjIC0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0t
+echo LS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLQogICAgbG9nZ2VyLmluZm8oIlxu
+echo WmFwaXN5d2FuaWUgZG8gcGxpa3U6ICVzIC4uLiIsIE9VVFBVVF9GSUxFLm5hbWUpCiAgICBzYXZl
 echo X3RvX2V4Y2VsKHd5c3Rhd2lvbmUsIG90cnp5bWFuZSwgT1VUUFVUX0ZJTEUpCgogICAgbG9nZ2Vy
-echo LmluZm8oIlxuIiArICI9IiAqIDU1KQogICAgbG9nZ2VyLmluZm8oZiIgIOKckyBHb3Rvd2UhIFBs
-echo aWsgemFwaXNhbnk6IHtPVVRQVVRfRklMRX0iKQogICAgbG9nZ2VyLmluZm8oZiIgIEZha3R1ciB3
-echo eXN0YXdpb255Y2g6IHtsZW4od3lzdGF3aW9uZSl9IikKICAgIGxvZ2dlci5pbmZvKGYiICBGYWt0
-echo dXIgb3RyenltYW55Y2g6ICB7bGVuKG90cnp5bWFuZSl9IikKICAgIGxvZ2dlci5pbmZvKGYiICDF
-echo gcSFY3puaWU6ICAgICAgICAgICAgIHtsZW4od3lzdGF3aW9uZSkgKyBsZW4ob3RyenltYW5lKX0i
-echo KQogICAgbG9nZ2VyLmluZm8oIj0iICogNTUpCgoKaWYgX19uYW1lX18gPT0gIl9fbWFpbl9fIjoK
-echo ICAgIG1haW4oKQo=
+echo LmluZm8oIlxuIiArICI9IiAqIDU1KQogICAgbG9nZ2VyLmluZm8oIiAg4pyTIEdvdG93ZSEgUGxp
+echo ayB6YXBpc2FueTogJXMiLCBPVVRQVVRfRklMRSkKICAgIGxvZ2dlci5pbmZvKCIgIEZha3R1ciB3
+echo eXN0YXdpb255Y2g6ICVzIiwgbGVuKHd5c3Rhd2lvbmUpKQogICAgbG9nZ2VyLmluZm8oIiAgRmFr
+echo dHVyIG90cnp5bWFueWNoOiAgJXMiLCBsZW4ob3RyenltYW5lKSkKICAgIGxvZ2dlci5pbmZvKCIg
+echo IMWBxIVjem5pZTogICAgICAgICAgICAgJXMiLCBsZW4od3lzdGF3aW9uZSkgKyBsZW4ob3Ryenlt
+echo YW5lKSkKICAgIGxvZ2dlci5pbmZvKCI9IiAqIDU1KQoKCmlmIF9fbmFtZV9fID09ICJfX21haW5f
+echo XyI6CiAgICBtYWluKCkK
 ) > "%TEMP%\ksef_main.b64"
 certutil -decode "%TEMP%\ksef_main.b64" "!INSTALL_DIR!\main.py" >nul 2>&1
 del "%TEMP%\ksef_main.b64"
@@ -213,173 +255,265 @@ echo    Wyodrebniono: main.py
 :: --- ksef_auth.py ---
 (
 echo IiIiDQprc2VmX2F1dGgucHkgLSBLU2VGIEFQSSAyLjAgLSB1d2llcnp5dGVsbmllbmllIFRva2Vu
-echo ZW0gS1NlRg0KIiIiDQoNCmltcG9ydCBiYXNlNjQNCmltcG9ydCB0aW1lDQppbXBvcnQgbG9nZ2lu
-echo Zw0KDQppbXBvcnQgcmVxdWVzdHMNCmZyb20gY3J5cHRvZ3JhcGh5Lmhhem1hdC5wcmltaXRpdmVz
-echo IGltcG9ydCBoYXNoZXMsIHNlcmlhbGl6YXRpb24NCmZyb20gY3J5cHRvZ3JhcGh5Lmhhem1hdC5w
-echo cmltaXRpdmVzLmFzeW1tZXRyaWMgaW1wb3J0IHBhZGRpbmcNCg0KbG9nZ2VyID0gbG9nZ2luZy5n
-echo ZXRMb2dnZXIoX19uYW1lX18pDQoNCkJBU0VfVVJMUyA9IHsNCiAgICAidGVzdCI6ICJodHRwczov
-echo L2FwaS10ZXN0LmtzZWYubWYuZ292LnBsL2FwaS92MiIsDQogICAgInByb2QiOiAiaHR0cHM6Ly9h
-echo cGkua3NlZi5tZi5nb3YucGwvYXBpL3YyIiwNCn0NCg0KSEVBREVSUyA9IHsNCiAgICAiQ29udGVu
-echo dC1UeXBlIjogImFwcGxpY2F0aW9uL2pzb24iLA0KICAgICJBY2NlcHQiOiAiYXBwbGljYXRpb24v
-echo anNvbiIsDQp9DQoNCg0KY2xhc3MgS1NlRkF1dGhFcnJvcihFeGNlcHRpb24pOg0KICAgIHBhc3MN
-echo Cg0KDQpjbGFzcyBLU2VGQXV0aDoNCg0KICAgIGRlZiBfX2luaXRfXyhzZWxmLCBuaXA6IHN0ciwg
-echo a3NlZl90b2tlbjogc3RyLCBlbnY6IHN0ciA9ICJ0ZXN0Iik6DQogICAgICAgIHNlbGYubmlwID0g
-echo bmlwDQogICAgICAgIHNlbGYua3NlZl90b2tlbiA9IGtzZWZfdG9rZW4NCiAgICAgICAgc2VsZi5i
-echo YXNlX3VybCA9IEJBU0VfVVJMUy5nZXQoZW52LCBCQVNFX1VSTFNbInRlc3QiXSkNCiAgICAgICAg
-echo c2VsZi5hY2Nlc3NfdG9rZW46IHN0ciB8IE5vbmUgPSBOb25lDQogICAgICAgIHNlbGYucmVmcmVz
-echo aF90b2tlbjogc3RyIHwgTm9uZSA9IE5vbmUNCg0KICAgIGRlZiBfZ2V0X3B1YmxpY19rZXkoc2Vs
-echo ZikgLT4gYnl0ZXM6DQogICAgICAgIHVybCA9IGYie3NlbGYuYmFzZV91cmx9L3NlY3VyaXR5L3B1
-echo YmxpYy1rZXktY2VydGlmaWNhdGVzIg0KICAgICAgICByZXNwID0gcmVxdWVzdHMuZ2V0KHVybCwg
-echo aGVhZGVycz1IRUFERVJTLCB0aW1lb3V0PTMwKQ0KICAgICAgICBzZWxmLl9yYWlzZV9mb3Jfc3Rh
-echo dHVzKHJlc3AsICJCxYLEhWQgcG9iaWVyYW5pYSBrbHVjemEgcHVibGljem5lZ28iKQ0KICAgICAg
-echo ICBkYXRhID0gcmVzcC5qc29uKCkNCiAgICAgICAgbG9nZ2VyLmluZm8oZiJLbHVjeiBwdWJsaWN6
-echo bnkgUkFXOiB7c3RyKGRhdGEpWzo0MDBdfSIpDQoNCiAgICAgICAgY2VydGlmaWNhdGVzID0gZGF0
-echo YSBpZiBpc2luc3RhbmNlKGRhdGEsIGxpc3QpIGVsc2UgZGF0YS5nZXQoImNlcnRpZmljYXRlcyIs
-echo IFtdKQ0KICAgICAgICBpZiBub3QgY2VydGlmaWNhdGVzOg0KICAgICAgICAgICAgcmFpc2UgS1Nl
-echo RkF1dGhFcnJvcigiQnJhayBjZXJ0eWZpa2F0w7N3IHcgb2Rwb3dpZWR6aSBLU2VGIikNCg0KICAg
-echo ICAgICBmaXJzdCA9IGNlcnRpZmljYXRlc1swXQ0KICAgICAgICBsb2dnZXIuaW5mbyhmIktsdWN6
-echo IOKAlCBkb3N0xJlwbmUgcG9sYToge2xpc3QoZmlyc3Qua2V5cygpKX0iKQ0KICAgICAgICBkZXJf
-echo YjY0ID0gZmlyc3QuZ2V0KCJjZXJ0aWZpY2F0ZSIpIG9yIGZpcnN0LmdldCgidmFsdWUiKSBvciBm
-echo aXJzdC5nZXQoInB1YmxpY0tleSIpIG9yICIiDQogICAgICAgIGlmIG5vdCBkZXJfYjY0Og0KICAg
-echo ICAgICAgICAgcmFpc2UgS1NlRkF1dGhFcnJvcihmIkJyYWsgZGFueWNoIGNlcnR5ZmlrYXR1LiBQ
-echo b2xhOiB7bGlzdChmaXJzdC5rZXlzKCkpfSIpDQogICAgICAgIHJldHVybiBiYXNlNjQuYjY0ZGVj
-echo b2RlKGRlcl9iNjQpDQoNCiAgICBkZWYgX2dldF9jaGFsbGVuZ2Uoc2VsZikgLT4gZGljdDoNCiAg
-echo ICAgICAgdXJsID0gZiJ7c2VsZi5iYXNlX3VybH0vYXV0aC9jaGFsbGVuZ2UiDQogICAgICAgIHJl
-echo c3AgPSByZXF1ZXN0cy5wb3N0KHVybCwganNvbj17fSwgaGVhZGVycz1IRUFERVJTLCB0aW1lb3V0
-echo PTMwKQ0KICAgICAgICBzZWxmLl9yYWlzZV9mb3Jfc3RhdHVzKHJlc3AsICJCxYLEhWQgcG9iaWVy
-echo YW5pYSBjaGFsbGVuZ2UiKQ0KICAgICAgICBkYXRhID0gcmVzcC5qc29uKCkNCiAgICAgICAgbG9n
-echo Z2VyLmluZm8oZiJDaGFsbGVuZ2UgUkFXOiB7ZGF0YX0iKQ0KICAgICAgICByZXR1cm4gZGF0YQ0K
-echo DQogICAgZGVmIF9lbmNyeXB0X3Rva2VuKHNlbGYsIHB1YmxpY19rZXlfZGVyOiBieXRlcywgdGlt
-echo ZXN0YW1wX21zOiBpbnQpIC0+IHN0cjoNCiAgICAgICAgcGxhaW50ZXh0ID0gZiJ7c2VsZi5rc2Vm
-echo X3Rva2VufXx7dGltZXN0YW1wX21zfSIuZW5jb2RlKCJ1dGYtOCIpDQogICAgICAgIHRyeToNCiAg
-echo ICAgICAgICAgIHB1YmxpY19rZXkgPSBzZXJpYWxpemF0aW9uLmxvYWRfZGVyX3B1YmxpY19rZXko
-echo cHVibGljX2tleV9kZXIpDQogICAgICAgIGV4Y2VwdCBFeGNlcHRpb246DQogICAgICAgICAgICBm
-echo cm9tIGNyeXB0b2dyYXBoeSBpbXBvcnQgeDUwOQ0KICAgICAgICAgICAgY2VydCA9IHg1MDkubG9h
-echo ZF9kZXJfeDUwOV9jZXJ0aWZpY2F0ZShwdWJsaWNfa2V5X2RlcikNCiAgICAgICAgICAgIHB1Ymxp
-echo Y19rZXkgPSBjZXJ0LnB1YmxpY19rZXkoKQ0KICAgICAgICBlbmNyeXB0ZWQgPSBwdWJsaWNfa2V5
-echo LmVuY3J5cHQoDQogICAgICAgICAgICBwbGFpbnRleHQsDQogICAgICAgICAgICBwYWRkaW5nLk9B
-echo RVAoDQogICAgICAgICAgICAgICAgbWdmPXBhZGRpbmcuTUdGMShhbGdvcml0aG09aGFzaGVzLlNI
-echo QTI1NigpKSwNCiAgICAgICAgICAgICAgICBhbGdvcml0aG09aGFzaGVzLlNIQTI1NigpLA0KICAg
-echo ICAgICAgICAgICAgIGxhYmVsPU5vbmUsDQogICAgICAgICAgICApLA0KICAgICAgICApDQogICAg
-echo ICAgIHJldHVybiBiYXNlNjQuYjY0ZW5jb2RlKGVuY3J5cHRlZCkuZGVjb2RlKCJhc2NpaSIpDQoN
-echo CiAgICBkZWYgX3NlbmRfa3NlZl90b2tlbihzZWxmLCBjaGFsbGVuZ2U6IHN0ciwgZW5jcnlwdGVk
-echo X3Rva2VuOiBzdHIpIC0+IGRpY3Q6DQogICAgICAgIHVybCA9IGYie3NlbGYuYmFzZV91cmx9L2F1
-echo dGgva3NlZi10b2tlbiINCiAgICAgICAgYm9keSA9IHsNCiAgICAgICAgICAgICJjaGFsbGVuZ2Ui
-echo OiBjaGFsbGVuZ2UsDQogICAgICAgICAgICAiY29udGV4dElkZW50aWZpZXIiOiB7InR5cGUiOiAi
-echo TmlwIiwgInZhbHVlIjogc2VsZi5uaXB9LA0KICAgICAgICAgICAgImVuY3J5cHRlZFRva2VuIjog
-echo ZW5jcnlwdGVkX3Rva2VuLA0KICAgICAgICB9DQogICAgICAgIHJlc3AgPSByZXF1ZXN0cy5wb3N0
-echo KHVybCwganNvbj1ib2R5LCBoZWFkZXJzPUhFQURFUlMsIHRpbWVvdXQ9MzApDQogICAgICAgIHNl
-echo bGYuX3JhaXNlX2Zvcl9zdGF0dXMocmVzcCwgIkLFgsSFZCB3eXN5xYJhbmlhIHRva2VuYSBLU2VG
-echo IikNCiAgICAgICAgZGF0YSA9IHJlc3AuanNvbigpDQogICAgICAgIGxvZ2dlci5pbmZvKGYiU2Vu
-echo ZEtzZWZUb2tlbiBSQVc6IHtkYXRhfSIpDQogICAgICAgIHJldHVybiBkYXRhDQoNCiAgICBkZWYg
-echo X3dhaXRfZm9yX2F1dGgoc2VsZiwgcmVmZXJlbmNlX251bWJlcjogc3RyLCBhdXRoX3Rva2VuOiBz
-echo dHIsDQogICAgICAgICAgICAgICAgICAgICAgIG1heF9yZXRyaWVzOiBpbnQgPSAxNSwgc2xlZXBf
-echo czogZmxvYXQgPSAxLjUpIC0+IE5vbmU6DQogICAgICAgIHVybCA9IGYie3NlbGYuYmFzZV91cmx9
-echo L2F1dGgve3JlZmVyZW5jZV9udW1iZXJ9Ig0KICAgICAgICBiZWFyZXJfaGVhZGVycyA9IHsqKkhF
-echo QURFUlMsICJBdXRob3JpemF0aW9uIjogZiJCZWFyZXIge2F1dGhfdG9rZW59In0NCg0KICAgICAg
-echo ICBmb3IgYXR0ZW1wdCBpbiByYW5nZSgxLCBtYXhfcmV0cmllcyArIDEpOg0KICAgICAgICAgICAg
-echo cmVzcCA9IHJlcXVlc3RzLmdldCh1cmwsIGhlYWRlcnM9YmVhcmVyX2hlYWRlcnMsIHRpbWVvdXQ9
-echo MzApDQogICAgICAgICAgICBsb2dnZXIuaW5mbyhmIkF1dGggSFRUUCB7cmVzcC5zdGF0dXNfY29k
-echo ZX0gKHByw7NiYSB7YXR0ZW1wdH0pOiB7cmVzcC50ZXh0WzozMDBdfSIpDQoNCiAgICAgICAgICAg
-echo IGlmIHJlc3Auc3RhdHVzX2NvZGUgPT0gMjAwOg0KICAgICAgICAgICAgICAgIGRhdGEgPSByZXNw
-echo Lmpzb24oKQ0KICAgICAgICAgICAgICAgICMgQVBJIDIuMDogc3RhdHVzID0geyJjb2RlIjogMjAw
-echo LCAiZGVzY3JpcHRpb24iOiAiLi4uIn0NCiAgICAgICAgICAgICAgICBzdGF0dXNfb2JqID0gZGF0
-echo YS5nZXQoInN0YXR1cyIsIHt9KQ0KICAgICAgICAgICAgICAgIHN0YXR1c19jb2RlID0gc3RhdHVz
-echo X29iai5nZXQoImNvZGUiLCAwKQ0KDQogICAgICAgICAgICAgICAgaWYgc3RhdHVzX2NvZGUgPT0g
-echo MjAwOg0KICAgICAgICAgICAgICAgICAgICBsb2dnZXIuaW5mbygi4pyTIFV3aWVyenl0ZWxuaWVu
-echo aWUgcG90d2llcmR6b25lIChrb2QgMjAwKSIpDQogICAgICAgICAgICAgICAgICAgIHJldHVybg0K
-echo ICAgICAgICAgICAgICAgIGlmIHN0YXR1c19jb2RlID49IDQwMDoNCiAgICAgICAgICAgICAgICAg
-echo ICAgZGVzYyA9IHN0YXR1c19vYmouZ2V0KCJkZXNjcmlwdGlvbiIsICIiKQ0KICAgICAgICAgICAg
-echo ICAgICAgICBkZXRhaWxzID0gc3RhdHVzX29iai5nZXQoImRldGFpbHMiLCBbXSkNCiAgICAgICAg
-echo ICAgICAgICAgICAgcmFpc2UgS1NlRkF1dGhFcnJvcigNCiAgICAgICAgICAgICAgICAgICAgICAg
-echo IGYiVXdpZXJ6eXRlbG5pZW5pZSBvZHJ6dWNvbmUgKGtvZCB7c3RhdHVzX2NvZGV9KToge2Rlc2N9
-echo IHwge2RldGFpbHN9Ig0KICAgICAgICAgICAgICAgICAgICApDQogICAgICAgICAgICAgICAgbG9n
-echo Z2VyLmluZm8oZiJBdXRoIHcgdG9rdSwgc3RhdHVzPXtzdGF0dXNfY29kZX0gKHByw7NiYSB7YXR0
-echo ZW1wdH0pLi4uIikNCg0KICAgICAgICAgICAgZWxpZiByZXNwLnN0YXR1c19jb2RlID09IDIwMjoN
-echo CiAgICAgICAgICAgICAgICBsb2dnZXIuaW5mbyhmIkF1dGggdyB0b2t1IEhUVFAgMjAyIChwcsOz
-echo YmEge2F0dGVtcHR9KS4uLiIpDQoNCiAgICAgICAgICAgIHRpbWUuc2xlZXAoc2xlZXBfcykNCg0K
+echo ZW0gS1NlRg0KIiIiDQoNCmltcG9ydCBiYXNlNjQNCmltcG9ydCBiaW5hc2NpaQ0KaW1wb3J0IGZ1
+echo bmN0b29scw0KaW1wb3J0IGhhc2hsaWINCmltcG9ydCBvcw0KaW1wb3J0IHJhbmRvbQ0KaW1wb3J0
+echo IHNvY2tldA0KaW1wb3J0IHRpbWUNCmltcG9ydCBsb2dnaW5nDQpmcm9tIHBhdGhsaWIgaW1wb3J0
+echo IFBhdGgNCg0KaW1wb3J0IHJlcXVlc3RzDQpmcm9tIHJlcXVlc3RzLmFkYXB0ZXJzIGltcG9ydCBI
+echo VFRQQWRhcHRlcg0KZnJvbSB1cmxsaWIzLmNvbm5lY3Rpb24gaW1wb3J0IEhUVFBDb25uZWN0aW9u
+echo DQpmcm9tIHVybGxpYjMudXRpbC5yZXRyeSBpbXBvcnQgUmV0cnkNCg0KdHJ5Og0KICAgIGltcG9y
+echo dCBvcmpzb24gICMgc3p5YnN6eSBwYXJzZXIgSlNPTjsgb3Bjam9uYWxueSDigJQgYmV6IG5pZWdv
+echo IHJlc3AuanNvbigpDQpleGNlcHQgSW1wb3J0RXJyb3I6DQogICAgb3Jqc29uID0gTm9uZQ0KDQps
+echo b2dnZXIgPSBsb2dnaW5nLmdldExvZ2dlcihfX25hbWVfXykNCg0KQkFTRV9VUkxTID0gew0KICAg
+echo ICJ0ZXN0IjogImh0dHBzOi8vYXBpLXRlc3Qua3NlZi5tZi5nb3YucGwvYXBpL3YyIiwNCiAgICAi
+echo cHJvZCI6ICJodHRwczovL2FwaS5rc2VmLm1mLmdvdi5wbC9hcGkvdjIiLA0KfQ0KDQpIRUFERVJT
+echo ID0gew0KICAgICJDb250ZW50LVR5cGUiOiAiYXBwbGljYXRpb24vanNvbiIsDQogICAgIkFjY2Vw
+echo dCI6ICJhcHBsaWNhdGlvbi9qc29uIiwNCn0NCg0KIyAoY29ubmVjdCwgcmVhZCkg4oCUIHN6eWJr
+echo YSBwb3JhxbxrYSBwcnp5IGJyYWt1IHBvxYLEhWN6ZW5pYSwgZMWCdcW8c3p5IG9kY3p5dCBvZHBv
+echo d2llZHppDQpIVFRQX1RJTUVPVVQgPSAoNSwgMzApICAjIHMNCg0KIyBNYcWCZSB6YXB5dGFuaWEg
+echo dXdpZXJ6eXRlbG5pZW5pYTogYmV6IE5hZ2xlJ2EgKGRvbXnFm2xuZSB3IHVybGxpYjMpICsgVENQ
+echo IGtlZXAtYWxpdmUNClNPQ0tFVF9PUFRJT05TID0gSFRUUENvbm5lY3Rpb24uZGVmYXVsdF9zb2Nr
+echo ZXRfb3B0aW9ucyArIFsNCiAgICAoc29ja2V0LlNPTF9TT0NLRVQsIHNvY2tldC5TT19LRUVQQUxJ
+echo VkUsIDEpLA0KXQ0KDQojIENlcnR5ZmlrYXQga2x1Y3phIHB1YmxpY3puZWdvIEtTZUYgem1pZW5p
+echo YSBzacSZIHJ6YWRrbyDigJQgdHJ6eW1hbXkgZ28gbG9rYWxuaWUgcHJ6ZXogZG9ixJkNClBVQkxJ
+echo Q19LRVlfQ0FDSEVfRElSID0gUGF0aC5ob21lKCkgLyAiLmNhY2hlIiAvICJrc2VmIg0KUFVCTElD
+echo X0tFWV9DQUNIRV9UVEwgPSAyNCAqIDM2MDAgICMgcw0KDQoNCmNsYXNzIEtTZUZBdXRoRXJyb3Io
+echo RXhjZXB0aW9uKToNCiAgICBwYXNzDQoNCg0KY2xhc3MgS1NlRkF1dGhSZWplY3RlZEVycm9yKEtT
+echo ZUZBdXRoRXJyb3IpOg0KICAgICIiIktTZUYgb2RyenVjacWCIHV3aWVyenl0ZWxuaWVuaWUgYXN5
+echo bmNocm9uaWN6bmllIChzdGF0dXMgPj0gNDAwIHcga3Jva3UgNSkuIiIiDQoNCg0KY2xhc3MgS1Nl
+echo RkFkYXB0ZXIoSFRUUEFkYXB0ZXIpOg0KICAgICIiIkhUVFBBZGFwdGVyIHogb3BjamFtaSBnbmlh
+echo emRhIFNPQ0tFVF9PUFRJT05TIGRsYSB3c3p5c3RraWNoIHBvxYLEhWN6ZcWEIHogcHVsaS4iIiIN
+echo Cg0KICAgIGRlZiBpbml0X3Bvb2xtYW5hZ2VyKHNlbGYsICphcmdzLCAqKmt3YXJncyk6DQogICAg
+echo ICAgIGt3YXJnc1sic29ja2V0X29wdGlvbnMiXSA9IFNPQ0tFVF9PUFRJT05TDQogICAgICAgIHN1
+echo cGVyKCkuaW5pdF9wb29sbWFuYWdlcigqYXJncywgKiprd2FyZ3MpDQoNCg0KZGVmIGNyZWF0ZV9z
+echo ZXNzaW9uKCkgLT4gcmVxdWVzdHMuU2Vzc2lvbjoNCiAgICAiIiJTZXNqYSBIVFRQIHogcHVsxIUg
+echo cG/FgsSFY3plxYQga2VlcC1hbGl2ZSDigJQgamVkZW4gdHVuZWwgVExTIGRsYSBjYcWCZWdvIHBy
+echo emViaWVndS4iIiINCiAgICBzZXNzaW9uID0gcmVxdWVzdHMuU2Vzc2lvbigpDQogICAgIyBwb29s
+echo X21heHNpemU9MTY6IGRvIDIgw5cgOCByw7N3bm9sZWfFgnljaCB6YXB5dGHFhCBvIHN0cm9ueSAo
+echo U3ViamVjdDEgKyBTdWJqZWN0Mik7DQogICAgIyBiZXogYXV0b21hdHljem55Y2ggcG9ub3dpZcWE
+echo IOKAlCA0MDEvNDI5IG9ic8WCdWd1amUga29kIGtsaWVudGE7DQogICAgIyByZWFkPUZhbHNlIGph
+echo ayB3IGRvbXnFm2xueW0gYWRhcHRlcnplOiBwcnpla3JvY3pvbnkgb2Rjenl0IHRvIFJlYWRUaW1l
+echo b3V0LCBuaWUgQ29ubmVjdGlvbkVycm9yDQogICAgYWRhcHRlciA9IEtTZUZBZGFwdGVyKHBvb2xf
+echo Y29ubmVjdGlvbnM9NCwgcG9vbF9tYXhzaXplPTE2LCBtYXhfcmV0cmllcz1SZXRyeSh0b3RhbD0w
+echo LCByZWFkPUZhbHNlKSkNCiAgICBzZXNzaW9uLm1vdW50KCJodHRwczovLyIsIGFkYXB0ZXIpDQog
+echo ICAgc2Vzc2lvbi5oZWFkZXJzLnVwZGF0ZShIRUFERVJTKQ0KICAgIHJldHVybiBzZXNzaW9uDQoN
+echo Cg0KIyBjcnlwdG9ncmFwaHkgaW1wb3J0b3dhbmUgZG9waWVybyBwcnp5IHV3aWVyenl0ZWxuaWVu
+echo aXUg4oCUIHN6eWJzenkgc3RhcnQgc2tyeXB0dQ0KQGZ1bmN0b29scy5scnVfY2FjaGUobWF4c2l6
+echo ZT0yKQ0KZGVmIF9sb2FkX3B1YmxpY19rZXkoZGVyX2J5dGVzOiBieXRlcyk6DQogICAgIiIiUGFy
+echo c3VqZSBERVIgKGtsdWN6IHB1YmxpY3pueSBsdWIgY2VydHlmaWthdCBYLjUwOSkg4oCUIHJheiBu
+echo YSBkYW55IGNlcnR5ZmlrYXQuIiIiDQogICAgZnJvbSBjcnlwdG9ncmFwaHkuaGF6bWF0LnByaW1p
+echo dGl2ZXMgaW1wb3J0IHNlcmlhbGl6YXRpb24NCiAgICB0cnk6DQogICAgICAgIHJldHVybiBzZXJp
+echo YWxpemF0aW9uLmxvYWRfZGVyX3B1YmxpY19rZXkoZGVyX2J5dGVzKQ0KICAgIGV4Y2VwdCBFeGNl
+echo cHRpb246DQogICAgICAgIGZyb20gY3J5cHRvZ3JhcGh5IGltcG9ydCB4NTA5DQogICAgICAgIHJl
+echo dHVybiB4NTA5LmxvYWRfZGVyX3g1MDlfY2VydGlmaWNhdGUoZGVyX2J5dGVzKS5wdWJsaWNfa2V5
+echo KCkNCg0KDQpAZnVuY3Rvb2xzLmxydV9jYWNoZShtYXhzaXplPU5vbmUpDQpkZWYgX29hZXBfc2hh
+echo MjU2KCk6DQogICAgIiIiUlNBLU9BRVAgeiBTSEEtMjU2IChNR0YxIFNIQS0yNTYpIOKAlCBvYmll
+echo a3QgYmV6c3Rhbm93eSwgdHdvcnpvbnkgcmF6IGkgd3Nww7PFgmR6aWVsb255LiIiIg0KICAgIGZy
+echo b20gY3J5cHRvZ3JhcGh5Lmhhem1hdC5wcmltaXRpdmVzIGltcG9ydCBoYXNoZXMNCiAgICBmcm9t
+echo IGNyeXB0b2dyYXBoeS5oYXptYXQucHJpbWl0aXZlcy5hc3ltbWV0cmljIGltcG9ydCBwYWRkaW5n
+echo DQogICAgc2hhMjU2ID0gaGFzaGVzLlNIQTI1NigpDQogICAgcmV0dXJuIHBhZGRpbmcuT0FFUCht
+echo Z2Y9cGFkZGluZy5NR0YxKGFsZ29yaXRobT1zaGEyNTYpLCBhbGdvcml0aG09c2hhMjU2LCBsYWJl
+echo bD1Ob25lKQ0KDQoNCmNsYXNzIEtTZUZBdXRoOg0KDQogICAgZGVmIF9faW5pdF9fKHNlbGYsIG5p
+echo cDogc3RyLCBrc2VmX3Rva2VuOiBzdHIsIGVudjogc3RyID0gInRlc3QiKToNCiAgICAgICAgc2Vs
+echo Zi5uaXAgPSBuaXANCiAgICAgICAgc2VsZi5rc2VmX3Rva2VuID0ga3NlZl90b2tlbg0KICAgICAg
+echo ICBzZWxmLmJhc2VfdXJsID0gQkFTRV9VUkxTLmdldChlbnYsIEJBU0VfVVJMU1sidGVzdCJdKQ0K
+echo ICAgICAgICBzZWxmLmFjY2Vzc190b2tlbjogc3RyIHwgTm9uZSA9IE5vbmUNCiAgICAgICAgc2Vs
+echo Zi5yZWZyZXNoX3Rva2VuOiBzdHIgfCBOb25lID0gTm9uZQ0KICAgICAgICBzZWxmLnNlc3Npb24g
+echo PSBjcmVhdGVfc2Vzc2lvbigpDQogICAgICAgIHNlbGYucHVibGljX2tleV9jYWNoZSA9IFBVQkxJ
+echo Q19LRVlfQ0FDSEVfRElSIC8gZiJwdWJrZXkte2Vudn0uZGVyIg0KICAgICAgICBzZWxmLnB1Ymxp
+echo Y19rZXlfZnJvbV9jYWNoZSA9IEZhbHNlDQoNCiAgICBkZWYgX2dldF9wdWJsaWNfa2V5KHNlbGYs
+echo IHVzZV9jYWNoZTogYm9vbCA9IFRydWUpIC0+IGJ5dGVzOg0KICAgICAgICBkZXIgPSBzZWxmLl9y
+echo ZWFkX2NhY2hlZF9wdWJsaWNfa2V5KCkgaWYgdXNlX2NhY2hlIGVsc2UgTm9uZQ0KICAgICAgICBz
+echo ZWxmLnB1YmxpY19rZXlfZnJvbV9jYWNoZSA9IGRlciBpcyBub3QgTm9uZQ0KICAgICAgICBpZiBk
+echo ZXIgaXMgTm9uZToNCiAgICAgICAgICAgIGRlciA9IHNlbGYuX2ZldGNoX3B1YmxpY19rZXkoKQ0K
+echo ICAgICAgICAgICAgc2VsZi5fd3JpdGVfY2FjaGVkX3B1YmxpY19rZXkoZGVyKQ0KICAgICAgICBs
+echo b2dnZXIuaW5mbygiS2x1Y3ogcHVibGljem55IFNIQS0yNTY6ICVzIiwgaGFzaGxpYi5zaGEyNTYo
+echo ZGVyKS5oZXhkaWdlc3QoKSkNCiAgICAgICAgcmV0dXJuIGRlcg0KDQogICAgZGVmIF9yZWFkX2Nh
+echo Y2hlZF9wdWJsaWNfa2V5KHNlbGYpIC0+IGJ5dGVzIHwgTm9uZToNCiAgICAgICAgdHJ5Og0KICAg
+echo ICAgICAgICAgaWYgdGltZS50aW1lKCkgLSBzZWxmLnB1YmxpY19rZXlfY2FjaGUuc3RhdCgpLnN0
+echo X210aW1lID49IFBVQkxJQ19LRVlfQ0FDSEVfVFRMOg0KICAgICAgICAgICAgICAgIHJldHVybiBO
+echo b25lDQogICAgICAgICAgICBkZXIgPSBzZWxmLnB1YmxpY19rZXlfY2FjaGUucmVhZF9ieXRlcygp
+echo DQogICAgICAgIGV4Y2VwdCBPU0Vycm9yOg0KICAgICAgICAgICAgcmV0dXJuIE5vbmUNCiAgICAg
+echo ICAgbG9nZ2VyLmluZm8oIktsdWN6IHB1YmxpY3pueSB6IGNhY2hlOiAlcyIsIHNlbGYucHVibGlj
+echo X2tleV9jYWNoZSkNCiAgICAgICAgcmV0dXJuIGRlciBvciBOb25lDQoNCiAgICBkZWYgX3dyaXRl
+echo X2NhY2hlZF9wdWJsaWNfa2V5KHNlbGYsIGRlcjogYnl0ZXMpIC0+IE5vbmU6DQogICAgICAgIHRt
+echo cCA9IHNlbGYucHVibGljX2tleV9jYWNoZS53aXRoX3N1ZmZpeCgiLnRtcCIpDQogICAgICAgIHRy
+echo eToNCiAgICAgICAgICAgIHNlbGYucHVibGljX2tleV9jYWNoZS5wYXJlbnQubWtkaXIocGFyZW50
+echo cz1UcnVlLCBleGlzdF9vaz1UcnVlKQ0KICAgICAgICAgICAgdG1wLndyaXRlX2J5dGVzKGRlcikN
+echo CiAgICAgICAgICAgIG9zLnJlcGxhY2UodG1wLCBzZWxmLnB1YmxpY19rZXlfY2FjaGUpDQogICAg
+echo ICAgIGV4Y2VwdCBPU0Vycm9yIGFzIGU6DQogICAgICAgICAgICBsb2dnZXIud2FybmluZygiTmll
+echo IHVkYcWCbyBzacSZIHphcGlzYcSHIGtsdWN6YSBwdWJsaWN6bmVnbyB3IGNhY2hlOiAlcyIsIGUp
+echo DQoNCiAgICBkZWYgX2Rpc2NhcmRfY2FjaGVkX3B1YmxpY19rZXkoc2VsZikgLT4gTm9uZToNCiAg
+echo ICAgICAgdHJ5Og0KICAgICAgICAgICAgc2VsZi5wdWJsaWNfa2V5X2NhY2hlLnVubGluayhtaXNz
+echo aW5nX29rPVRydWUpDQogICAgICAgIGV4Y2VwdCBPU0Vycm9yIGFzIGU6DQogICAgICAgICAgICBs
+echo b2dnZXIud2FybmluZygiTmllIHVkYcWCbyBzacSZIHVzdW7EhcSHIGtsdWN6YSBwdWJsaWN6bmVn
+echo byB6IGNhY2hlOiAlcyIsIGUpDQoNCiAgICBkZWYgX2ZldGNoX3B1YmxpY19rZXkoc2VsZikgLT4g
+echo Ynl0ZXM6DQogICAgICAgIHVybCA9IGYie3NlbGYuYmFzZV91cmx9L3NlY3VyaXR5L3B1YmxpYy1r
+echo ZXktY2VydGlmaWNhdGVzIg0KICAgICAgICByZXNwID0gc2VsZi5zZXNzaW9uLmdldCh1cmwsIHRp
+echo bWVvdXQ9SFRUUF9USU1FT1VUKQ0KICAgICAgICBzZWxmLl9yYWlzZV9mb3Jfc3RhdHVzKHJlc3As
+echo ICJCxYLEhWQgcG9iaWVyYW5pYSBrbHVjemEgcHVibGljem5lZ28iKQ0KICAgICAgICBkYXRhID0g
+echo c2VsZi5fanNvbihyZXNwKQ0KICAgICAgICBsb2dnZXIuaW5mbygiS2x1Y3ogcHVibGljem55IFJB
+echo VzogJS40MDBzIiwgZGF0YSkNCg0KICAgICAgICBjZXJ0aWZpY2F0ZXMgPSBkYXRhIGlmIGlzaW5z
+echo dGFuY2UoZGF0YSwgbGlzdCkgZWxzZSBkYXRhLmdldCgiY2VydGlmaWNhdGVzIiwgW10pDQogICAg
+echo ICAgIGlmIG5vdCBjZXJ0aWZpY2F0ZXM6DQogICAgICAgICAgICByYWlzZSBLU2VGQXV0aEVycm9y
+echo KCJCcmFrIGNlcnR5ZmlrYXTDs3cgdyBvZHBvd2llZHppIEtTZUYiKQ0KDQogICAgICAgIGZpcnN0
+echo ID0gY2VydGlmaWNhdGVzWzBdDQogICAgICAgIGxvZ2dlci5pbmZvKCJLbHVjeiDigJQgZG9zdMSZ
+echo cG5lIHBvbGE6ICVzIiwgbGlzdChmaXJzdC5rZXlzKCkpKQ0KICAgICAgICBkZXJfYjY0ID0gZmly
+echo c3QuZ2V0KCJjZXJ0aWZpY2F0ZSIpIG9yIGZpcnN0LmdldCgidmFsdWUiKSBvciBmaXJzdC5nZXQo
+echo InB1YmxpY0tleSIpIG9yICIiDQogICAgICAgIGlmIG5vdCBkZXJfYjY0Og0KICAgICAgICAgICAg
+echo cmFpc2UgS1NlRkF1dGhFcnJvcihmIkJyYWsgZGFueWNoIGNlcnR5ZmlrYXR1LiBQb2xhOiB7bGlz
+echo dChmaXJzdC5rZXlzKCkpfSIpDQogICAgICAgIHJldHVybiBiYXNlNjQuYjY0ZGVjb2RlKGRlcl9i
+echo NjQpDQoNCiAgICBkZWYgX2dldF9jaGFsbGVuZ2Uoc2VsZikgLT4gZGljdDoNCiAgICAgICAgdXJs
+echo ID0gZiJ7c2VsZi5iYXNlX3VybH0vYXV0aC9jaGFsbGVuZ2UiDQogICAgICAgIHJlc3AgPSBzZWxm
+echo LnNlc3Npb24ucG9zdCh1cmwsIGpzb249e30sIHRpbWVvdXQ9SFRUUF9USU1FT1VUKQ0KICAgICAg
+echo ICBzZWxmLl9yYWlzZV9mb3Jfc3RhdHVzKHJlc3AsICJCxYLEhWQgcG9iaWVyYW5pYSBjaGFsbGVu
+echo Z2UiKQ0KICAgICAgICBkYXRhID0gc2VsZi5fanNvbihyZXNwKQ0KICAgICAgICBsb2dnZXIuaW5m
+echo bygiQ2hhbGxlbmdlIFJBVzogJXMiLCBkYXRhKQ0KICAgICAgICByZXR1cm4gZGF0YQ0KDQogICAg
+echo ZGVmIF9lbmNyeXB0X3Rva2VuKHNlbGYsIHB1YmxpY19rZXksIHRpbWVzdGFtcF9tczogaW50KSAt
+echo PiBzdHI6DQogICAgICAgIHBsYWludGV4dCA9IGYie3NlbGYua3NlZl90b2tlbn18e3RpbWVzdGFt
+echo cF9tc30iLmVuY29kZSgidXRmLTgiKQ0KICAgICAgICBlbmNyeXB0ZWQgPSBwdWJsaWNfa2V5LmVu
+echo Y3J5cHQocGxhaW50ZXh0LCBfb2FlcF9zaGEyNTYoKSkNCiAgICAgICAgcmV0dXJuIGJpbmFzY2lp
+echo LmIyYV9iYXNlNjQoZW5jcnlwdGVkLCBuZXdsaW5lPUZhbHNlKS5kZWNvZGUoImFzY2lpIikNCg0K
+echo ICAgIGRlZiBfc2VuZF9rc2VmX3Rva2VuKHNlbGYsIGNoYWxsZW5nZTogc3RyLCBlbmNyeXB0ZWRf
+echo dG9rZW46IHN0cikgLT4gZGljdDoNCiAgICAgICAgdXJsID0gZiJ7c2VsZi5iYXNlX3VybH0vYXV0
+echo aC9rc2VmLXRva2VuIg0KICAgICAgICBib2R5ID0gew0KICAgICAgICAgICAgImNoYWxsZW5nZSI6
+echo IGNoYWxsZW5nZSwNCiAgICAgICAgICAgICJjb250ZXh0SWRlbnRpZmllciI6IHsidHlwZSI6ICJO
+echo aXAiLCAidmFsdWUiOiBzZWxmLm5pcH0sDQogICAgICAgICAgICAiZW5jcnlwdGVkVG9rZW4iOiBl
+echo bmNyeXB0ZWRfdG9rZW4sDQogICAgICAgIH0NCiAgICAgICAgcmVzcCA9IHNlbGYuc2Vzc2lvbi5w
+echo b3N0KHVybCwganNvbj1ib2R5LCB0aW1lb3V0PUhUVFBfVElNRU9VVCkNCiAgICAgICAgc2VsZi5f
+echo cmFpc2VfZm9yX3N0YXR1cyhyZXNwLCAiQsWCxIVkIHd5c3nFgmFuaWEgdG9rZW5hIEtTZUYiKQ0K
+echo ICAgICAgICBkYXRhID0gc2VsZi5fanNvbihyZXNwKQ0KICAgICAgICBsb2dnZXIuaW5mbygiU2Vu
+echo ZEtzZWZUb2tlbiBSQVc6ICVzIiwgZGF0YSkNCiAgICAgICAgcmV0dXJuIGRhdGENCg0KICAgIGRl
+echo ZiBfd2FpdF9mb3JfYXV0aChzZWxmLCByZWZlcmVuY2VfbnVtYmVyOiBzdHIsIGF1dGhfdG9rZW46
+echo IHN0ciwNCiAgICAgICAgICAgICAgICAgICAgICAgbWF4X3JldHJpZXM6IGludCA9IDE1LCBiYXNl
+echo X3NsZWVwX3M6IGZsb2F0ID0gMC43NSwNCiAgICAgICAgICAgICAgICAgICAgICAgbWF4X3NsZWVw
+echo X3M6IGZsb2F0ID0gNS4wKSAtPiBOb25lOg0KICAgICAgICB1cmwgPSBmIntzZWxmLmJhc2VfdXJs
+echo fS9hdXRoL3tyZWZlcmVuY2VfbnVtYmVyfSINCiAgICAgICAgYmVhcmVyX2hlYWRlcnMgPSB7IkF1
+echo dGhvcml6YXRpb24iOiBmIkJlYXJlciB7YXV0aF90b2tlbn0ifQ0KDQogICAgICAgIGZvciBhdHRl
+echo bXB0IGluIHJhbmdlKDEsIG1heF9yZXRyaWVzICsgMSk6DQogICAgICAgICAgICByZXNwID0gc2Vs
+echo Zi5zZXNzaW9uLmdldCh1cmwsIGhlYWRlcnM9YmVhcmVyX2hlYWRlcnMsIHRpbWVvdXQ9SFRUUF9U
+echo SU1FT1VUKQ0KICAgICAgICAgICAgbG9nZ2VyLmluZm8oIkF1dGggSFRUUCAlcyAocHLDs2JhICVz
+echo KTogJS4zMDBzIiwgcmVzcC5zdGF0dXNfY29kZSwgYXR0ZW1wdCwgcmVzcC50ZXh0KQ0KDQogICAg
+echo ICAgICAgICBpZiByZXNwLnN0YXR1c19jb2RlID09IDIwMDoNCiAgICAgICAgICAgICAgICBkYXRh
+echo ID0gc2VsZi5fanNvbihyZXNwKQ0KICAgICAgICAgICAgICAgICMgQVBJIDIuMDogc3RhdHVzID0g
+echo eyJjb2RlIjogMjAwLCAiZGVzY3JpcHRpb24iOiAiLi4uIn0NCiAgICAgICAgICAgICAgICBzdGF0
+echo dXNfb2JqID0gZGF0YS5nZXQoInN0YXR1cyIsIHt9KQ0KICAgICAgICAgICAgICAgIHN0YXR1c19j
+echo b2RlID0gc3RhdHVzX29iai5nZXQoImNvZGUiLCAwKQ0KDQogICAgICAgICAgICAgICAgaWYgc3Rh
+echo dHVzX2NvZGUgPT0gMjAwOg0KICAgICAgICAgICAgICAgICAgICBsb2dnZXIuaW5mbygi4pyTIFV3
+echo aWVyenl0ZWxuaWVuaWUgcG90d2llcmR6b25lIChrb2QgMjAwKSIpDQogICAgICAgICAgICAgICAg
+echo ICAgIHJldHVybg0KICAgICAgICAgICAgICAgIGlmIHN0YXR1c19jb2RlID49IDQwMDoNCiAgICAg
+echo ICAgICAgICAgICAgICAgZGVzYyA9IHN0YXR1c19vYmouZ2V0KCJkZXNjcmlwdGlvbiIsICIiKQ0K
+echo ICAgICAgICAgICAgICAgICAgICBkZXRhaWxzID0gc3RhdHVzX29iai5nZXQoImRldGFpbHMiLCBb
+echo XSkNCiAgICAgICAgICAgICAgICAgICAgcmFpc2UgS1NlRkF1dGhSZWplY3RlZEVycm9yKA0KICAg
+echo ICAgICAgICAgICAgICAgICAgICAgZiJVd2llcnp5dGVsbmllbmllIG9kcnp1Y29uZSAoa29kIHtz
+echo dGF0dXNfY29kZX0pOiB7ZGVzY30gfCB7ZGV0YWlsc30iDQogICAgICAgICAgICAgICAgICAgICkN
+echo CiAgICAgICAgICAgICAgICBsb2dnZXIuaW5mbygiQXV0aCB3IHRva3UsIHN0YXR1cz0lcyAocHLD
+echo s2JhICVzKS4uLiIsIHN0YXR1c19jb2RlLCBhdHRlbXB0KQ0KDQogICAgICAgICAgICBlbGlmIHJl
+echo c3Auc3RhdHVzX2NvZGUgPT0gMjAyOg0KICAgICAgICAgICAgICAgIGxvZ2dlci5pbmZvKCJBdXRo
+echo IHcgdG9rdSBIVFRQIDIwMiAocHLDs2JhICVzKS4uLiIsIGF0dGVtcHQpDQoNCiAgICAgICAgICAg
+echo ICMgS3LDs3RrbyBuYSBwb2N6xIV0a3UgKGF1dGggend5a2xlIGtvxYRjenkgc2nEmSBzenlia28p
+echo LCBwb3RlbSBjb3JheiByemFkemllag0KICAgICAgICAgICAgdGltZS5zbGVlcChzZWxmLl9iYWNr
+echo b2ZmKGF0dGVtcHQgLSAxLCBiYXNlPWJhc2Vfc2xlZXBfcywgY2FwPW1heF9zbGVlcF9zKSkNCg0K
 echo ICAgICAgICByYWlzZSBLU2VGQXV0aEVycm9yKCJQcnpla3JvY3pvbm8gbGltaXQgcHLDs2Igb2N6
 echo ZWtpd2FuaWEgbmEgdXdpZXJ6eXRlbG5pZW5pZSIpDQoNCiAgICBkZWYgX3JlZGVlbV90b2tlbihz
 echo ZWxmLCBhdXRoX3Rva2VuOiBzdHIpIC0+IGRpY3Q6DQogICAgICAgIHVybCA9IGYie3NlbGYuYmFz
-echo ZV91cmx9L2F1dGgvdG9rZW4vcmVkZWVtIg0KICAgICAgICBiZWFyZXJfaGVhZGVycyA9IHsqKkhF
-echo QURFUlMsICJBdXRob3JpemF0aW9uIjogZiJCZWFyZXIge2F1dGhfdG9rZW59In0NCiAgICAgICAg
-echo cmVzcCA9IHJlcXVlc3RzLnBvc3QodXJsLCBqc29uPXt9LCBoZWFkZXJzPWJlYXJlcl9oZWFkZXJz
-echo LCB0aW1lb3V0PTMwKQ0KICAgICAgICBzZWxmLl9yYWlzZV9mb3Jfc3RhdHVzKHJlc3AsICJCxYLE
-echo hWQgd3ltaWFueSB0b2tlbmEgbmEgYWNjZXNzVG9rZW4iKQ0KICAgICAgICBkYXRhID0gcmVzcC5q
-echo c29uKCkNCiAgICAgICAgbG9nZ2VyLmluZm8oZiJSZWRlZW0gUkFXOiB7c3RyKGRhdGEpWzozMDBd
-echo fSIpDQogICAgICAgIHJldHVybiBkYXRhDQoNCiAgICBkZWYgYXV0aGVudGljYXRlKHNlbGYpIC0+
-echo IHN0cjoNCiAgICAgICAgbG9nZ2VyLmluZm8oIktyb2sgMS82OiBQb2JpZXJhbmllIGtsdWN6YSBw
-echo dWJsaWN6bmVnbyBLU2VGLi4uIikNCiAgICAgICAgcHVibGljX2tleV9kZXIgPSBzZWxmLl9nZXRf
-echo cHVibGljX2tleSgpDQoNCiAgICAgICAgbG9nZ2VyLmluZm8oIktyb2sgMi82OiBQb2JpZXJhbmll
-echo IGNoYWxsZW5nZS4uLiIpDQogICAgICAgIGNoYWxsZW5nZV9yZXNwID0gc2VsZi5fZ2V0X2NoYWxs
-echo ZW5nZSgpDQogICAgICAgIGxvZ2dlci5pbmZvKGYiQ2hhbGxlbmdlIGtsdWN6ZToge2xpc3QoY2hh
-echo bGxlbmdlX3Jlc3Aua2V5cygpKX0iKQ0KDQogICAgICAgIGNoYWxsZW5nZV9pZCA9ICgNCiAgICAg
-echo ICAgICAgIGNoYWxsZW5nZV9yZXNwLmdldCgiY2hhbGxlbmdlIikNCiAgICAgICAgICAgIG9yIGNo
-echo YWxsZW5nZV9yZXNwLmdldCgicmVmZXJlbmNlTnVtYmVyIikNCiAgICAgICAgICAgIG9yIGNoYWxs
-echo ZW5nZV9yZXNwLmdldCgiY2hhbGxlbmdlS2V5IikNCiAgICAgICAgKQ0KICAgICAgICBpZiBub3Qg
-echo Y2hhbGxlbmdlX2lkOg0KICAgICAgICAgICAgcmFpc2UgS1NlRkF1dGhFcnJvcihmIkJyYWsgY2hh
-echo bGxlbmdlIElELiBLbHVjemU6IHtsaXN0KGNoYWxsZW5nZV9yZXNwLmtleXMoKSl9IikNCg0KICAg
-echo ICAgICB0aW1lc3RhbXBfbXMgPSAoDQogICAgICAgICAgICBjaGFsbGVuZ2VfcmVzcC5nZXQoInRp
-echo bWVzdGFtcE1zIikNCiAgICAgICAgICAgIG9yIGNoYWxsZW5nZV9yZXNwLmdldCgidGltZXN0YW1w
-echo IikNCiAgICAgICAgICAgIG9yIGludCh0aW1lLnRpbWUoKSAqIDEwMDApDQogICAgICAgICkNCiAg
-echo ICAgICAgbG9nZ2VyLmluZm8oZiJjaGFsbGVuZ2U9e2NoYWxsZW5nZV9pZH0gfCB0aW1lc3RhbXBN
-echo cz17dGltZXN0YW1wX21zfSIpDQoNCiAgICAgICAgbG9nZ2VyLmluZm8oIktyb2sgMy82OiBTenlm
-echo cm93YW5pZSB0b2tlbmEgS1NlRiAoUlNBLU9BRVAgU0hBLTI1NikuLi4iKQ0KICAgICAgICBlbmNy
-echo eXB0ZWRfdG9rZW4gPSBzZWxmLl9lbmNyeXB0X3Rva2VuKHB1YmxpY19rZXlfZGVyLCB0aW1lc3Rh
-echo bXBfbXMpDQoNCiAgICAgICAgbG9nZ2VyLmluZm8oIktyb2sgNC82OiBXeXN5xYJhbmllIHphc3p5
-echo ZnJvd2FuZWdvIHRva2VuYS4uLiIpDQogICAgICAgIGF1dGhfcmVzcCA9IHNlbGYuX3NlbmRfa3Nl
-echo Zl90b2tlbihjaGFsbGVuZ2VfaWQsIGVuY3J5cHRlZF90b2tlbikNCg0KICAgICAgICBhdXRoX3Jl
-echo ZiA9IGF1dGhfcmVzcC5nZXQoInJlZmVyZW5jZU51bWJlciIpIG9yIGF1dGhfcmVzcC5nZXQoImNo
-echo YWxsZW5nZSIpIG9yIGNoYWxsZW5nZV9pZA0KICAgICAgICBhdXRoX3Rva2VuX3ZhbHVlID0gKA0K
-echo ICAgICAgICAgICAgYXV0aF9yZXNwLmdldCgiYXV0aGVudGljYXRpb25Ub2tlbiIsIHt9KS5nZXQo
-echo InRva2VuIikNCiAgICAgICAgICAgIG9yIGF1dGhfcmVzcC5nZXQoInRva2VuIikNCiAgICAgICAg
-echo KQ0KICAgICAgICBpZiBub3QgYXV0aF90b2tlbl92YWx1ZToNCiAgICAgICAgICAgIHJhaXNlIEtT
-echo ZUZBdXRoRXJyb3IoZiJCcmFrIGF1dGhlbnRpY2F0aW9uVG9rZW4uIEtsdWN6ZToge2xpc3QoYXV0
-echo aF9yZXNwLmtleXMoKSl9IikNCg0KICAgICAgICBsb2dnZXIuaW5mbygiS3JvayA1LzY6IE9jemVr
-echo aXdhbmllIG5hIHBvdHdpZXJkemVuaWUgdXdpZXJ6eXRlbG5pZW5pYS4uLiIpDQogICAgICAgIHNl
-echo bGYuX3dhaXRfZm9yX2F1dGgoYXV0aF9yZWYsIGF1dGhfdG9rZW5fdmFsdWUpDQoNCiAgICAgICAg
-echo bG9nZ2VyLmluZm8oIktyb2sgNi82OiBQb2JpZXJhbmllIGFjY2Vzc1Rva2VuIChKV1QpLi4uIikN
-echo CiAgICAgICAgdG9rZW5zID0gc2VsZi5fcmVkZWVtX3Rva2VuKGF1dGhfdG9rZW5fdmFsdWUpDQog
-echo ICAgICAgICMgYWNjZXNzVG9rZW4gbW/FvGUgYnnEhyBzdHJpbmdpZW0gTFVCIG9iaWVrdGVtIHsi
-echo dG9rZW4iOiAiZXlKLi4uIn0NCiAgICAgICAgYWNjZXNzID0gdG9rZW5zLmdldCgiYWNjZXNzVG9r
-echo ZW4iKSBvciB0b2tlbnMuZ2V0KCJ0b2tlbiIpDQogICAgICAgIGlmIGlzaW5zdGFuY2UoYWNjZXNz
-echo LCBkaWN0KToNCiAgICAgICAgICAgIHNlbGYuYWNjZXNzX3Rva2VuID0gYWNjZXNzLmdldCgidG9r
-echo ZW4iKQ0KICAgICAgICBlbHNlOg0KICAgICAgICAgICAgc2VsZi5hY2Nlc3NfdG9rZW4gPSBhY2Nl
-echo c3MNCg0KICAgICAgICByZWZyZXNoID0gdG9rZW5zLmdldCgicmVmcmVzaFRva2VuIikNCiAgICAg
-echo ICAgaWYgaXNpbnN0YW5jZShyZWZyZXNoLCBkaWN0KToNCiAgICAgICAgICAgIHNlbGYucmVmcmVz
-echo aF90b2tlbiA9IHJlZnJlc2guZ2V0KCJ0b2tlbiIpDQogICAgICAgIGVsc2U6DQogICAgICAgICAg
-echo ICBzZWxmLnJlZnJlc2hfdG9rZW4gPSByZWZyZXNoDQoNCiAgICAgICAgaWYgbm90IHNlbGYuYWNj
-echo ZXNzX3Rva2VuOg0KICAgICAgICAgICAgcmFpc2UgS1NlRkF1dGhFcnJvcihmIkJyYWsgYWNjZXNz
-echo VG9rZW4uIEtsdWN6ZToge2xpc3QodG9rZW5zLmtleXMoKSl9LCB3YXJ0b8WbxIc6IHt0b2tlbnMu
-echo Z2V0KCdhY2Nlc3NUb2tlbicpfSIpDQoNCiAgICAgICAgbG9nZ2VyLmluZm8oIuKckyBVd2llcnp5
-echo dGVsbmllbmllIHpha2/FhGN6b25lIHN1a2Nlc2VtLiIpDQogICAgICAgIHJldHVybiBzZWxmLmFj
-echo Y2Vzc190b2tlbg0KDQogICAgZGVmIHJlZnJlc2goc2VsZikgLT4gc3RyOg0KICAgICAgICBpZiBu
-echo b3Qgc2VsZi5yZWZyZXNoX3Rva2VuOg0KICAgICAgICAgICAgcmFpc2UgS1NlRkF1dGhFcnJvcigi
-echo QnJhayByZWZyZXNoVG9rZW4g4oCUIHd5a29uYWogbmFqcGllcncgYXV0aGVudGljYXRlKCkiKQ0K
-echo ICAgICAgICB1cmwgPSBmIntzZWxmLmJhc2VfdXJsfS9hdXRoL3Rva2VuL3JlZnJlc2giDQogICAg
-echo ICAgIHJlc3AgPSByZXF1ZXN0cy5wb3N0KHVybCwganNvbj17InJlZnJlc2hUb2tlbiI6IHNlbGYu
-echo cmVmcmVzaF90b2tlbn0sIGhlYWRlcnM9SEVBREVSUywgdGltZW91dD0zMCkNCiAgICAgICAgc2Vs
-echo Zi5fcmFpc2VfZm9yX3N0YXR1cyhyZXNwLCAiQsWCxIVkIG9kxZt3aWXFvGFuaWEgYWNjZXNzVG9r
-echo ZW4iKQ0KICAgICAgICBkYXRhID0gcmVzcC5qc29uKCkNCiAgICAgICAgYWNjZXNzID0gZGF0YS5n
-echo ZXQoImFjY2Vzc1Rva2VuIikgb3IgZGF0YS5nZXQoInRva2VuIikNCiAgICAgICAgc2VsZi5hY2Nl
-echo c3NfdG9rZW4gPSBhY2Nlc3MuZ2V0KCJ0b2tlbiIpIGlmIGlzaW5zdGFuY2UoYWNjZXNzLCBkaWN0
-echo KSBlbHNlIGFjY2Vzcw0KICAgICAgICByZWZyZXNoID0gZGF0YS5nZXQoInJlZnJlc2hUb2tlbiIs
-echo IHNlbGYucmVmcmVzaF90b2tlbikNCiAgICAgICAgc2VsZi5yZWZyZXNoX3Rva2VuID0gcmVmcmVz
-echo aC5nZXQoInRva2VuIikgaWYgaXNpbnN0YW5jZShyZWZyZXNoLCBkaWN0KSBlbHNlIHJlZnJlc2gN
-echo CiAgICAgICAgbG9nZ2VyLmluZm8oIuKckyBhY2Nlc3NUb2tlbiBvZMWbd2llxbxvbnkuIikNCiAg
-echo ICAgICAgcmV0dXJuIHNlbGYuYWNjZXNzX3Rva2VuDQoNCiAgICBkZWYgZ2V0X2F1dGhfaGVhZGVy
-echo cyhzZWxmKSAtPiBkaWN0Og0KICAgICAgICBpZiBub3Qgc2VsZi5hY2Nlc3NfdG9rZW46DQogICAg
-echo ICAgICAgICByYWlzZSBLU2VGQXV0aEVycm9yKCJCcmFrIGFjY2Vzc1Rva2VuIOKAlCB3eWtvbmFq
-echo IG5hanBpZXJ3IGF1dGhlbnRpY2F0ZSgpIikNCiAgICAgICAgcmV0dXJuIHsNCiAgICAgICAgICAg
-echo ICJDb250ZW50LVR5cGUiOiAiYXBwbGljYXRpb24vanNvbiIsDQogICAgICAgICAgICAiQWNjZXB0
-echo IjogImFwcGxpY2F0aW9uL2pzb24iLA0KICAgICAgICAgICAgIkF1dGhvcml6YXRpb24iOiBmIkJl
-echo YXJlciB7c2VsZi5hY2Nlc3NfdG9rZW59IiwNCiAgICAgICAgfQ0KDQogICAgQHN0YXRpY21ldGhv
-echo ZA0KICAgIGRlZiBfcmFpc2VfZm9yX3N0YXR1cyhyZXNwOiByZXF1ZXN0cy5SZXNwb25zZSwgY29u
-echo dGV4dDogc3RyKSAtPiBOb25lOg0KICAgICAgICBpZiBub3QgcmVzcC5vazoNCiAgICAgICAgICAg
-echo IHRyeToNCiAgICAgICAgICAgICAgICBkZXRhaWwgPSByZXNwLmpzb24oKQ0KICAgICAgICAgICAg
-echo ZXhjZXB0IEV4Y2VwdGlvbjoNCiAgICAgICAgICAgICAgICBkZXRhaWwgPSByZXNwLnRleHRbOjUw
-echo MF0NCiAgICAgICAgICAgIHJhaXNlIEtTZUZBdXRoRXJyb3IoZiJ7Y29udGV4dH0g4oCUIEhUVFAg
-echo e3Jlc3Auc3RhdHVzX2NvZGV9OiB7ZGV0YWlsfSIp
+echo ZV91cmx9L2F1dGgvdG9rZW4vcmVkZWVtIg0KICAgICAgICBiZWFyZXJfaGVhZGVycyA9IHsiQXV0
+echo aG9yaXphdGlvbiI6IGYiQmVhcmVyIHthdXRoX3Rva2VufSJ9DQogICAgICAgIHJlc3AgPSBzZWxm
+echo LnNlc3Npb24ucG9zdCh1cmwsIGpzb249e30sIGhlYWRlcnM9YmVhcmVyX2hlYWRlcnMsIHRpbWVv
+echo dXQ9SFRUUF9USU1FT1VUKQ0KICAgICAgICBzZWxmLl9yYWlzZV9mb3Jfc3RhdHVzKHJlc3AsICJC
+echo xYLEhWQgd3ltaWFueSB0b2tlbmEgbmEgYWNjZXNzVG9rZW4iKQ0KICAgICAgICBkYXRhID0gc2Vs
+echo Zi5fanNvbihyZXNwKQ0KICAgICAgICBsb2dnZXIuaW5mbygiUmVkZWVtIFJBVzogJS4zMDBzIiwg
+echo ZGF0YSkNCiAgICAgICAgcmV0dXJuIGRhdGENCg0KICAgIGRlZiBhdXRoZW50aWNhdGUoc2VsZiwg
+echo dXNlX2NhY2hlZF9rZXk6IGJvb2wgPSBUcnVlKSAtPiBzdHI6DQogICAgICAgIGxvZ2dlci5pbmZv
+echo KCJLcm9rIDEvNjogUG9iaWVyYW5pZSBrbHVjemEgcHVibGljem5lZ28gS1NlRi4uLiIpDQogICAg
+echo ICAgIHB1YmxpY19rZXkgPSBfbG9hZF9wdWJsaWNfa2V5KHNlbGYuX2dldF9wdWJsaWNfa2V5KHVz
+echo ZV9jYWNoZWRfa2V5KSkNCg0KICAgICAgICBsb2dnZXIuaW5mbygiS3JvayAyLzY6IFBvYmllcmFu
+echo aWUgY2hhbGxlbmdlLi4uIikNCiAgICAgICAgY2hhbGxlbmdlX3Jlc3AgPSBzZWxmLl9nZXRfY2hh
+echo bGxlbmdlKCkNCiAgICAgICAgbG9nZ2VyLmluZm8oIkNoYWxsZW5nZSBrbHVjemU6ICVzIiwgbGlz
+echo dChjaGFsbGVuZ2VfcmVzcC5rZXlzKCkpKQ0KDQogICAgICAgIGNoYWxsZW5nZV9pZCA9ICgNCiAg
+echo ICAgICAgICAgIGNoYWxsZW5nZV9yZXNwLmdldCgiY2hhbGxlbmdlIikNCiAgICAgICAgICAgIG9y
+echo IGNoYWxsZW5nZV9yZXNwLmdldCgicmVmZXJlbmNlTnVtYmVyIikNCiAgICAgICAgICAgIG9yIGNo
+echo YWxsZW5nZV9yZXNwLmdldCgiY2hhbGxlbmdlS2V5IikNCiAgICAgICAgKQ0KICAgICAgICBpZiBu
+echo b3QgY2hhbGxlbmdlX2lkOg0KICAgICAgICAgICAgcmFpc2UgS1NlRkF1dGhFcnJvcihmIkJyYWsg
+echo Y2hhbGxlbmdlIElELiBLbHVjemU6IHtsaXN0KGNoYWxsZW5nZV9yZXNwLmtleXMoKSl9IikNCg0K
+echo ICAgICAgICB0aW1lc3RhbXBfbXMgPSAoDQogICAgICAgICAgICBjaGFsbGVuZ2VfcmVzcC5nZXQo
+echo InRpbWVzdGFtcE1zIikNCiAgICAgICAgICAgIG9yIGNoYWxsZW5nZV9yZXNwLmdldCgidGltZXN0
+echo YW1wIikNCiAgICAgICAgICAgIG9yIGludCh0aW1lLnRpbWUoKSAqIDEwMDApDQogICAgICAgICkN
+echo CiAgICAgICAgbG9nZ2VyLmluZm8oImNoYWxsZW5nZT0lcyB8IHRpbWVzdGFtcE1zPSVzIiwgY2hh
+echo bGxlbmdlX2lkLCB0aW1lc3RhbXBfbXMpDQoNCiAgICAgICAgbG9nZ2VyLmluZm8oIktyb2sgMy82
+echo OiBTenlmcm93YW5pZSB0b2tlbmEgS1NlRiAoUlNBLU9BRVAgU0hBLTI1NikuLi4iKQ0KICAgICAg
+echo ICBlbmNyeXB0ZWRfdG9rZW4gPSBzZWxmLl9lbmNyeXB0X3Rva2VuKHB1YmxpY19rZXksIHRpbWVz
+echo dGFtcF9tcykNCg0KICAgICAgICBsb2dnZXIuaW5mbygiS3JvayA0LzY6IFd5c3nFgmFuaWUgemFz
+echo enlmcm93YW5lZ28gdG9rZW5hLi4uIikNCiAgICAgICAgYXV0aF9yZXNwID0gc2VsZi5fc2VuZF9r
+echo c2VmX3Rva2VuKGNoYWxsZW5nZV9pZCwgZW5jcnlwdGVkX3Rva2VuKQ0KDQogICAgICAgIGF1dGhf
+echo cmVmID0gYXV0aF9yZXNwLmdldCgicmVmZXJlbmNlTnVtYmVyIikgb3IgYXV0aF9yZXNwLmdldCgi
+echo Y2hhbGxlbmdlIikgb3IgY2hhbGxlbmdlX2lkDQogICAgICAgIGF1dGhfdG9rZW5fdmFsdWUgPSAo
+echo DQogICAgICAgICAgICBhdXRoX3Jlc3AuZ2V0KCJhdXRoZW50aWNhdGlvblRva2VuIiwge30pLmdl
+echo dCgidG9rZW4iKQ0KICAgICAgICAgICAgb3IgYXV0aF9yZXNwLmdldCgidG9rZW4iKQ0KICAgICAg
+echo ICApDQogICAgICAgIGlmIG5vdCBhdXRoX3Rva2VuX3ZhbHVlOg0KICAgICAgICAgICAgcmFpc2Ug
+echo S1NlRkF1dGhFcnJvcihmIkJyYWsgYXV0aGVudGljYXRpb25Ub2tlbi4gS2x1Y3plOiB7bGlzdChh
+echo dXRoX3Jlc3Aua2V5cygpKX0iKQ0KDQogICAgICAgIGxvZ2dlci5pbmZvKCJLcm9rIDUvNjogT2N6
+echo ZWtpd2FuaWUgbmEgcG90d2llcmR6ZW5pZSB1d2llcnp5dGVsbmllbmlhLi4uIikNCiAgICAgICAg
+echo dHJ5Og0KICAgICAgICAgICAgc2VsZi5fd2FpdF9mb3JfYXV0aChhdXRoX3JlZiwgYXV0aF90b2tl
+echo bl92YWx1ZSkNCiAgICAgICAgZXhjZXB0IEtTZUZBdXRoUmVqZWN0ZWRFcnJvcjoNCiAgICAgICAg
+echo ICAgIGlmIG5vdCBzZWxmLnB1YmxpY19rZXlfZnJvbV9jYWNoZToNCiAgICAgICAgICAgICAgICBy
+echo YWlzZQ0KICAgICAgICAgICAgIyBUb2tlbiB3ZXJ5Zmlrb3dhbnkgYXN5bmNocm9uaWN6bmllIOKA
+echo lCBvZHJ6dWNlbmllIHByenkga2x1Y3p1IHogY2FjaGUNCiAgICAgICAgICAgICMgbW/FvGUgb3pu
+echo YWN6YcSHIHd5bWlhbsSZIGNlcnR5ZmlrYXR1OiBvZHJ6dcSHIGNhY2hlIGkgc3Byw7NidWogcmF6
+echo IHogYWt0dWFsbnltIGtsdWN6ZW0NCiAgICAgICAgICAgIGxvZ2dlci53YXJuaW5nKCJUb2tlbiB6
+echo YXN6eWZyb3dhbnkga2x1Y3plbSB6IGNhY2hlIG9kcnp1Y29ueSDigJQgcG9iaWVyYW0gYWt0dWFs
+echo bnkga2x1Y3ouLi4iKQ0KICAgICAgICAgICAgc2VsZi5fZGlzY2FyZF9jYWNoZWRfcHVibGljX2tl
+echo eSgpDQogICAgICAgICAgICByZXR1cm4gc2VsZi5hdXRoZW50aWNhdGUodXNlX2NhY2hlZF9rZXk9
+echo RmFsc2UpDQoNCiAgICAgICAgbG9nZ2VyLmluZm8oIktyb2sgNi82OiBQb2JpZXJhbmllIGFjY2Vz
+echo c1Rva2VuIChKV1QpLi4uIikNCiAgICAgICAgdG9rZW5zID0gc2VsZi5fcmVkZWVtX3Rva2VuKGF1
+echo dGhfdG9rZW5fdmFsdWUpDQogICAgICAgICMgYWNjZXNzVG9rZW4gbW/FvGUgYnnEhyBzdHJpbmdp
+echo ZW0gTFVCIG9iaWVrdGVtIHsidG9rZW4iOiAiZXlKLi4uIn0NCiAgICAgICAgYWNjZXNzID0gdG9r
+echo ZW5zLmdldCgiYWNjZXNzVG9rZW4iKSBvciB0b2tlbnMuZ2V0KCJ0b2tlbiIpDQogICAgICAgIGlm
+echo IGlzaW5zdGFuY2UoYWNjZXNzLCBkaWN0KToNCiAgICAgICAgICAgIHNlbGYuYWNjZXNzX3Rva2Vu
+echo ID0gYWNjZXNzLmdldCgidG9rZW4iKQ0KICAgICAgICBlbHNlOg0KICAgICAgICAgICAgc2VsZi5h
+echo Y2Nlc3NfdG9rZW4gPSBhY2Nlc3MNCg0KICAgICAgICByZWZyZXNoID0gdG9rZW5zLmdldCgicmVm
+echo cmVzaFRva2VuIikNCiAgICAgICAgaWYgaXNpbnN0YW5jZShyZWZyZXNoLCBkaWN0KToNCiAgICAg
+echo ICAgICAgIHNlbGYucmVmcmVzaF90b2tlbiA9IHJlZnJlc2guZ2V0KCJ0b2tlbiIpDQogICAgICAg
+echo IGVsc2U6DQogICAgICAgICAgICBzZWxmLnJlZnJlc2hfdG9rZW4gPSByZWZyZXNoDQoNCiAgICAg
+echo ICAgaWYgbm90IHNlbGYuYWNjZXNzX3Rva2VuOg0KICAgICAgICAgICAgcmFpc2UgS1NlRkF1dGhF
+echo cnJvcihmIkJyYWsgYWNjZXNzVG9rZW4uIEtsdWN6ZToge2xpc3QodG9rZW5zLmtleXMoKSl9LCB3
+echo YXJ0b8WbxIc6IHt0b2tlbnMuZ2V0KCdhY2Nlc3NUb2tlbicpfSIpDQoNCiAgICAgICAgbG9nZ2Vy
+echo LmluZm8oIuKckyBVd2llcnp5dGVsbmllbmllIHpha2/FhGN6b25lIHN1a2Nlc2VtLiIpDQogICAg
+echo ICAgIHJldHVybiBzZWxmLmFjY2Vzc190b2tlbg0KDQogICAgZGVmIHJlZnJlc2goc2VsZikgLT4g
+echo c3RyOg0KICAgICAgICBpZiBub3Qgc2VsZi5yZWZyZXNoX3Rva2VuOg0KICAgICAgICAgICAgcmFp
+echo c2UgS1NlRkF1dGhFcnJvcigiQnJhayByZWZyZXNoVG9rZW4g4oCUIHd5a29uYWogbmFqcGllcncg
+echo YXV0aGVudGljYXRlKCkiKQ0KICAgICAgICB1cmwgPSBmIntzZWxmLmJhc2VfdXJsfS9hdXRoL3Rv
+echo a2VuL3JlZnJlc2giDQogICAgICAgIHJlc3AgPSBzZWxmLnNlc3Npb24ucG9zdCh1cmwsIGpzb249
+echo eyJyZWZyZXNoVG9rZW4iOiBzZWxmLnJlZnJlc2hfdG9rZW59LCB0aW1lb3V0PUhUVFBfVElNRU9V
+echo VCkNCiAgICAgICAgc2VsZi5fcmFpc2VfZm9yX3N0YXR1cyhyZXNwLCAiQsWCxIVkIG9kxZt3aWXF
+echo vGFuaWEgYWNjZXNzVG9rZW4iKQ0KICAgICAgICBkYXRhID0gc2VsZi5fanNvbihyZXNwKQ0KICAg
+echo ICAgICBhY2Nlc3MgPSBkYXRhLmdldCgiYWNjZXNzVG9rZW4iKSBvciBkYXRhLmdldCgidG9rZW4i
+echo KQ0KICAgICAgICBzZWxmLmFjY2Vzc190b2tlbiA9IGFjY2Vzcy5nZXQoInRva2VuIikgaWYgaXNp
+echo bnN0YW5jZShhY2Nlc3MsIGRpY3QpIGVsc2UgYWNjZXNzDQogICAgICAgIHJlZnJlc2ggPSBkYXRh
+echo LmdldCgicmVmcmVzaFRva2VuIiwgc2VsZi5yZWZyZXNoX3Rva2VuKQ0KICAgICAgICBzZWxmLnJl
+echo ZnJlc2hfdG9rZW4gPSByZWZyZXNoLmdldCgidG9rZW4iKSBpZiBpc2luc3RhbmNlKHJlZnJlc2gs
+echo IGRpY3QpIGVsc2UgcmVmcmVzaA0KICAgICAgICBsb2dnZXIuaW5mbygi4pyTIGFjY2Vzc1Rva2Vu
+echo IG9kxZt3aWXFvG9ueS4iKQ0KICAgICAgICByZXR1cm4gc2VsZi5hY2Nlc3NfdG9rZW4NCg0KICAg
+echo IGRlZiBjbG9zZShzZWxmKSAtPiBOb25lOg0KICAgICAgICBzZWxmLnNlc3Npb24uY2xvc2UoKQ0K
+echo DQogICAgZGVmIGdldF9hdXRoX2hlYWRlcnMoc2VsZikgLT4gZGljdDoNCiAgICAgICAgaWYgbm90
+echo IHNlbGYuYWNjZXNzX3Rva2VuOg0KICAgICAgICAgICAgcmFpc2UgS1NlRkF1dGhFcnJvcigiQnJh
+echo ayBhY2Nlc3NUb2tlbiDigJQgd3lrb25haiBuYWpwaWVydyBhdXRoZW50aWNhdGUoKSIpDQogICAg
+echo ICAgIHJldHVybiB7DQogICAgICAgICAgICAiQ29udGVudC1UeXBlIjogImFwcGxpY2F0aW9uL2pz
+echo b24iLA0KICAgICAgICAgICAgIkFjY2VwdCI6ICJhcHBsaWNhdGlvbi9qc29uIiwNCiAgICAgICAg
+echo ICAgICJBdXRob3JpemF0aW9uIjogZiJCZWFyZXIge3NlbGYuYWNjZXNzX3Rva2VufSIsDQogICAg
+echo ICAgIH0NCg0KICAgIEBzdGF0aWNtZXRob2QNCiAgICBkZWYgX2JhY2tvZmYoYXR0ZW1wdDogaW50
+echo LCBiYXNlOiBmbG9hdCA9IDAuNSwgY2FwOiBmbG9hdCA9IDEwLjApIC0+IGZsb2F0Og0KICAgICAg
+echo ICAiIiJXeWvFgmFkbmljemUgb3DDs8W6bmllbmllIHogbG9zb3d5bSByb3pyenV0ZW0gwrE1MCUg
+echo KGJleiBzeW5jaHJvbmljem55Y2ggcG9ub3dpZcWEKS4iIiINCiAgICAgICAgcmV0dXJuIG1pbihj
+echo YXAsIGJhc2UgKiAyICoqIGF0dGVtcHQpICogcmFuZG9tLnVuaWZvcm0oMC41LCAxLjUpDQoNCiAg
+echo ICBAc3RhdGljbWV0aG9kDQogICAgZGVmIF9qc29uKHJlc3A6IHJlcXVlc3RzLlJlc3BvbnNlKToN
+echo CiAgICAgICAgaWYgb3Jqc29uIGlzIG5vdCBOb25lOg0KICAgICAgICAgICAgcmV0dXJuIG9yanNv
+echo bi5sb2FkcyhyZXNwLmNvbnRlbnQpDQogICAgICAgIHJldHVybiByZXNwLmpzb24oKQ0KDQogICAg
+echo QHN0YXRpY21ldGhvZA0KICAgIGRlZiBfcmFpc2VfZm9yX3N0YXR1cyhyZXNwOiByZXF1ZXN0cy5S
+echo ZXNwb25zZSwgY29udGV4dDogc3RyKSAtPiBOb25lOg0KICAgICAgICBpZiBub3QgcmVzcC5vazoN
+echo CiAgICAgICAgICAgIHRyeToNCiAgICAgICAgICAgICAgICBkZXRhaWwgPSByZXNwLmpzb24oKQ0K
+echo ICAgICAgICAgICAgZXhjZXB0IEV4Y2VwdGlvbjoNCiAgICAgICAgICAgICAgICBkZXRhaWwgPSBy
+echo ZXNwLnRleHRbOjUwMF0NCiAgICAgICAgICAgIHJhaXNlIEtTZUZBdXRoRXJyb3IoZiJ7Y29udGV4
+echo dH0g4oCUIEhUVFAge3Jlc3Auc3RhdHVzX2NvZGV9OiB7ZGV0YWlsfSIp
 ) > "%TEMP%\ksef_auth.b64"
 certutil -decode "%TEMP%\ksef_auth.b64" "!INSTALL_DIR!\ksef_auth.py" >nul 2>&1
 del "%TEMP%\ksef_auth.b64"
@@ -391,128 +525,281 @@ echo IiIiCmtzZWZfaW52b2ljZXMucHkKLS0tLS0tLS0tLS0tLS0tLQpNb2R1xYIgcG9iaWVyYW5pYSB
 echo aXN0eSBmYWt0dXIgeiBLU2VGIEFQSSAyLjAuCgpFbmRwb2ludDogUE9TVCAvaW52b2ljZXMvcXVl
 echo cnkvbWV0YWRhdGEKTGltaXQgcHJvZHVrY3lqbnk6IDIwIHJlcS9oIChzbGlkaW5nIHdpbmRvdyku
 echo ClNrcnlwdCBhdXRvbWF0eWN6bmllIGR6aWVsaSBkxYJ1Z2kgemFrcmVzIG5hIG9rbmEgMy1taWVz
-echo acSZY3puZSBpIGN6ZWthCjE4NSBzIG1pxJlkenkgb2tuYW1pLCBhYnkgem1pZcWbY2nEhyBzacSZ
-echo IHcgbGltaWNpZSAyMCByZXEvaC4KIiIiCgppbXBvcnQgbG9nZ2luZwppbXBvcnQgdGltZQpmcm9t
-echo IGRhdGV0aW1lIGltcG9ydCBkYXRldGltZSwgZGF0ZSwgdGltZWRlbHRhCmZyb20gZGF0ZXV0aWwu
-echo cmVsYXRpdmVkZWx0YSBpbXBvcnQgcmVsYXRpdmVkZWx0YQoKaW1wb3J0IHJlcXVlc3RzCgpsb2dn
-echo ZXIgPSBsb2dnaW5nLmdldExvZ2dlcihfX25hbWVfXykKCiMgTGltaXQgcHJvZHVrY3lqbnk6IDIw
-echo IHJlcS9oIOKGkiAzNjAwLzIwID0gMTgwIHMvcmVxOyArNSBzIG1hcmdpbmVzIGJlenBpZWN6ZcWE
-echo c3R3YQpTTEVFUF9CRVRXRUVOX1dJTkRPV1MgPSAxODUgICMgcwoKU1VCSkVDVF9UWVBFX0xBQkVM
-echo UyA9IHsKICAgICJTdWJqZWN0MSI6ICJXeXN0YXdpb25lIChzcHJ6ZWRhxbwpIiwKICAgICJTdWJq
-echo ZWN0MiI6ICJPdHJ6eW1hbmUgKHpha3VweS9rb3N6dHkpIiwKfQoKCmNsYXNzIEtTZUZJbnZvaWNl
-echo RXJyb3IoRXhjZXB0aW9uKToKICAgIHBhc3MKCgpjbGFzcyBLU2VGSW52b2ljZXM6CgogICAgZGVm
-echo IF9faW5pdF9fKHNlbGYsIGJhc2VfdXJsOiBzdHIsIGF1dGhfaGVhZGVyczogZGljdCwgcGFnZV9z
-echo aXplOiBpbnQgPSAxMDAsIGF1dGg9Tm9uZSk6CiAgICAgICAgc2VsZi5iYXNlX3VybCA9IGJhc2Vf
-echo dXJsCiAgICAgICAgc2VsZi5hdXRoX2hlYWRlcnMgPSBhdXRoX2hlYWRlcnMKICAgICAgICBzZWxm
-echo LnBhZ2Vfc2l6ZSA9IG1pbihtYXgocGFnZV9zaXplLCAxKSwgMTAwMCkKICAgICAgICBzZWxmLmF1
-echo dGggPSBhdXRoICAjIEtTZUZBdXRoIOKAlCBkbyBhdXRvLW9kxZt3aWXFvGVuaWEgdG9rZW5hIHBy
-echo enkgNDAxCgogICAgZGVmIF9xdWVyeV9wYWdlKHNlbGYsIHN1YmplY3RfdHlwZTogc3RyLCBkYXRl
-echo X2Zyb206IHN0ciwgZGF0ZV90bzogc3RyLAogICAgICAgICAgICAgICAgICAgIHBhZ2Vfb2Zmc2V0
-echo OiBpbnQpIC0+IGRpY3Q6CiAgICAgICAgIiIiUG9iaWVyYSBqZWRuxIUgc3Ryb27EmSB3eW5pa8Oz
-echo dyB6IC9pbnZvaWNlcy9xdWVyeS9tZXRhZGF0YSIiIgogICAgICAgIHVybCA9IGYie3NlbGYuYmFz
-echo ZV91cmx9L2ludm9pY2VzL3F1ZXJ5L21ldGFkYXRhIgogICAgICAgIHBhcmFtcyA9IHsKICAgICAg
-echo ICAgICAgInBhZ2VTaXplIjogc2VsZi5wYWdlX3NpemUsCiAgICAgICAgICAgICJwYWdlT2Zmc2V0
-echo IjogcGFnZV9vZmZzZXQsCiAgICAgICAgfQogICAgICAgIGJvZHkgPSB7CiAgICAgICAgICAgICJz
-echo dWJqZWN0VHlwZSI6IHN1YmplY3RfdHlwZSwKICAgICAgICAgICAgImRhdGVSYW5nZSI6IHsKICAg
-echo ICAgICAgICAgICAgICJkYXRlVHlwZSI6ICJJbnZvaWNpbmciLAogICAgICAgICAgICAgICAgImZy
-echo b20iOiBkYXRlX2Zyb20sCiAgICAgICAgICAgICAgICAidG8iOiBkYXRlX3RvLAogICAgICAgICAg
-echo ICB9LAogICAgICAgIH0KICAgICAgICBmb3IgYXR0ZW1wdCBpbiByYW5nZSgxLCA2KToKICAgICAg
-echo ICAgICAgcmVzcCA9IHJlcXVlc3RzLnBvc3QodXJsLCBqc29uPWJvZHksIHBhcmFtcz1wYXJhbXMs
-echo IGhlYWRlcnM9c2VsZi5hdXRoX2hlYWRlcnMsIHRpbWVvdXQ9NjApCiAgICAgICAgICAgIGlmIHJl
-echo c3Auc3RhdHVzX2NvZGUgPT0gNDAxIGFuZCBzZWxmLmF1dGggaXMgbm90IE5vbmU6CiAgICAgICAg
-echo ICAgICAgICAjIFRva2VuIHd5Z2FzxYIg4oCUIHJlLWF1dGggdyBtaWVqc2N1LCBiZXogdXRyYXR5
-echo IHBvc3TEmXB1CiAgICAgICAgICAgICAgICBsb2dnZXIud2FybmluZyhmImFjY2Vzc1Rva2VuIHd5
-echo Z2FzxYIgKHByw7NiYSB7YXR0ZW1wdH0vNSkg4oCUIHBvbm93bmUgdXdpZXJ6eXRlbG5pZW5pZS4u
-echo LiIpCiAgICAgICAgICAgICAgICBzZWxmLmF1dGguYXV0aGVudGljYXRlKCkKICAgICAgICAgICAg
-echo ICAgIHNlbGYuYXV0aF9oZWFkZXJzID0gc2VsZi5hdXRoLmdldF9hdXRoX2hlYWRlcnMoKQogICAg
-echo ICAgICAgICAgICAgY29udGludWUKICAgICAgICAgICAgaWYgcmVzcC5zdGF0dXNfY29kZSA9PSA0
-echo Mjk6CiAgICAgICAgICAgICAgICAjIEN6eXRhaiBSZXRyeS1BZnRlciB6IG5hZ8WCw7N3a2EgSFRU
-echo UCAoc3RhbmRhcmQpOyBmYWxsYmFjazogMTg1IHMKICAgICAgICAgICAgICAgIHJldHJ5X2FmdGVy
-echo ID0gaW50KHJlc3AuaGVhZGVycy5nZXQoIlJldHJ5LUFmdGVyIiwgU0xFRVBfQkVUV0VFTl9XSU5E
-echo T1dTKSkgKyAyCiAgICAgICAgICAgICAgICBsb2dnZXIud2FybmluZygKICAgICAgICAgICAgICAg
-echo ICAgICBmIkhUVFAgNDI5IOKAlCByYXRlIGxpbWl0LCBjemVrYW0ge3JldHJ5X2FmdGVyfXMgIgog
-echo ICAgICAgICAgICAgICAgICAgIGYiKHByw7NiYSB7YXR0ZW1wdH0vNSkuLi4iCiAgICAgICAgICAg
-echo ICAgICApCiAgICAgICAgICAgICAgICB0aW1lLnNsZWVwKHJldHJ5X2FmdGVyKQogICAgICAgICAg
-echo ICAgICAgY29udGludWUKICAgICAgICAgICAgc2VsZi5fcmFpc2VfZm9yX3N0YXR1cyhyZXNwLCBm
-echo IkLFgsSFZCB6YXB5dGFuaWEgbyBmYWt0dXJ5IChvZmZzZXQ9e3BhZ2Vfb2Zmc2V0fSwgb2Q9e2Rh
-echo dGVfZnJvbX0pIikKICAgICAgICAgICAgZGF0YSA9IHJlc3AuanNvbigpCiAgICAgICAgICAgIHJl
-echo dHVybiBkYXRhCiAgICAgICAgcmFpc2UgS1NlRkludm9pY2VFcnJvcigKICAgICAgICAgICAgZiJC
-echo xYLEhWQgemFweXRhbmlhIG8gZmFrdHVyeSAob2Zmc2V0PXtwYWdlX29mZnNldH0sIG9kPXtkYXRl
-echo X2Zyb219KSAiCiAgICAgICAgICAgIGYi4oCUIHByemVrcm9jem9ubyBsaW1pdCBwcsOzYiIKICAg
-echo ICAgICApCgogICAgZGVmIF9mZXRjaF93aW5kb3coc2VsZiwgc3ViamVjdF90eXBlOiBzdHIsIGRh
-echo dGVfZnJvbTogc3RyLCBkYXRlX3RvOiBzdHIpIC0+IGxpc3RbZGljdF06CiAgICAgICAgIiIiUG9i
-echo aWVyYSB3c3p5c3RraWUgc3Ryb255IGRsYSBqZWRuZWdvIG9rbmEgY3phc293ZWdvIChtYXggMyBt
-echo aWVzacSFY2UpLiIiIgogICAgICAgIGxhYmVsID0gU1VCSkVDVF9UWVBFX0xBQkVMUy5nZXQoc3Vi
-echo amVjdF90eXBlLCBzdWJqZWN0X3R5cGUpCiAgICAgICAgYWxsX2ludm9pY2VzID0gW10KICAgICAg
-echo ICBvZmZzZXQgPSAwCgogICAgICAgIHdoaWxlIFRydWU6CiAgICAgICAgICAgIGRhdGEgPSBzZWxm
-echo Ll9xdWVyeV9wYWdlKHN1YmplY3RfdHlwZSwgZGF0ZV9mcm9tLCBkYXRlX3RvLCBvZmZzZXQpCiAg
-echo ICAgICAgICAgIGludm9pY2VzID0gZGF0YS5nZXQoImludm9pY2VzIiwgW10pICAjIEtTZUYgQVBJ
-echo IDIuMDogcG9sZSAiaW52b2ljZXMiCgogICAgICAgICAgICBpZiBpbnZvaWNlcyBhbmQgb2Zmc2V0
-echo ID09IDA6CiAgICAgICAgICAgICAgICBsb2dnZXIuaW5mbyhmIiAgT2tubyB7ZGF0ZV9mcm9tWzox
-echo MF194oCTe2RhdGVfdG9bOjEwXX06IHpuYWxlemlvbm8gZmFrdHVyeSAoe2xhYmVsfSkiKQoKICAg
-echo ICAgICAgICAgaWYgbm90IGludm9pY2VzOgogICAgICAgICAgICAgICAgYnJlYWsKCiAgICAgICAg
-echo ICAgIGZvciBpbnYgaW4gaW52b2ljZXM6CiAgICAgICAgICAgICAgICBpbnZbIl90eXAiXSA9IGxh
-echo YmVsCgogICAgICAgICAgICBhbGxfaW52b2ljZXMuZXh0ZW5kKGludm9pY2VzKQogICAgICAgICAg
-echo ICBvZmZzZXQgKz0gbGVuKGludm9pY2VzKQoKICAgICAgICAgICAgIyBLU2VGIEFQSSAyLjA6IHBh
-echo Z2luYWNqYSBwcnpleiBoYXNNb3JlIChuaWUgdG90YWxDb3VudCkKICAgICAgICAgICAgaWYgbm90
-echo IGRhdGEuZ2V0KCJoYXNNb3JlIiwgRmFsc2UpOgogICAgICAgICAgICAgICAgYnJlYWsKCiAgICAg
-echo ICAgICAgIHRpbWUuc2xlZXAoMC4zKSAgIyBtacSZZHp5IHN0cm9uYW1pIHBhZ2luYWNqaSAobGlt
-echo aXQgOCByZXEvcyBqZXN0IE9LKQoKICAgICAgICByZXR1cm4gYWxsX2ludm9pY2VzCgogICAgQHN0
-echo YXRpY21ldGhvZAogICAgZGVmIF9jb3VudF93aW5kb3dzKGR0X2Zyb206IGRhdGV0aW1lLCBkdF90
-echo bzogZGF0ZXRpbWUpIC0+IGludDoKICAgICAgICBjb3VudCA9IDAKICAgICAgICBzdGFydCA9IGR0
-echo X2Zyb20KICAgICAgICB3aGlsZSBzdGFydCA8PSBkdF90bzoKICAgICAgICAgICAgZW5kID0gbWlu
-echo KHN0YXJ0ICsgcmVsYXRpdmVkZWx0YShtb250aHM9MykgLSB0aW1lZGVsdGEoZGF5cz0xKSwgZHRf
-echo dG8pCiAgICAgICAgICAgIGNvdW50ICs9IDEKICAgICAgICAgICAgc3RhcnQgPSBlbmQgKyB0aW1l
-echo ZGVsdGEoZGF5cz0xKQogICAgICAgIHJldHVybiBjb3VudAoKICAgIGRlZiBmZXRjaF9hbGwoc2Vs
-echo Ziwgc3ViamVjdF90eXBlOiBzdHIsIGRhdGVfZnJvbTogc3RyLCBkYXRlX3RvOiBzdHIpIC0+IGxp
-echo c3RbZGljdF06CiAgICAgICAgIiIiCiAgICAgICAgUG9iaWVyYSB3c3p5c3RraWUgZmFrdHVyeSB3
-echo IHpha3Jlc2llIGRhdCwgYXV0b21hdHljem5pZSBkemllbMSFYwogICAgICAgIG5hIG9rbmEgMy1t
-echo aWVzacSZY3puZSAobGltaXQgQVBJOiAyMCByZXEvaCkuCiAgICAgICAgTWnEmWR6eSBva25hbWkg
-echo Y3pla2EgU0xFRVBfQkVUV0VFTl9XSU5ET1dTIHNla3VuZC4KICAgICAgICAiIiIKICAgICAgICBs
-echo YWJlbCA9IFNVQkpFQ1RfVFlQRV9MQUJFTFMuZ2V0KHN1YmplY3RfdHlwZSwgc3ViamVjdF90eXBl
-echo KQoKICAgICAgICBkdF9mcm9tID0gZGF0ZXRpbWUuc3RycHRpbWUoZGF0ZV9mcm9tWzoxMF0sICIl
-echo WS0lbS0lZCIpCiAgICAgICAgZHRfdG8gICA9IGRhdGV0aW1lLnN0cnB0aW1lKGRhdGVfdG9bOjEw
-echo XSwgICAiJVktJW0tJWQiKQoKICAgICAgICB0b3RhbF93aW5kb3dzID0gc2VsZi5fY291bnRfd2lu
-echo ZG93cyhkdF9mcm9tLCBkdF90bykKICAgICAgICBldGFfbWluID0gKHRvdGFsX3dpbmRvd3MgKiBT
-echo TEVFUF9CRVRXRUVOX1dJTkRPV1MpIC8vIDYwCgogICAgICAgIGxvZ2dlci5pbmZvKGYiUG9iaWVy
-echo YW5pZSBmYWt0dXI6IHtsYWJlbH0iKQogICAgICAgIGxvZ2dlci5pbmZvKAogICAgICAgICAgICBm
-echo Ilpha3Jlczoge2RhdGVfZnJvbVs6MTBdfSDihpIge2RhdGVfdG9bOjEwXX0gfCAiCiAgICAgICAg
-echo ICAgIGYie3RvdGFsX3dpbmRvd3N9IG9raWVuIDMtbWllc2nEmWN6bnljaCB8ICIKICAgICAgICAg
-echo ICAgZiJzemFjLiBjemFzOiB+e2V0YV9taW59IG1pbiIKICAgICAgICApCgogICAgICAgIGFsbF9p
-echo bnZvaWNlcyA9IFtdCiAgICAgICAgd2luZG93X3N0YXJ0ID0gZHRfZnJvbQogICAgICAgIHdpbmRv
-echo d19udW0gICA9IDAKCiAgICAgICAgd2hpbGUgd2luZG93X3N0YXJ0IDw9IGR0X3RvOgogICAgICAg
-echo ICAgICB3aW5kb3dfbnVtICs9IDEKICAgICAgICAgICAgd2luZG93X2VuZCA9IG1pbih3aW5kb3df
-echo c3RhcnQgKyByZWxhdGl2ZWRlbHRhKG1vbnRocz0zKSAtIHRpbWVkZWx0YShkYXlzPTEpLCBkdF90
-echo bykKCiAgICAgICAgICAgIHdfZnJvbSA9IHNlbGYudG9faXNvKHdpbmRvd19zdGFydC5kYXRlKCks
-echo IGVuZF9vZl9kYXk9RmFsc2UpCiAgICAgICAgICAgIHdfdG8gICA9IHNlbGYudG9faXNvKHdpbmRv
-echo d19lbmQuZGF0ZSgpLCAgIGVuZF9vZl9kYXk9VHJ1ZSkKCiAgICAgICAgICAgIGJhdGNoID0gc2Vs
-echo Zi5fZmV0Y2hfd2luZG93KHN1YmplY3RfdHlwZSwgd19mcm9tLCB3X3RvKQogICAgICAgICAgICBh
-echo bGxfaW52b2ljZXMuZXh0ZW5kKGJhdGNoKQoKICAgICAgICAgICAgd2luZG93X3N0YXJ0ID0gd2lu
-echo ZG93X2VuZCArIHRpbWVkZWx0YShkYXlzPTEpCgogICAgICAgICAgICBpZiB3aW5kb3dfc3RhcnQg
-echo PD0gZHRfdG86CiAgICAgICAgICAgICAgICByZW1haW5pbmdfd2luZG93cyA9IHRvdGFsX3dpbmRv
-echo d3MgLSB3aW5kb3dfbnVtCiAgICAgICAgICAgICAgICByZW1haW5pbmdfbWluICAgICA9IChyZW1h
-echo aW5pbmdfd2luZG93cyAqIFNMRUVQX0JFVFdFRU5fV0lORE9XUykgLy8gNjAKICAgICAgICAgICAg
-echo ICAgIGxvZ2dlci5pbmZvKAogICAgICAgICAgICAgICAgICAgIGYiICBbe3dpbmRvd19udW19L3t0
-echo b3RhbF93aW5kb3dzfV0gQ3pla2FtIHtTTEVFUF9CRVRXRUVOX1dJTkRPV1N9cyAiCiAgICAgICAg
-echo ICAgICAgICAgICAgZiIobGltaXQgMjAgcmVxL2gpIOKAlCBwb3pvc3RhxYJvIH57cmVtYWluaW5n
-echo X21pbn0gbWluLi4uIgogICAgICAgICAgICAgICAgKQogICAgICAgICAgICAgICAgdGltZS5zbGVl
-echo cChTTEVFUF9CRVRXRUVOX1dJTkRPV1MpCgogICAgICAgIGxvZ2dlci5pbmZvKGYi4pyTIMWBxIVj
-echo em5pZSBwb2JyYW5vOiB7bGVuKGFsbF9pbnZvaWNlcyl9IGZha3R1ciAoe2xhYmVsfSkiKQogICAg
-echo ICAgIHJldHVybiBhbGxfaW52b2ljZXMKCiAgICBAc3RhdGljbWV0aG9kCiAgICBkZWYgdG9faXNv
-echo KGQ6IHN0ciB8IGRhdGUgfCBkYXRldGltZSwgZW5kX29mX2RheTogYm9vbCA9IEZhbHNlKSAtPiBz
-echo dHI6CiAgICAgICAgaWYgaXNpbnN0YW5jZShkLCBzdHIpOgogICAgICAgICAgICBkID0gZGF0ZXRp
-echo bWUuc3RycHRpbWUoZFs6MTBdLCAiJVktJW0tJWQiKS5kYXRlKCkKICAgICAgICBpZiBpc2luc3Rh
-echo bmNlKGQsIGRhdGUpIGFuZCBub3QgaXNpbnN0YW5jZShkLCBkYXRldGltZSk6CiAgICAgICAgICAg
-echo IGlmIGVuZF9vZl9kYXk6CiAgICAgICAgICAgICAgICBkID0gZGF0ZXRpbWUoZC55ZWFyLCBkLm1v
-echo bnRoLCBkLmRheSwgMjMsIDU5LCA1OSkKICAgICAgICAgICAgZWxzZToKICAgICAgICAgICAgICAg
-echo IGQgPSBkYXRldGltZShkLnllYXIsIGQubW9udGgsIGQuZGF5LCAwLCAwLCAwKQogICAgICAgIHJl
-echo dHVybiBkLnN0cmZ0aW1lKCIlWS0lbS0lZFQlSDolTTolUy4wMDBaIikKCiAgICBAc3RhdGljbWV0
-echo aG9kCiAgICBkZWYgX3JhaXNlX2Zvcl9zdGF0dXMocmVzcDogcmVxdWVzdHMuUmVzcG9uc2UsIGNv
-echo bnRleHQ6IHN0cikgLT4gTm9uZToKICAgICAgICBpZiBub3QgcmVzcC5vazoKICAgICAgICAgICAg
-echo dHJ5OgogICAgICAgICAgICAgICAgZGV0YWlsID0gcmVzcC5qc29uKCkKICAgICAgICAgICAgZXhj
-echo ZXB0IEV4Y2VwdGlvbjoKICAgICAgICAgICAgICAgIGRldGFpbCA9IHJlc3AudGV4dFs6NTAwXQog
-echo ICAgICAgICAgICByYWlzZSBLU2VGSW52b2ljZUVycm9yKGYie2NvbnRleHR9IOKAlCBIVFRQIHty
-echo ZXNwLnN0YXR1c19jb2RlfToge2RldGFpbH0iKQo=
+echo acSZY3puZSBpIGxpY3p5CnphcHl0YW5pYSB3IHByemVzdXdueW0gb2tuaWUgZ29kemlubnltIOKA
+echo lCBjemVrYSB0eWxrbyB3dGVkeSwgZ2R5IGtvbGVqbmUKb2tubyBwcnpla3JvY3p5xYJvYnkgbGlt
+echo aXQgMjAgcmVxL2guCiIiIgoKaW1wb3J0IGpzb24KaW1wb3J0IGxvZ2dpbmcKaW1wb3J0IHJhbmRv
+echo bQppbXBvcnQgdGhyZWFkaW5nCmltcG9ydCB0aW1lCmZyb20gY29sbGVjdGlvbnMgaW1wb3J0IGRl
+echo cXVlCmZyb20gY29uY3VycmVudC5mdXR1cmVzIGltcG9ydCBUaHJlYWRQb29sRXhlY3V0b3IKZnJv
+echo bSBkYXRldGltZSBpbXBvcnQgZGF0ZXRpbWUsIGRhdGUsIHRpbWVkZWx0YQoKaW1wb3J0IHJlcXVl
+echo c3RzCgpmcm9tIGtzZWZfYXV0aCBpbXBvcnQgY3JlYXRlX3Nlc3Npb24KCnRyeToKICAgIGltcG9y
+echo dCBvcmpzb24gICMgc3p5YnN6eSBwYXJzZXIgSlNPTjsgb3Bjam9uYWxueSDigJQgYmV6IG5pZWdv
+echo IHJlc3AuanNvbigpCmV4Y2VwdCBJbXBvcnRFcnJvcjoKICAgIG9yanNvbiA9IE5vbmUKCmxvZ2dl
+echo ciA9IGxvZ2dpbmcuZ2V0TG9nZ2VyKF9fbmFtZV9fKQoKIyBMaW1pdCBwcm9kdWtjeWpueTogMjAg
+echo cmVxL2gg4oaSIDM2MDAvMjAgPSAxODAgcy9yZXE7ICs1IHMgbWFyZ2luZXMgYmV6cGllY3plxYRz
+echo dHdhCiMgKGfDs3JuYSBncmFuaWNhIG9jemVraXdhbmlhIHBvIEhUVFAgNDI5IGJleiBuYWfFgsOz
+echo d2thIFJldHJ5LUFmdGVyKQpTTEVFUF9CRVRXRUVOX1dJTkRPV1MgPSAxODUgICMgcwoKIyBPa25h
+echo IDMtbWllc2nEmWN6bmUgdyBwcnplc3V3bnltIG9rbmllIGdvZHppbm55bSAobGltaXQgMjAgcmVx
+echo L2gsIDEgemFweXRhbmllIHphcGFzdSkKV0lORE9XX1JFUVVFU1RTX1BFUl9IT1VSID0gMTkKUVVP
+echo VEFfUEVSSU9EID0gMzYwMCAgIyBzCgojIChjb25uZWN0LCByZWFkKSDigJQgb2Rwb3dpZWTFuiB6
+echo IGR1xbzEhSBzdHJvbsSFIGZha3R1ciBtb8W8ZSBzacSZIGdlbmVyb3dhxIcgZMWCdcW8ZWoKUVVF
+echo UllfVElNRU9VVCA9ICg1LCA2MCkgICMgcwoKIyBMaW1pdCA4IHJlcS9zIOKAlCB3c3DDs2xueSBk
+echo bGEgd3N6eXN0a2ljaCB3xIV0a8OzdyBrb3J6eXN0YWrEhWN5Y2ggeiBrbGllbnRhCk1BWF9SRVFV
+echo RVNUU19QRVJfU0VDT05EID0gOAoKIyBQYWdpbmFjamEgdyBvYnLEmWJpZSBva25hOiBkbyA4IHN0
+echo cm9uIHBvYmllcmFueWNoIHLDs3dub2xlZ2xlClBBR0VfQ09OQ1VSUkVOQ1kgPSA4CgojIFN1Zmlr
+echo c3kgY3phc3UgZGxhIGdyYW5pYyB6YWtyZXN1IGRhdCAoZm9ybWF0IElTTyA4NjAxIG9jemVraXdh
+echo bnkgcHJ6ZXogS1NlRikKU09EX1NVRkZJWCA9ICJUMDA6MDA6MDAuMDAwWiIgICMgcG9jesSFdGVr
+echo IGRuaWEKRU9EX1NVRkZJWCA9ICJUMjM6NTk6NTkuMDAwWiIgICMga29uaWVjIGRuaWEKCk9ORV9E
+echo QVkgPSB0aW1lZGVsdGEoZGF5cz0xKQoKU1VCSkVDVF9UWVBFX0xBQkVMUyA9IHsKICAgICJTdWJq
+echo ZWN0MSI6ICJXeXN0YXdpb25lIChzcHJ6ZWRhxbwpIiwKICAgICJTdWJqZWN0MiI6ICJPdHJ6eW1h
+echo bmUgKHpha3VweS9rb3N6dHkpIiwKfQoKCmNsYXNzIEtTZUZJbnZvaWNlRXJyb3IoRXhjZXB0aW9u
+echo KToKICAgIHBhc3MKCgpjbGFzcyBSYXRlTGltaXRlcjoKICAgICIiIk9rbm8gcHJ6ZXN1d25lOiBj
+echo byBuYWp3ecW8ZWogbWF4X2NhbGxzIHd5d2/FgmHFhCBhY3F1aXJlKCkgdyBjacSFZ3UgcGVyaW9k
+echo IHNla3VuZCAodGhyZWFkLXNhZmUpLiIiIgoKICAgIGRlZiBfX2luaXRfXyhzZWxmLCBtYXhfY2Fs
+echo bHM6IGludCwgcGVyaW9kOiBmbG9hdCk6CiAgICAgICAgc2VsZi5tYXhfY2FsbHMgPSBtYXhfY2Fs
+echo bHMKICAgICAgICBzZWxmLnBlcmlvZCA9IHBlcmlvZAogICAgICAgIHNlbGYuX2NhbGxzOiBkZXF1
+echo ZVtmbG9hdF0gPSBkZXF1ZSgpCiAgICAgICAgc2VsZi5fbG9jayA9IHRocmVhZGluZy5Mb2NrKCkK
+echo CiAgICBkZWYgX3BydW5lKHNlbGYsIG5vdzogZmxvYXQpIC0+IE5vbmU6CiAgICAgICAgd2hpbGUg
+echo c2VsZi5fY2FsbHMgYW5kIG5vdyAtIHNlbGYuX2NhbGxzWzBdID49IHNlbGYucGVyaW9kOgogICAg
+echo ICAgICAgICBzZWxmLl9jYWxscy5wb3BsZWZ0KCkKCiAgICBkZWYgZGVsYXkoc2VsZikgLT4gZmxv
+echo YXQ6CiAgICAgICAgIiIiTGljemJhIHNla3VuZCBkbyB6d29sbmllbmlhIG1pZWpzY2EgdyBva25p
+echo ZSAoMCDigJQgbW/FvG5hIG9kIHJhenUpLiIiIgogICAgICAgIHdpdGggc2VsZi5fbG9jazoKICAg
+echo ICAgICAgICAgbm93ID0gdGltZS5tb25vdG9uaWMoKQogICAgICAgICAgICBzZWxmLl9wcnVuZShu
+echo b3cpCiAgICAgICAgICAgIGlmIGxlbihzZWxmLl9jYWxscykgPCBzZWxmLm1heF9jYWxsczoKICAg
+echo ICAgICAgICAgICAgIHJldHVybiAwLjAKICAgICAgICAgICAgcmV0dXJuIHNlbGYucGVyaW9kIC0g
+echo KG5vdyAtIHNlbGYuX2NhbGxzWzBdKQoKICAgIGRlZiB0cnlfYWNxdWlyZShzZWxmKSAtPiBib29s
+echo OgogICAgICAgICIiIkphayBhY3F1aXJlKCksIGFsZSBiZXogY3pla2FuaWEg4oCUIEZhbHNlLCBn
+echo ZHkgb2tubyBqZXN0IHBlxYJuZS4iIiIKICAgICAgICB3aXRoIHNlbGYuX2xvY2s6CiAgICAgICAg
+echo ICAgIG5vdyA9IHRpbWUubW9ub3RvbmljKCkKICAgICAgICAgICAgc2VsZi5fcHJ1bmUobm93KQog
+echo ICAgICAgICAgICBpZiBsZW4oc2VsZi5fY2FsbHMpIDwgc2VsZi5tYXhfY2FsbHM6CiAgICAgICAg
+echo ICAgICAgICBzZWxmLl9jYWxscy5hcHBlbmQobm93KQogICAgICAgICAgICAgICAgcmV0dXJuIFRy
+echo dWUKICAgICAgICAgICAgcmV0dXJuIEZhbHNlCgogICAgZGVmIGFjcXVpcmUoc2VsZikgLT4gTm9u
+echo ZToKICAgICAgICB3aXRoIHNlbGYuX2xvY2s6CiAgICAgICAgICAgIHdoaWxlIFRydWU6CiAgICAg
+echo ICAgICAgICAgICBub3cgPSB0aW1lLm1vbm90b25pYygpCiAgICAgICAgICAgICAgICBzZWxmLl9w
+echo cnVuZShub3cpCiAgICAgICAgICAgICAgICBpZiBsZW4oc2VsZi5fY2FsbHMpIDwgc2VsZi5tYXhf
+echo Y2FsbHM6CiAgICAgICAgICAgICAgICAgICAgc2VsZi5fY2FsbHMuYXBwZW5kKG5vdykKICAgICAg
+echo ICAgICAgICAgICAgICByZXR1cm4KICAgICAgICAgICAgICAgIHRpbWUuc2xlZXAoc2VsZi5wZXJp
+echo b2QgLSAobm93IC0gc2VsZi5fY2FsbHNbMF0pKQoKCmNsYXNzIEtTZUZJbnZvaWNlczoKCiAgICBk
+echo ZWYgX19pbml0X18oc2VsZiwgYmFzZV91cmw6IHN0ciwgYXV0aF9oZWFkZXJzOiBkaWN0LCBwYWdl
+echo X3NpemU6IGludCA9IDEwMCwgYXV0aD1Ob25lLAogICAgICAgICAgICAgICAgIHNlc3Npb246IHJl
+echo cXVlc3RzLlNlc3Npb24gfCBOb25lID0gTm9uZSk6CiAgICAgICAgc2VsZi5iYXNlX3VybCA9IGJh
+echo c2VfdXJsCiAgICAgICAgc2VsZi5hdXRoX2hlYWRlcnMgPSBhdXRoX2hlYWRlcnMKICAgICAgICBz
+echo ZWxmLnBhZ2Vfc2l6ZSA9IG1pbihtYXgocGFnZV9zaXplLCAxKSwgMTAwMCkKICAgICAgICBzZWxm
+echo LmF1dGggPSBhdXRoICAjIEtTZUZBdXRoIOKAlCBkbyBhdXRvLW9kxZt3aWXFvGVuaWEgdG9rZW5h
+echo IHByenkgNDAxCiAgICAgICAgIyBXc3DDs2xuYSBzZXNqYSB6IEtTZUZBdXRoIOKAlCBwYWdpbmFj
+echo amEga29yenlzdGEgeiB0ZWdvIHNhbWVnbyBwb8WCxIVjemVuaWEga2VlcC1hbGl2ZTsKICAgICAg
+echo ICAjIGJleiBhdXRoIHfFgmFzbmEgc2VzamEgeiB0xIUgc2FtxIUgcHVsxIUgcG/FgsSFY3plxYQg
+echo KEtTZUZBZGFwdGVyKSBpIG5hZ8WCw7N3a2FtaQogICAgICAgIGlmIHNlc3Npb24gaXMgTm9uZToK
+echo ICAgICAgICAgICAgc2Vzc2lvbiA9IGF1dGguc2Vzc2lvbiBpZiBhdXRoIGlzIG5vdCBOb25lIGVs
+echo c2UgY3JlYXRlX3Nlc3Npb24oKQogICAgICAgIHNlbGYuc2Vzc2lvbiA9IHNlc3Npb24KICAgICAg
+echo ICBzZWxmLl9hdXRoX2xvY2sgPSB0aHJlYWRpbmcuTG9jaygpCiAgICAgICAgc2VsZi5fcmF0ZV9s
+echo aW1pdGVyID0gUmF0ZUxpbWl0ZXIoTUFYX1JFUVVFU1RTX1BFUl9TRUNPTkQsIDEuMCkKICAgICAg
+echo ICBzZWxmLl9jYW5jZWxsZWQgPSB0aHJlYWRpbmcuRXZlbnQoKQogICAgICAgICMgTGltaXQgMjAg
+echo cmVxL2ggZG90eWN6eSBlbmRwb2ludHUg4oCUIGplZGVuIGxpY3puaWsgZGxhIFN1YmplY3QxIGkg
+echo U3ViamVjdDIKICAgICAgICBzZWxmLl93aW5kb3dfbGltaXRlciA9IFJhdGVMaW1pdGVyKFdJTkRP
+echo V19SRVFVRVNUU19QRVJfSE9VUiwgUVVPVEFfUEVSSU9EKQogICAgICAgIHNlbGYuX3BlbmRpbmdf
+echo d2luZG93cyA9IDAgICMgb2tuYSB3c3p5c3RraWNoIHfEhXRrw7N3IGN6ZWthasSFY2UgbmEgemFw
+echo eXRhbmllIChkbyBFVEEpCiAgICAgICAgc2VsZi5fcGVuZGluZ19sb2NrID0gdGhyZWFkaW5nLkxv
+echo Y2soKQoKICAgIGRlZiBfcXVlcnlfcGFnZShzZWxmLCBib2R5OiBieXRlcywgZGF0ZV9mcm9tOiBz
+echo dHIsIHBhZ2Vfb2Zmc2V0OiBpbnQpIC0+IGRpY3Q6CiAgICAgICAgIiIiCiAgICAgICAgUG9iaWVy
+echo YSBqZWRuxIUgc3Ryb27EmSB3eW5pa8OzdyB6IC9pbnZvaWNlcy9xdWVyeS9tZXRhZGF0YS4KICAg
+echo ICAgICBib2R5IHRvIGdvdG93eSBKU09OIHphcHl0YW5pYSAoc3RhxYJ5IGRsYSBjYcWCZWdvIG9r
+echo bmEpIOKAlCB6bWllbmlhIHNpxJkgdHlsa28gcGFnZU9mZnNldC4KICAgICAgICAiIiIKICAgICAg
+echo ICB1cmwgPSBmIntzZWxmLmJhc2VfdXJsfS9pbnZvaWNlcy9xdWVyeS9tZXRhZGF0YSIKICAgICAg
+echo ICBwYXJhbXMgPSB7CiAgICAgICAgICAgICJwYWdlU2l6ZSI6IHNlbGYucGFnZV9zaXplLAogICAg
+echo ICAgICAgICAicGFnZU9mZnNldCI6IHBhZ2Vfb2Zmc2V0LAogICAgICAgIH0KICAgICAgICBmb3Ig
+echo YXR0ZW1wdCBpbiByYW5nZSgxLCA2KToKICAgICAgICAgICAgYXV0aF9oZWFkZXJzID0gc2VsZi5h
+echo dXRoX2hlYWRlcnMKICAgICAgICAgICAgIyBib2R5IHRvIGdvdG93ZSBiYWp0eSAoZGF0YT0pIOKA
+echo lCByZXF1ZXN0cyBuaWUgZG9kYSBDb250ZW50LVR5cGUgc2FtLCBqYWsgcHJ6eSBqc29uPQogICAg
+echo ICAgICAgICBoZWFkZXJzID0geyoqYXV0aF9oZWFkZXJzLCAiQ29udGVudC1UeXBlIjogImFwcGxp
+echo Y2F0aW9uL2pzb24ifQogICAgICAgICAgICBzZWxmLl9yYXRlX2xpbWl0ZXIuYWNxdWlyZSgpCiAg
+echo ICAgICAgICAgIHJlc3AgPSBzZWxmLnNlc3Npb24ucG9zdCh1cmwsIGRhdGE9Ym9keSwgcGFyYW1z
+echo PXBhcmFtcywgaGVhZGVycz1oZWFkZXJzLCB0aW1lb3V0PVFVRVJZX1RJTUVPVVQpCiAgICAgICAg
+echo ICAgIGlmIHJlc3Auc3RhdHVzX2NvZGUgPT0gNDAxIGFuZCBzZWxmLmF1dGggaXMgbm90IE5vbmU6
+echo CiAgICAgICAgICAgICAgICAjIFRva2VuIHd5Z2FzxYIg4oCUIHJlLWF1dGggdyBtaWVqc2N1LCBi
+echo ZXogdXRyYXR5IHBvc3TEmXB1LgogICAgICAgICAgICAgICAgIyBTdHJvbnkgcG9iaWVyYW5lIHPE
+echo hSByw7N3bm9sZWdsZTogdXdpZXJ6eXRlbG5pYSB0eWxrbyBwaWVyd3N6eSB3xIV0ZWssCiAgICAg
+echo ICAgICAgICAgICAjIHBvem9zdGHFgmUgcG9uYXdpYWrEhSB6YXB5dGFuaWUgeiBqdcW8IG9kxZt3
+echo aWXFvG9ueW1pIG5hZ8WCw7N3a2FtaS4KICAgICAgICAgICAgICAgIHdpdGggc2VsZi5fYXV0aF9s
+echo b2NrOgogICAgICAgICAgICAgICAgICAgIGlmIHNlbGYuYXV0aF9oZWFkZXJzIGlzIGF1dGhfaGVh
+echo ZGVyczoKICAgICAgICAgICAgICAgICAgICAgICAgbG9nZ2VyLndhcm5pbmcoImFjY2Vzc1Rva2Vu
+echo IHd5Z2FzxYIgKHByw7NiYSAlcy81KSDigJQgcG9ub3duZSB1d2llcnp5dGVsbmllbmllLi4uIiwg
+echo YXR0ZW1wdCkKICAgICAgICAgICAgICAgICAgICAgICAgdGltZS5zbGVlcChzZWxmLl9iYWNrb2Zm
+echo KDAsIGJhc2U9MC41LCBjYXA9MS4wKSkKICAgICAgICAgICAgICAgICAgICAgICAgc2VsZi5hdXRo
+echo LmF1dGhlbnRpY2F0ZSgpCiAgICAgICAgICAgICAgICAgICAgICAgIHNlbGYuYXV0aF9oZWFkZXJz
+echo ID0gc2VsZi5hdXRoLmdldF9hdXRoX2hlYWRlcnMoKQogICAgICAgICAgICAgICAgY29udGludWUK
+echo ICAgICAgICAgICAgaWYgcmVzcC5zdGF0dXNfY29kZSA9PSA0Mjk6CiAgICAgICAgICAgICAgICBp
+echo ZiBhdHRlbXB0ID09IDU6CiAgICAgICAgICAgICAgICAgICAgYnJlYWsgICMgb3N0YXRuaWEgcHLD
+echo s2JhIOKAlCBiZXogY3pla2FuaWEsIG9kIHJhenUgYsWCxIVkCiAgICAgICAgICAgICAgICAjIEN6
+echo eXRhaiBSZXRyeS1BZnRlciB6IG5hZ8WCw7N3a2EgSFRUUCAoc3RhbmRhcmQpOwogICAgICAgICAg
+echo ICAgICAgIyBmYWxsYmFjazogY28gbmFqbW5pZWogU0xFRVBfQkVUV0VFTl9XSU5ET1dTIChqZWRl
+echo biBzbG90IGxpbWl0dSAyMCByZXEvaCkKICAgICAgICAgICAgICAgICMgbHViIGRvIHp3b2xuaWVu
+echo aWEgbWllanNjYSB3IGxpbWljaWUgZ29kemlubnltLCB6IHJvenJ6dXRlbSB3IGfDs3LEmQogICAg
+echo ICAgICAgICAgICAgaWYgIlJldHJ5LUFmdGVyIiBpbiByZXNwLmhlYWRlcnM6CiAgICAgICAgICAg
+echo ICAgICAgICAgcmV0cnlfYWZ0ZXIgPSBpbnQocmVzcC5oZWFkZXJzWyJSZXRyeS1BZnRlciJdKSAr
+echo IDIKICAgICAgICAgICAgICAgIGVsc2U6CiAgICAgICAgICAgICAgICAgICAgcmV0cnlfYWZ0ZXIg
+echo PSBtYXgoU0xFRVBfQkVUV0VFTl9XSU5ET1dTLCBzZWxmLl93aW5kb3dfbGltaXRlci5kZWxheSgp
+echo KQogICAgICAgICAgICAgICAgICAgIHJldHJ5X2FmdGVyICo9IHJhbmRvbS51bmlmb3JtKDEuMCwg
+echo MS4xKQogICAgICAgICAgICAgICAgbG9nZ2VyLndhcm5pbmcoCiAgICAgICAgICAgICAgICAgICAg
+echo IkhUVFAgNDI5IOKAlCByYXRlIGxpbWl0LCBjemVrYW0gJS4wZnMgKHByw7NiYSAlcy81KS4uLiIs
+echo IHJldHJ5X2FmdGVyLCBhdHRlbXB0CiAgICAgICAgICAgICAgICApCiAgICAgICAgICAgICAgICBp
+echo ZiBzZWxmLl9jYW5jZWxsZWQud2FpdChyZXRyeV9hZnRlcik6CiAgICAgICAgICAgICAgICAgICAg
+echo cmFpc2UgS1NlRkludm9pY2VFcnJvcihmIlBvYmllcmFuaWUgcHJ6ZXJ3YW5lIChvZmZzZXQ9e3Bh
+echo Z2Vfb2Zmc2V0fSwgb2Q9e2RhdGVfZnJvbX0pIikKICAgICAgICAgICAgICAgIGNvbnRpbnVlCiAg
+echo ICAgICAgICAgIHNlbGYuX3JhaXNlX2Zvcl9zdGF0dXMocmVzcCwgZiJCxYLEhWQgemFweXRhbmlh
+echo IG8gZmFrdHVyeSAob2Zmc2V0PXtwYWdlX29mZnNldH0sIG9kPXtkYXRlX2Zyb219KSIpCiAgICAg
+echo ICAgICAgIGRhdGEgPSBzZWxmLl9qc29uKHJlc3ApCiAgICAgICAgICAgIHJldHVybiBkYXRhCiAg
+echo ICAgICAgcmFpc2UgS1NlRkludm9pY2VFcnJvcigKICAgICAgICAgICAgZiJCxYLEhWQgemFweXRh
+echo bmlhIG8gZmFrdHVyeSAob2Zmc2V0PXtwYWdlX29mZnNldH0sIG9kPXtkYXRlX2Zyb219KSAiCiAg
+echo ICAgICAgICAgIGYi4oCUIHByemVrcm9jem9ubyBsaW1pdCBwcsOzYiIKICAgICAgICApCgogICAg
+echo ZGVmIF9mZXRjaF93aW5kb3coc2VsZiwgc3ViamVjdF90eXBlOiBzdHIsIGRhdGVfZnJvbTogc3Ry
+echo LCBkYXRlX3RvOiBzdHIsCiAgICAgICAgICAgICAgICAgICAgICBsYWJlbDogc3RyKSAtPiBsaXN0
+echo W2RpY3RdOgogICAgICAgICIiIgogICAgICAgIFBvYmllcmEgd3N6eXN0a2llIHN0cm9ueSBkbGEg
+echo amVkbmVnbyBva25hIGN6YXNvd2VnbyAobWF4IDMgbWllc2nEhWNlKS4KCiAgICAgICAgUGllcndz
+echo emEgc3Ryb25hIG3Ds3dpLCBjenkgc8SFIGtvbGVqbmUgKGhhc01vcmUpOyBkYWxzemUgc3Ryb255
+echo IHBvYmllcmFuZSBzxIUKICAgICAgICByw7N3bm9sZWdsZSBwYXJ0aWFtaSAxLCAyLCA0LCAuLi4g
+echo ZG8gUEFHRV9DT05DVVJSRU5DWSB6YXB5dGHFhCAodGVtcG8gcGlsbnVqZQogICAgICAgIFJhdGVM
+echo aW1pdGVyKSwgYSB3eW5pa2kgxYLEhWN6b25lIHcga29sZWpub8WbY2kgb2Zmc2V0w7N3LgogICAg
+echo ICAgICIiIgogICAgICAgIGJvZHkgPSBzZWxmLl9kdW1wcyh7CiAgICAgICAgICAgICJzdWJqZWN0
+echo VHlwZSI6IHN1YmplY3RfdHlwZSwKICAgICAgICAgICAgImRhdGVSYW5nZSI6IHsKICAgICAgICAg
+echo ICAgICAgICJkYXRlVHlwZSI6ICJJbnZvaWNpbmciLAogICAgICAgICAgICAgICAgImZyb20iOiBk
+echo YXRlX2Zyb20sCiAgICAgICAgICAgICAgICAidG8iOiBkYXRlX3RvLAogICAgICAgICAgICB9LAog
+echo ICAgICAgIH0pCgogICAgICAgIGRhdGEgPSBzZWxmLl9xdWVyeV9wYWdlKGJvZHksIGRhdGVfZnJv
+echo bSwgMCkKICAgICAgICBpbnZvaWNlcyA9IGRhdGEuZ2V0KCJpbnZvaWNlcyIsIFtdKSAgIyBLU2VG
+echo IEFQSSAyLjA6IHBvbGUgImludm9pY2VzIgogICAgICAgIGlmIG5vdCBpbnZvaWNlczoKICAgICAg
+echo ICAgICAgcmV0dXJuIFtdCgogICAgICAgIGxvZ2dlci5pbmZvKCIgIE9rbm8gJS4xMHPigJMlLjEw
+echo czogem5hbGV6aW9ubyBmYWt0dXJ5ICglcykiLCBkYXRlX2Zyb20sIGRhdGVfdG8sIGxhYmVsKQog
+echo ICAgICAgIGFsbF9pbnZvaWNlcyA9IGxpc3QoaW52b2ljZXMpCiAgICAgICAgb2Zmc2V0ID0gbGVu
+echo KGludm9pY2VzKQogICAgICAgIGhhc19tb3JlID0gZGF0YS5nZXQoImhhc01vcmUiLCBGYWxzZSkg
+echo ICMgS1NlRiBBUEkgMi4wOiBwYWdpbmFjamEgcHJ6ZXogaGFzTW9yZSAobmllIHRvdGFsQ291bnQp
+echo CgogICAgICAgIGlmIGhhc19tb3JlOgogICAgICAgICAgICAjIEtyb2sgb2Zmc2V0w7N3ID0gZmFr
+echo dHljem5hIGTFgnVnb8WbxIcgc3Ryb255IChzZXJ3ZXIgbW/FvGUgb2dyYW5pY3p5xIcgcGFnZVNp
+echo emUpCiAgICAgICAgICAgIHN0cmlkZSA9IGxlbihpbnZvaWNlcykKICAgICAgICAgICAgYmF0Y2hf
+echo c2l6ZSA9IDEgICMgMSwgMiwgNCwgLi4uIFBBR0VfQ09OQ1VSUkVOQ1kg4oCUIOKAnmplc3pjemUg
+echo amVkbmEgc3Ryb25h4oCdIHRvIGplZG5vIHphcHl0YW5pZQogICAgICAgICAgICBzcGVjdWxhdGUg
+echo PSBUcnVlCiAgICAgICAgICAgIHdpdGggVGhyZWFkUG9vbEV4ZWN1dG9yKG1heF93b3JrZXJzPVBB
+echo R0VfQ09OQ1VSUkVOQ1kpIGFzIHBvb2w6CiAgICAgICAgICAgICAgICB3aGlsZSBoYXNfbW9yZToK
+echo ICAgICAgICAgICAgICAgICAgICBvZmZzZXRzID0gW29mZnNldCArIGkgKiBzdHJpZGUgZm9yIGkg
+echo aW4gcmFuZ2UoYmF0Y2hfc2l6ZSldCiAgICAgICAgICAgICAgICAgICAgcGFnZXMgPSBwb29sLm1h
+echo cCgKICAgICAgICAgICAgICAgICAgICAgICAgbGFtYmRhIG86IHNlbGYuX3F1ZXJ5X3BhZ2UoYm9k
+echo eSwgZGF0ZV9mcm9tLCBvKSwgb2Zmc2V0cwogICAgICAgICAgICAgICAgICAgICkKICAgICAgICAg
+echo ICAgICAgICAgICBmb3IgcGFnZV9vZmZzZXQsIHBhZ2UgaW4gemlwKG9mZnNldHMsIHBhZ2VzKToK
+echo ICAgICAgICAgICAgICAgICAgICAgICAgaWYgcGFnZV9vZmZzZXQgIT0gb2Zmc2V0OgogICAgICAg
+echo ICAgICAgICAgICAgICAgICAgICAgIyBQb3ByemVkbmlhIHN0cm9uYSBiecWCYSBuaWVwZcWCbmEg
+echo 4oCUIGRhbHN6ZSBvZmZzZXR5IHPEhSBuaWVha3R1YWxuZQogICAgICAgICAgICAgICAgICAgICAg
+echo ICAgICAgYnJlYWsKICAgICAgICAgICAgICAgICAgICAgICAgaW52b2ljZXMgPSBwYWdlLmdldCgi
+echo aW52b2ljZXMiLCBbXSkKICAgICAgICAgICAgICAgICAgICAgICAgYWxsX2ludm9pY2VzLmV4dGVu
+echo ZChpbnZvaWNlcykKICAgICAgICAgICAgICAgICAgICAgICAgb2Zmc2V0ICs9IGxlbihpbnZvaWNl
+echo cykKICAgICAgICAgICAgICAgICAgICAgICAgaGFzX21vcmUgPSBib29sKGludm9pY2VzKSBhbmQg
+echo cGFnZS5nZXQoImhhc01vcmUiLCBGYWxzZSkKICAgICAgICAgICAgICAgICAgICAgICAgaWYgbGVu
+echo KGludm9pY2VzKSA8IHN0cmlkZToKICAgICAgICAgICAgICAgICAgICAgICAgICAgICMgU3Ryb25h
+echo IGtyw7N0c3phIG5pxbwga3JvayDigJQgZGFsZWogdHlsa28gcG8ga29sZWksIGJleiB6Z2FkeXdh
+echo bmlhIG9mZnNldMOzdwogICAgICAgICAgICAgICAgICAgICAgICAgICAgc3BlY3VsYXRlID0gRmFs
+echo c2UKICAgICAgICAgICAgICAgICAgICAgICAgaWYgbm90IGhhc19tb3JlOgogICAgICAgICAgICAg
+echo ICAgICAgICAgICAgICAgYnJlYWsKICAgICAgICAgICAgICAgICAgICBiYXRjaF9zaXplID0gbWlu
+echo KGJhdGNoX3NpemUgKiAyLCBQQUdFX0NPTkNVUlJFTkNZKSBpZiBzcGVjdWxhdGUgZWxzZSAxCgog
+echo ICAgICAgIHJldHVybiBhbGxfaW52b2ljZXMKCiAgICBAc3RhdGljbWV0aG9kCiAgICBkZWYgX2l0
+echo ZXJfd2luZG93cyhkdF9mcm9tOiBkYXRlLCBkdF90bzogZGF0ZSkgLT4gbGlzdFt0dXBsZVtkYXRl
+echo LCBkYXRlXV06CiAgICAgICAgIiIiRHppZWxpIHpha3JlcyBbZHRfZnJvbSwgZHRfdG9dIG5hIGtv
+echo bGVqbmUgb2tuYSAzLW1pZXNpxJljem5lIChzdGFydCwga29uaWVjKS4iIiIKICAgICAgICBmcm9t
+echo IGRhdGV1dGlsLnJlbGF0aXZlZGVsdGEgaW1wb3J0IHJlbGF0aXZlZGVsdGEgICMgcG90cnplYm5l
+echo IHR5bGtvIHR1dGFqCgogICAgICAgICMgT2tubyB6YXB5dGFuaWE6IDMgbWllc2nEhWNlIG1pbnVz
+echo IGplZGVuIGR6aWXFhCAoa29uaWVjIG9rbmEgd8WCxIVjem5pZSkKICAgICAgICB3aW5kb3dfc3Bh
+echo biA9IHJlbGF0aXZlZGVsdGEobW9udGhzPTMsIGRheXM9LTEpCiAgICAgICAgd2luZG93cyA9IFtd
+echo CiAgICAgICAgc3RhcnQgPSBkdF9mcm9tCiAgICAgICAgd2hpbGUgc3RhcnQgPD0gZHRfdG86CiAg
+echo ICAgICAgICAgIGVuZCA9IG1pbihzdGFydCArIHdpbmRvd19zcGFuLCBkdF90bykKICAgICAgICAg
+echo ICAgd2luZG93cy5hcHBlbmQoKHN0YXJ0LCBlbmQpKQogICAgICAgICAgICBzdGFydCA9IGVuZCAr
+echo IE9ORV9EQVkKICAgICAgICByZXR1cm4gd2luZG93cwoKICAgIGRlZiBmZXRjaF9hbGwoc2VsZiwg
+echo c3ViamVjdF90eXBlOiBzdHIsIGRhdGVfZnJvbTogc3RyLCBkYXRlX3RvOiBzdHIpIC0+IGxpc3Rb
+echo ZGljdF06CiAgICAgICAgIiIiCiAgICAgICAgUG9iaWVyYSB3c3p5c3RraWUgZmFrdHVyeSB3IHph
+echo a3Jlc2llIGRhdCwgYXV0b21hdHljem5pZSBkemllbMSFYwogICAgICAgIG5hIG9rbmEgMy1taWVz
+echo acSZY3puZSAobGltaXQgQVBJOiAyMCByZXEvaCkuCiAgICAgICAgRG8gV0lORE9XX1JFUVVFU1RT
+echo X1BFUl9IT1VSIG9raWVuIG5hIGdvZHppbsSZIGlkemllIGJleiBjemVrYW5pYSDigJQgxYLEhWN6
+echo bmllCiAgICAgICAgZGxhIHdzenlzdGtpY2ggd3l3b8WCYcWEIGZldGNoX2FsbCB0ZWdvIGtsaWVu
+echo dGEgKHRha8W8ZSByw7N3bm9sZWfFgnljaCk7CiAgICAgICAga29sZWpuZSBjemVrYWrEhSwgYcW8
+echo IG5hanN0YXJzemUgemFweXRhbmllIHd5cGFkbmllIHogb2tuYSBnb2R6aW5uZWdvLgogICAgICAg
+echo IEZha3R1cnkgendyYWNhbmUgc8SFIGJleiBtb2R5ZmlrYWNqaSDigJQgdHlwIChTVUJKRUNUX1RZ
+echo UEVfTEFCRUxTKQogICAgICAgIGRvcGlzeXdhbnkgamVzdCBkb3BpZXJvIHByenkgemFwaXNpZSBh
+echo cmt1c3phLgogICAgICAgICIiIgogICAgICAgIGxhYmVsID0gU1VCSkVDVF9UWVBFX0xBQkVMUy5n
+echo ZXQoc3ViamVjdF90eXBlLCBzdWJqZWN0X3R5cGUpCgogICAgICAgIGR0X2Zyb20gPSBzZWxmLl9w
+echo YXJzZV9kYXRlKGRhdGVfZnJvbSkKICAgICAgICBkdF90byAgID0gc2VsZi5fcGFyc2VfZGF0ZShk
+echo YXRlX3RvKQoKICAgICAgICB3aW5kb3dzID0gc2VsZi5faXRlcl93aW5kb3dzKGR0X2Zyb20sIGR0
+echo X3RvKQogICAgICAgIHRvdGFsX3dpbmRvd3MgPSBsZW4od2luZG93cykKICAgICAgICBsaW1pdGVy
+echo ID0gc2VsZi5fd2luZG93X2xpbWl0ZXIKICAgICAgICB3aXRoIHNlbGYuX3BlbmRpbmdfbG9jazoK
+echo ICAgICAgICAgICAgc2VsZi5fcGVuZGluZ193aW5kb3dzICs9IHRvdGFsX3dpbmRvd3MKICAgICAg
+echo ICAgICAgcGVuZGluZyA9IHNlbGYuX3BlbmRpbmdfd2luZG93cwogICAgICAgIGV0YV9taW4gPSAo
+echo bWF4KHBlbmRpbmcgLSAxLCAwKSAvLyBXSU5ET1dfUkVRVUVTVFNfUEVSX0hPVVIpICogUVVPVEFf
+echo UEVSSU9EIC8vIDYwCgogICAgICAgIGxvZ2dlci5pbmZvKCJQb2JpZXJhbmllIGZha3R1cjogJXMi
+echo LCBsYWJlbCkKICAgICAgICBsb2dnZXIuaW5mbygKICAgICAgICAgICAgIlpha3JlczogJS4xMHMg
+echo 4oaSICUuMTBzIHwgJXMgb2tpZW4gMy1taWVzacSZY3pueWNoIHwgc3phYy4gY3phczogfiVzIG1p
+echo biIsCiAgICAgICAgICAgIGRhdGVfZnJvbSwgZGF0ZV90bywgdG90YWxfd2luZG93cywgZXRhX21p
+echo biwKICAgICAgICApCgogICAgICAgIGFsbF9pbnZvaWNlcyA9IFtdCiAgICAgICAgZG9uZV93aW5k
+echo b3dzID0gMAoKICAgICAgICB0cnk6CiAgICAgICAgICAgIGZvciB3aW5kb3dfbnVtLCAod2luZG93
+echo X3N0YXJ0LCB3aW5kb3dfZW5kKSBpbiBlbnVtZXJhdGUod2luZG93cywgc3RhcnQ9MSk6CiAgICAg
+echo ICAgICAgICAgICBpZiBzZWxmLl9jYW5jZWxsZWQuaXNfc2V0KCk6CiAgICAgICAgICAgICAgICAg
+echo ICAgcmFpc2UgS1NlRkludm9pY2VFcnJvcihmIlBvYmllcmFuaWUgcHJ6ZXJ3YW5lICh7bGFiZWx9
+echo KSIpCiAgICAgICAgICAgICAgICAjIExpbWl0ZXIgd3Nww7NsbnkgZGxhIG9idSB3xIV0a8OzdyDi
+echo gJQgendvbG5pb25lIG1pZWpzY2UgbW/FvGUgemFqxIXEhyBkcnVnaSB3xIV0ZWssCiAgICAgICAg
+echo ICAgICAgICAjIHdpxJljIGN6ZWthbXkgKHByemVyeXdhbG5pZSkgYcW8IHRyeV9hY3F1aXJlKCkg
+echo ZmFrdHljem5pZSBzacSZIHVkYQogICAgICAgICAgICAgICAgd2hpbGUgbm90IGxpbWl0ZXIudHJ5
+echo X2FjcXVpcmUoKToKICAgICAgICAgICAgICAgICAgICB3YWl0X3MgPSBsaW1pdGVyLmRlbGF5KCkK
+echo ICAgICAgICAgICAgICAgICAgICBpZiB3YWl0X3MgPiAwOgogICAgICAgICAgICAgICAgICAgICAg
+echo ICAjIFcga29sZWpjZSBsaWN6xIUgc2nEmSB0ZcW8IG9rbmEgZHJ1Z2llZ28gdHlwdSBmYWt0dXIK
+echo ICAgICAgICAgICAgICAgICAgICAgICAgd2l0aCBzZWxmLl9wZW5kaW5nX2xvY2s6CiAgICAgICAg
+echo ICAgICAgICAgICAgICAgICAgICByZW1haW5pbmdfd2luZG93cyA9IHNlbGYuX3BlbmRpbmdfd2lu
+echo ZG93cyAtIDEKICAgICAgICAgICAgICAgICAgICAgICAgcmVtYWluaW5nX21pbiA9IGludCgKICAg
+echo ICAgICAgICAgICAgICAgICAgICAgICAgIHdhaXRfcyArIChyZW1haW5pbmdfd2luZG93cyAvLyBX
+echo SU5ET1dfUkVRVUVTVFNfUEVSX0hPVVIpICogUVVPVEFfUEVSSU9ECiAgICAgICAgICAgICAgICAg
+echo ICAgICAgICkgLy8gNjAKICAgICAgICAgICAgICAgICAgICAgICAgbG9nZ2VyLmluZm8oCiAgICAg
+echo ICAgICAgICAgICAgICAgICAgICAgICAiICBbJXMvJXNdIEN6ZWthbSAlLjBmcyAobGltaXQgMjAg
+echo cmVxL2gpIOKAlCBwb3pvc3RhxYJvIH4lcyBtaW4gKCVzKS4uLiIsCiAgICAgICAgICAgICAgICAg
+echo ICAgICAgICAgICB3aW5kb3dfbnVtLCB0b3RhbF93aW5kb3dzLCB3YWl0X3MsIHJlbWFpbmluZ19t
+echo aW4sIGxhYmVsLAogICAgICAgICAgICAgICAgICAgICAgICApCiAgICAgICAgICAgICAgICAgICAg
+echo aWYgc2VsZi5fY2FuY2VsbGVkLndhaXQod2FpdF9zKToKICAgICAgICAgICAgICAgICAgICAgICAg
+echo cmFpc2UgS1NlRkludm9pY2VFcnJvcihmIlBvYmllcmFuaWUgcHJ6ZXJ3YW5lICh7bGFiZWx9KSIp
+echo CiAgICAgICAgICAgICAgICB3aXRoIHNlbGYuX3BlbmRpbmdfbG9jazoKICAgICAgICAgICAgICAg
+echo ICAgICBzZWxmLl9wZW5kaW5nX3dpbmRvd3MgLT0gMQogICAgICAgICAgICAgICAgZG9uZV93aW5k
+echo b3dzICs9IDEKCiAgICAgICAgICAgICAgICB3X2Zyb20gPSB3aW5kb3dfc3RhcnQuaXNvZm9ybWF0
+echo KCkgKyBTT0RfU1VGRklYCiAgICAgICAgICAgICAgICB3X3RvICAgPSB3aW5kb3dfZW5kLmlzb2Zv
+echo cm1hdCgpICAgKyBFT0RfU1VGRklYCgogICAgICAgICAgICAgICAgYmF0Y2ggPSBzZWxmLl9mZXRj
+echo aF93aW5kb3coc3ViamVjdF90eXBlLCB3X2Zyb20sIHdfdG8sIGxhYmVsKQogICAgICAgICAgICAg
+echo ICAgYWxsX2ludm9pY2VzLmV4dGVuZChiYXRjaCkKICAgICAgICBmaW5hbGx5OgogICAgICAgICAg
+echo ICAjIFByemVyd2FuZSBwb2JpZXJhbmllIG5pZSB6YXd5xbxhIEVUQSBkcnVnaWVnbyB3xIV0a3UK
+echo ICAgICAgICAgICAgd2l0aCBzZWxmLl9wZW5kaW5nX2xvY2s6CiAgICAgICAgICAgICAgICBzZWxm
+echo Ll9wZW5kaW5nX3dpbmRvd3MgLT0gdG90YWxfd2luZG93cyAtIGRvbmVfd2luZG93cwoKICAgICAg
+echo ICBsb2dnZXIuaW5mbygi4pyTIMWBxIVjem5pZSBwb2JyYW5vOiAlcyBmYWt0dXIgKCVzKSIsIGxl
+echo bihhbGxfaW52b2ljZXMpLCBsYWJlbCkKICAgICAgICByZXR1cm4gYWxsX2ludm9pY2VzCgogICAg
+echo ZGVmIGNhbmNlbChzZWxmKSAtPiBOb25lOgogICAgICAgICIiIlByemVyeXdhIHRyd2FqxIVjZSBm
+echo ZXRjaF9hbGwgKG5wLiB3IGRydWdpbSB3xIV0a3UpIHByenkgbmFqYmxpxbxzenltIG9jemVraXdh
+echo bml1IG1pxJlkenkgb2tuYW1pLiIiIgogICAgICAgIHNlbGYuX2NhbmNlbGxlZC5zZXQoKQoKICAg
+echo IEBzdGF0aWNtZXRob2QKICAgIGRlZiB0b19pc28oZDogc3RyIHwgZGF0ZSB8IGRhdGV0aW1lLCBl
+echo bmRfb2ZfZGF5OiBib29sID0gRmFsc2UpIC0+IHN0cjoKICAgICAgICBpZiBpc2luc3RhbmNlKGQs
+echo IGRhdGV0aW1lKToKICAgICAgICAgICAgcmV0dXJuIGQuc3RyZnRpbWUoIiVZLSVtLSVkVCVIOiVN
+echo OiVTLjAwMFoiKQogICAgICAgIGlmIGlzaW5zdGFuY2UoZCwgc3RyKToKICAgICAgICAgICAgZCA9
+echo IEtTZUZJbnZvaWNlcy5fcGFyc2VfZGF0ZShkKQogICAgICAgIHJldHVybiBkLmlzb2Zvcm1hdCgp
+echo ICsgKEVPRF9TVUZGSVggaWYgZW5kX29mX2RheSBlbHNlIFNPRF9TVUZGSVgpCgogICAgQHN0YXRp
+echo Y21ldGhvZAogICAgZGVmIF9wYXJzZV9kYXRlKGQ6IHN0cikgLT4gZGF0ZToKICAgICAgICAiIiJE
+echo YXRhIHogcGllcndzenljaCAxMCB6bmFrw7N3OiBzenlia2llIGZyb21pc29mb3JtYXQsIGZhbGxi
+echo YWNrIHN0cnB0aW1lIChucC4gMjAyNS0xLTUpLiIiIgogICAgICAgIHRyeToKICAgICAgICAgICAg
+echo cmV0dXJuIGRhdGUuZnJvbWlzb2Zvcm1hdChkWzoxMF0pCiAgICAgICAgZXhjZXB0IFZhbHVlRXJy
+echo b3I6CiAgICAgICAgICAgIHJldHVybiBkYXRldGltZS5zdHJwdGltZShkWzoxMF0sICIlWS0lbS0l
+echo ZCIpLmRhdGUoKQoKICAgIEBzdGF0aWNtZXRob2QKICAgIGRlZiBfYmFja29mZihhdHRlbXB0OiBp
+echo bnQsIGJhc2U6IGZsb2F0ID0gMC41LCBjYXA6IGZsb2F0ID0gMTAuMCkgLT4gZmxvYXQ6CiAgICAg
+echo ICAgIiIiV3lrxYJhZG5pY3plIG9ww7PFum5pZW5pZSB6IGxvc293eW0gcm96cnp1dGVtIMKxNTAl
+echo ICh3xIV0a2kgbmllIHBvbmF3aWFqxIUgdyB0eW0gc2FteW0gbW9tZW5jaWUpLiIiIgogICAgICAg
+echo IHJldHVybiBtaW4oY2FwLCBiYXNlICogMiAqKiBhdHRlbXB0KSAqIHJhbmRvbS51bmlmb3JtKDAu
+echo NSwgMS41KQoKICAgIEBzdGF0aWNtZXRob2QKICAgIGRlZiBfZHVtcHMob2JqKSAtPiBieXRlczoK
+echo ICAgICAgICBpZiBvcmpzb24gaXMgbm90IE5vbmU6CiAgICAgICAgICAgIHJldHVybiBvcmpzb24u
+echo ZHVtcHMob2JqKQogICAgICAgIHJldHVybiBqc29uLmR1bXBzKG9iaiwgc2VwYXJhdG9ycz0oIiwi
+echo LCAiOiIpKS5lbmNvZGUoInV0Zi04IikKCiAgICBAc3RhdGljbWV0aG9kCiAgICBkZWYgX2pzb24o
+echo cmVzcDogcmVxdWVzdHMuUmVzcG9uc2UpOgogICAgICAgIGlmIG9yanNvbiBpcyBub3QgTm9uZToK
+echo ICAgICAgICAgICAgcmV0dXJuIG9yanNvbi5sb2FkcyhyZXNwLmNvbnRlbnQpCiAgICAgICAgcmV0
+echo dXJuIHJlc3AuanNvbigpCgogICAgQHN0YXRpY21ldGhvZAogICAgZGVmIF9yYWlzZV9mb3Jfc3Rh
+echo dHVzKHJlc3A6IHJlcXVlc3RzLlJlc3BvbnNlLCBjb250ZXh0OiBzdHIpIC0+IE5vbmU6CiAgICAg
+echo ICAgaWYgbm90IHJlc3Aub2s6CiAgICAgICAgICAgIHRyeToKICAgICAgICAgICAgICAgIGRldGFp
+echo bCA9IHJlc3AuanNvbigpCiAgICAgICAgICAgIGV4Y2VwdCBFeGNlcHRpb246CiAgICAgICAgICAg
+echo ICAgICBkZXRhaWwgPSByZXNwLnRleHRbOjUwMF0KICAgICAgICAgICAgcmFpc2UgS1NlRkludm9p
+echo Y2VFcnJvcihmIntjb250ZXh0fSDigJQgSFRUUCB7cmVzcC5zdGF0dXNfY29kZX06IHtkZXRhaWx9
+echo IikK
 ) > "%TEMP%\ksef_invoices.b64"
 certutil -decode "%TEMP%\ksef_invoices.b64" "!INSTALL_DIR!\ksef_invoices.py" >nul 2>&1
 del "%TEMP%\ksef_invoices.b64"
@@ -521,7 +808,8 @@ echo    Wyodrebniono: ksef_invoices.py
 :: --- requirements.txt ---
 (
 echo cmVxdWVzdHM9PTIuMzIuMwpjcnlwdG9ncmFwaHk9PTQzLjAuMwpweXRob24tZG90ZW52PT0xLjAu
-echo MQpvcGVucHl4bD09My4xLjUKcHl0aG9uLWRhdGV1dGlsPT0yLjkuMAo=
+echo MQpYbHN4V3JpdGVyPT0zLjIuMApweXRob24tZGF0ZXV0aWw9PTIuOS4wCm9yanNvbj09My4xMC43
+echo Cg==
 ) > "%TEMP%\ksef_req.b64"
 certutil -decode "%TEMP%\ksef_req.b64" "!INSTALL_DIR!\requirements.txt" >nul 2>&1
 del "%TEMP%\ksef_req.b64"
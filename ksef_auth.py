@@ -3,12 +3,25 @@ ksef_auth.py - KSeF API 2.0 - uwierzytelnienie Tokenem KSeF
 """
 
 import base64
+import binascii
+import functools
+import hashlib
+import os
+import random
+import socket
 import time
 import logging
+from pathlib import Path
 
 import requests
-from cryptography.hazmat.primitives import hashes, serialization
-from cryptography.hazmat.primitives.asymmetric import padding
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+from urllib3.util.retry import Retry
+
+try:
+    import orjson  # szybszy parser JSON; opcjonalny — bez niego resp.json()
+except ImportError:
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
@@ -22,11 +35,68 @@ HEADERS = {
     "Accept": "application/json",
 }
 
+# (connect, read) — szybka porażka przy braku połączenia, dłuższy odczyt odpowiedzi
+HTTP_TIMEOUT = (5, 30)  # s
+
+# Małe zapytania uwierzytelnienia: bez Nagle'a (domyślne w urllib3) + TCP keep-alive
+SOCKET_OPTIONS = HTTPConnection.default_socket_options + [
+    (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+]
+
+# Certyfikat klucza publicznego KSeF zmienia się rzadko — trzymamy go lokalnie przez dobę
+PUBLIC_KEY_CACHE_DIR = Path.home() / ".cache" / "ksef"
+PUBLIC_KEY_CACHE_TTL = 24 * 3600  # s
+
 
 class KSeFAuthError(Exception):
     pass
 
 
+class KSeFAuthRejectedError(KSeFAuthError):
+    """KSeF odrzucił uwierzytelnienie asynchronicznie (status >= 400 w kroku 5)."""
+
+
+class KSeFAdapter(HTTPAdapter):
+    """HTTPAdapter z opcjami gniazda SOCKET_OPTIONS dla wszystkich połączeń z puli."""
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs["socket_options"] = SOCKET_OPTIONS
+        super().init_poolmanager(*args, **kwargs)
+
+
+def create_session() -> requests.Session:
+    """Sesja HTTP z pulą połączeń keep-alive — jeden tunel TLS dla całego przebiegu."""
+    session = requests.Session()
+    # pool_maxsize=16: do 2 × 8 równoległych zapytań o strony (Subject1 + Subject2);
+    # bez automatycznych ponowień — 401/429 obsługuje kod klienta;
+    # read=False jak w domyślnym adapterze: przekroczony odczyt to ReadTimeout, nie ConnectionError
+    adapter = KSeFAdapter(pool_connections=4, pool_maxsize=16, max_retries=Retry(total=0, read=False))
+    session.mount("https://", adapter)
+    session.headers.update(HEADERS)
+    return session
+
+
+# cryptography importowane dopiero przy uwierzytelnieniu — szybszy start skryptu
+@functools.lru_cache(maxsize=2)
+def _load_public_key(der_bytes: bytes):
+    """Parsuje DER (klucz publiczny lub certyfikat X.509) — raz na dany certyfikat."""
+    from cryptography.hazmat.primitives import serialization
+    try:
+        return serialization.load_der_public_key(der_bytes)
+    except Exception:
+        from cryptography import x509
+        return x509.load_der_x509_certificate(der_bytes).public_key()
+
+
+@functools.lru_cache(maxsize=None)
+def _oaep_sha256():
+    """RSA-OAEP z SHA-256 (MGF1 SHA-256) — obiekt bezstanowy, tworzony raz i współdzielony."""
+    from cryptography.hazmat.primitives import hashes
+    from cryptography.hazmat.primitives.asymmetric import padding
+    sha256 = hashes.SHA256()
+    return padding.OAEP(mgf=padding.MGF1(algorithm=sha256), algorithm=sha256, label=None)
+
+
 class KSeFAuth:
 
     def __init__(self, nip: str, ksef_token: str, env: str = "test"):
@@ -35,20 +105,57 @@ class KSeFAuth:
         self.base_url = BASE_URLS.get(env, BASE_URLS["test"])
         self.access_token: str | None = None
         self.refresh_token: str | None = None
+        self.session = create_session()
+        self.public_key_cache = PUBLIC_KEY_CACHE_DIR / f"pubkey-{env}.der"
+        self.public_key_from_cache = False
+
+    def _get_public_key(self, use_cache: bool = True) -> bytes:
+        der = self._read_cached_public_key() if use_cache else None
+        self.public_key_from_cache = der is not None
+        if der is None:
+            der = self._fetch_public_key()
+            self._write_cached_public_key(der)
+        logger.info("Klucz publiczny SHA-256: %s", hashlib.sha256(der).hexdigest())
+        return der
+
+    def _read_cached_public_key(self) -> bytes | None:
+        try:
+            if time.time() - self.public_key_cache.stat().st_mtime >= PUBLIC_KEY_CACHE_TTL:
+                return None
+            der = self.public_key_cache.read_bytes()
+        except OSError:
+            return None
+        logger.info("Klucz publiczny z cache: %s", self.public_key_cache)
+        return der or None
+
+    def _write_cached_public_key(self, der: bytes) -> None:
+        tmp = self.public_key_cache.with_suffix(".tmp")
+        try:
+            self.public_key_cache.parent.mkdir(parents=True, exist_ok=True)
+            tmp.write_bytes(der)
+            os.replace(tmp, self.public_key_cache)
+        except OSError as e:
+            logger.warning("Nie udało się zapisać klucza publicznego w cache: %s", e)
 
-    def _get_public_key(self) -> bytes:
+    def _discard_cached_public_key(self) -> None:
+        try:
+            self.public_key_cache.unlink(missing_ok=True)
+        except OSError as e:
+            logger.warning("Nie udało się usunąć klucza publicznego z cache: %s", e)
+
+    def _fetch_public_key(self) -> bytes:
         url = f"{self.base_url}/security/public-key-certificates"
-        resp = requests.get(url, headers=HEADERS, timeout=30)
+        resp = self.session.get(url, timeout=HTTP_TIMEOUT)
         self._raise_for_status(resp, "Błąd pobierania klucza publicznego")
-        data = resp.json()
-        logger.info(f"Klucz publiczny RAW: {str(data)[:400]}")
+        data = self._json(resp)
+        logger.info("Klucz publiczny RAW: %.400s", data)
 
         certificates = data if isinstance(data, list) else data.get("certificates", [])
         if not certificates:
             raise KSeFAuthError("Brak certyfikatów w odpowiedzi KSeF")
 
         first = certificates[0]
-        logger.info(f"Klucz — dostępne pola: {list(first.keys())}")
+        logger.info("Klucz — dostępne pola: %s", list(first.keys()))
         der_b64 = first.get("certificate") or first.get("value") or first.get("publicKey") or ""
         if not der_b64:
             raise KSeFAuthError(f"Brak danych certyfikatu. Pola: {list(first.keys())}")
@@ -56,29 +163,16 @@ class KSeFAuth:
 
     def _get_challenge(self) -> dict:
         url = f"{self.base_url}/auth/challenge"
-        resp = requests.post(url, json={}, headers=HEADERS, timeout=30)
+        resp = self.session.post(url, json={}, timeout=HTTP_TIMEOUT)
         self._raise_for_status(resp, "Błąd pobierania challenge")
-        data = resp.json()
-        logger.info(f"Challenge RAW: {data}")
+        data = self._json(resp)
+        logger.info("Challenge RAW: %s", data)
         return data
 
-    def _encrypt_token(self, public_key_der: bytes, timestamp_ms: int) -> str:
+    def _encrypt_token(self, public_key, timestamp_ms: int) -> str:
         plaintext = f"{self.ksef_token}|{timestamp_ms}".encode("utf-8")
-        try:
-            public_key = serialization.load_der_public_key(public_key_der)
-        except Exception:
-            from cryptography import x509
-            cert = x509.load_der_x509_certificate(public_key_der)
-            public_key = cert.public_key()
-        encrypted = public_key.encrypt(
-            plaintext,
-            padding.OAEP(
-                mgf=padding.MGF1(algorithm=hashes.SHA256()),
-                algorithm=hashes.SHA256(),
-                label=None,
-            ),
-        )
-        return base64.b64encode(encrypted).decode("ascii")
+        encrypted = public_key.encrypt(plaintext, _oaep_sha256())
+        return binascii.b2a_base64(encrypted, newline=False).decode("ascii")
 
     def _send_ksef_token(self, challenge: str, encrypted_token: str) -> dict:
         url = f"{self.base_url}/auth/ksef-token"
@@ -87,23 +181,24 @@ class KSeFAuth:
             "contextIdentifier": {"type": "Nip", "value": self.nip},
             "encryptedToken": encrypted_token,
         }
-        resp = requests.post(url, json=body, headers=HEADERS, timeout=30)
+        resp = self.session.post(url, json=body, timeout=HTTP_TIMEOUT)
         self._raise_for_status(resp, "Błąd wysyłania tokena KSeF")
-        data = resp.json()
-        logger.info(f"SendKsefToken RAW: {data}")
+        data = self._json(resp)
+        logger.info("SendKsefToken RAW: %s", data)
         return data
 
     def _wait_for_auth(self, reference_number: str, auth_token: str,
-                       max_retries: int = 15, sleep_s: float = 1.5) -> None:
+                       max_retries: int = 15, base_sleep_s: float = 0.75,
+                       max_sleep_s: float = 5.0) -> None:
         url = f"{self.base_url}/auth/{reference_number}"
-        bearer_headers = {**HEADERS, "Authorization": f"Bearer {auth_token}"}
+        bearer_headers = {"Authorization": f"Bearer {auth_token}"}
 
         for attempt in range(1, max_retries + 1):
-            resp = requests.get(url, headers=bearer_headers, timeout=30)
-            logger.info(f"Auth HTTP {resp.status_code} (próba {attempt}): {resp.text[:300]}")
+            resp = self.session.get(url, headers=bearer_headers, timeout=HTTP_TIMEOUT)
+            logger.info("Auth HTTP %s (próba %s): %.300s", resp.status_code, attempt, resp.text)
 
             if resp.status_code == 200:
-                data = resp.json()
+                data = self._json(resp)
                 # API 2.0: status = {"code": 200, "description": "..."}
                 status_obj = data.get("status", {})
                 status_code = status_obj.get("code", 0)
@@ -114,34 +209,35 @@ class KSeFAuth:
                 if status_code >= 400:
                     desc = status_obj.get("description", "")
                     details = status_obj.get("details", [])
-                    raise KSeFAuthError(
+                    raise KSeFAuthRejectedError(
                         f"Uwierzytelnienie odrzucone (kod {status_code}): {desc} | {details}"
                     )
-                logger.info(f"Auth w toku, status={status_code} (próba {attempt})...")
+                logger.info("Auth w toku, status=%s (próba %s)...", status_code, attempt)
 
             elif resp.status_code == 202:
-                logger.info(f"Auth w toku HTTP 202 (próba {attempt})...")
+                logger.info("Auth w toku HTTP 202 (próba %s)...", attempt)
 
-            time.sleep(sleep_s)
+            # Krótko na początku (auth zwykle kończy się szybko), potem coraz rzadziej
+            time.sleep(self._backoff(attempt - 1, base=base_sleep_s, cap=max_sleep_s))
 
         raise KSeFAuthError("Przekroczono limit prób oczekiwania na uwierzytelnienie")
 
     def _redeem_token(self, auth_token: str) -> dict:
         url = f"{self.base_url}/auth/token/redeem"
-        bearer_headers = {**HEADERS, "Authorization": f"Bearer {auth_token}"}
-        resp = requests.post(url, json={}, headers=bearer_headers, timeout=30)
+        bearer_headers = {"Authorization": f"Bearer {auth_token}"}
+        resp = self.session.post(url, json={}, headers=bearer_headers, timeout=HTTP_TIMEOUT)
         self._raise_for_status(resp, "Błąd wymiany tokena na accessToken")
-        data = resp.json()
-        logger.info(f"Redeem RAW: {str(data)[:300]}")
+        data = self._json(resp)
+        logger.info("Redeem RAW: %.300s", data)
         return data
 
-    def authenticate(self) -> str:
+    def authenticate(self, use_cached_key: bool = True) -> str:
         logger.info("Krok 1/6: Pobieranie klucza publicznego KSeF...")
-        public_key_der = self._get_public_key()
+        public_key = _load_public_key(self._get_public_key(use_cached_key))
 
         logger.info("Krok 2/6: Pobieranie challenge...")
         challenge_resp = self._get_challenge()
-        logger.info(f"Challenge klucze: {list(challenge_resp.keys())}")
+        logger.info("Challenge klucze: %s", list(challenge_resp.keys()))
 
         challenge_id = (
             challenge_resp.get("challenge")
@@ -156,10 +252,10 @@ class KSeFAuth:
             or challenge_resp.get("timestamp")
             or int(time.time() * 1000)
         )
-        logger.info(f"challenge={challenge_id} | timestampMs={timestamp_ms}")
+        logger.info("challenge=%s | timestampMs=%s", challenge_id, timestamp_ms)
 
         logger.info("Krok 3/6: Szyfrowanie tokena KSeF (RSA-OAEP SHA-256)...")
-        encrypted_token = self._encrypt_token(public_key_der, timestamp_ms)
+        encrypted_token = self._encrypt_token(public_key, timestamp_ms)
 
         logger.info("Krok 4/6: Wysyłanie zaszyfrowanego tokena...")
         auth_resp = self._send_ksef_token(challenge_id, encrypted_token)
@@ -173,7 +269,16 @@ class KSeFAuth:
             raise KSeFAuthError(f"Brak authenticationToken. Klucze: {list(auth_resp.keys())}")
 
         logger.info("Krok 5/6: Oczekiwanie na potwierdzenie uwierzytelnienia...")
-        self._wait_for_auth(auth_ref, auth_token_value)
+        try:
+            self._wait_for_auth(auth_ref, auth_token_value)
+        except KSeFAuthRejectedError:
+            if not self.public_key_from_cache:
+                raise
+            # Token weryfikowany asynchronicznie — odrzucenie przy kluczu z cache
+            # może oznaczać wymianę certyfikatu: odrzuć cache i spróbuj raz z aktualnym kluczem
+            logger.warning("Token zaszyfrowany kluczem z cache odrzucony — pobieram aktualny klucz...")
+            self._discard_cached_public_key()
+            return self.authenticate(use_cached_key=False)
 
         logger.info("Krok 6/6: Pobieranie accessToken (JWT)...")
         tokens = self._redeem_token(auth_token_value)
@@ -200,9 +305,9 @@ class KSeFAuth:
         if not self.refresh_token:
             raise KSeFAuthError("Brak refreshToken — wykonaj najpierw authenticate()")
         url = f"{self.base_url}/auth/token/refresh"
-        resp = requests.post(url, json={"refreshToken": self.refresh_token}, headers=HEADERS, timeout=30)
+        resp = self.session.post(url, json={"refreshToken": self.refresh_token}, timeout=HTTP_TIMEOUT)
         self._raise_for_status(resp, "Błąd odświeżania accessToken")
-        data = resp.json()
+        data = self._json(resp)
         access = data.get("accessToken") or data.get("token")
         self.access_token = access.get("token") if isinstance(access, dict) else access
         refresh = data.get("refreshToken", self.refresh_token)
@@ -210,6 +315,9 @@ class KSeFAuth:
         logger.info("✓ accessToken odświeżony.")
         return self.access_token
 
+    def close(self) -> None:
+        self.session.close()
+
     def get_auth_headers(self) -> dict:
         if not self.access_token:
             raise KSeFAuthError("Brak accessToken — wykonaj najpierw authenticate()")
@@ -219,6 +327,17 @@ class KSeFAuth:
             "Authorization": f"Bearer {self.access_token}",
         }
 
+    @staticmethod
+    def _backoff(attempt: int, base: float = 0.5, cap: float = 10.0) -> float:
+        """Wykładnicze opóźnienie z losowym rozrzutem ±50% (bez synchronicznych ponowień)."""
+        return min(cap, base * 2 ** attempt) * random.uniform(0.5, 1.5)
+
+    @staticmethod
+    def _json(resp: requests.Response):
+        if orjson is not None:
+            return orjson.loads(resp.content)
+        return resp.json()
+
     @staticmethod
     def _raise_for_status(resp: requests.Response, context: str) -> None:
         if not resp.ok:
@@ -5,22 +5,54 @@ Moduł pobierania listy faktur z KSeF API 2.0.
 
 Endpoint: POST /invoices/query/metadata
 Limit produkcyjny: 20 req/h (sliding window).
-Skrypt automatycznie dzieli długi zakres na okna 3-miesięczne i czeka
-185 s między oknami, aby zmieścić się w limicie 20 req/h.
+Skrypt automatycznie dzieli długi zakres na okna 3-miesięczne i liczy
+zapytania w przesuwnym oknie godzinnym — czeka tylko wtedy, gdy kolejne
+okno przekroczyłoby limit 20 req/h.
 """
 
+import json
 import logging
+import random
+import threading
 import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, date, timedelta
-from dateutil.relativedelta import relativedelta
 
 import requests
 
+from ksef_auth import create_session
+
+try:
+    import orjson  # szybszy parser JSON; opcjonalny — bez niego resp.json()
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 # Limit produkcyjny: 20 req/h → 3600/20 = 180 s/req; +5 s margines bezpieczeństwa
+# (górna granica oczekiwania po HTTP 429 bez nagłówka Retry-After)
 SLEEP_BETWEEN_WINDOWS = 185  # s
 
+# Okna 3-miesięczne w przesuwnym oknie godzinnym (limit 20 req/h, 1 zapytanie zapasu)
+WINDOW_REQUESTS_PER_HOUR = 19
+QUOTA_PERIOD = 3600  # s
+
+# (connect, read) — odpowiedź z dużą stroną faktur może się generować dłużej
+QUERY_TIMEOUT = (5, 60)  # s
+
+# Limit 8 req/s — wspólny dla wszystkich wątków korzystających z klienta
+MAX_REQUESTS_PER_SECOND = 8
+
+# Paginacja w obrębie okna: do 8 stron pobieranych równolegle
+PAGE_CONCURRENCY = 8
+
+# Sufiksy czasu dla granic zakresu dat (format ISO 8601 oczekiwany przez KSeF)
+SOD_SUFFIX = "T00:00:00.000Z"  # początek dnia
+EOD_SUFFIX = "T23:59:59.000Z"  # koniec dnia
+
+ONE_DAY = timedelta(days=1)
+
 SUBJECT_TYPE_LABELS = {
     "Subject1": "Wystawione (sprzedaż)",
     "Subject2": "Otrzymane (zakupy/koszty)",
@@ -31,154 +63,299 @@ class KSeFInvoiceError(Exception):
     pass
 
 
+class RateLimiter:
+    """Okno przesuwne: co najwyżej max_calls wywołań acquire() w ciągu period sekund (thread-safe)."""
+
+    def __init__(self, max_calls: int, period: float):
+        self.max_calls = max_calls
+        self.period = period
+        self._calls: deque[float] = deque()
+        self._lock = threading.Lock()
+
+    def _prune(self, now: float) -> None:
+        while self._calls and now - self._calls[0] >= self.period:
+            self._calls.popleft()
+
+    def delay(self) -> float:
+        """Liczba sekund do zwolnienia miejsca w oknie (0 — można od razu)."""
+        with self._lock:
+            now = time.monotonic()
+            self._prune(now)
+            if len(self._calls) < self.max_calls:
+                return 0.0
+            return self.period - (now - self._calls[0])
+
+    def try_acquire(self) -> bool:
+        """Jak acquire(), ale bez czekania — False, gdy okno jest pełne."""
+        with self._lock:
+            now = time.monotonic()
+            self._prune(now)
+            if len(self._calls) < self.max_calls:
+                self._calls.append(now)
+                return True
+            return False
+
+    def acquire(self) -> None:
+        with self._lock:
+            while True:
+                now = time.monotonic()
+                self._prune(now)
+                if len(self._calls) < self.max_calls:
+                    self._calls.append(now)
+                    return
+                time.sleep(self.period - (now - self._calls[0]))
+
+
 class KSeFInvoices:
 
-    def __init__(self, base_url: str, auth_headers: dict, page_size: int = 100, auth=None):
+    def __init__(self, base_url: str, auth_headers: dict, page_size: int = 100, auth=None,
+                 session: requests.Session | None = None):
         self.base_url = base_url
         self.auth_headers = auth_headers
         self.page_size = min(max(page_size, 1), 1000)
         self.auth = auth  # KSeFAuth — do auto-odświeżenia tokena przy 401
-
-    def _query_page(self, subject_type: str, date_from: str, date_to: str,
-                    page_offset: int) -> dict:
-        """Pobiera jedną stronę wyników z /invoices/query/metadata"""
+        # Wspólna sesja z KSeFAuth — paginacja korzysta z tego samego połączenia keep-alive;
+        # bez auth własna sesja z tą samą pulą połączeń (KSeFAdapter) i nagłówkami
+        if session is None:
+            session = auth.session if auth is not None else create_session()
+        self.session = session
+        self._auth_lock = threading.Lock()
+        self._rate_limiter = RateLimiter(MAX_REQUESTS_PER_SECOND, 1.0)
+        self._cancelled = threading.Event()
+        # Limit 20 req/h dotyczy endpointu — jeden licznik dla Subject1 i Subject2
+        self._window_limiter = RateLimiter(WINDOW_REQUESTS_PER_HOUR, QUOTA_PERIOD)
+        self._pending_windows = 0  # okna wszystkich wątków czekające na zapytanie (do ETA)
+        self._pending_lock = threading.Lock()
+
+    def _query_page(self, body: bytes, date_from: str, page_offset: int) -> dict:
+        """
+        Pobiera jedną stronę wyników z /invoices/query/metadata.
+        body to gotowy JSON zapytania (stały dla całego okna) — zmienia się tylko pageOffset.
+        """
         url = f"{self.base_url}/invoices/query/metadata"
         params = {
             "pageSize": self.page_size,
             "pageOffset": page_offset,
         }
-        body = {
-            "subjectType": subject_type,
-            "dateRange": {
-                "dateType": "Invoicing",
-                "from": date_from,
-                "to": date_to,
-            },
-        }
         for attempt in range(1, 6):
-            resp = requests.post(url, json=body, params=params, headers=self.auth_headers, timeout=60)
+            auth_headers = self.auth_headers
+            # body to gotowe bajty (data=) — requests nie doda Content-Type sam, jak przy json=
+            headers = {**auth_headers, "Content-Type": "application/json"}
+            self._rate_limiter.acquire()
+            resp = self.session.post(url, data=body, params=params, headers=headers, timeout=QUERY_TIMEOUT)
             if resp.status_code == 401 and self.auth is not None:
-                # Token wygasł — re-auth w miejscu, bez utraty postępu
-                logger.warning(f"accessToken wygasł (próba {attempt}/5) — ponowne uwierzytelnienie...")
-                self.auth.authenticate()
-                self.auth_headers = self.auth.get_auth_headers()
+                # Token wygasł — re-auth w miejscu, bez utraty postępu.
+                # Strony pobierane są równolegle: uwierzytelnia tylko pierwszy wątek,
+                # pozostałe ponawiają zapytanie z już odświeżonymi nagłówkami.
+                with self._auth_lock:
+                    if self.auth_headers is auth_headers:
+                        logger.warning("accessToken wygasł (próba %s/5) — ponowne uwierzytelnienie...", attempt)
+                        time.sleep(self._backoff(0, base=0.5, cap=1.0))
+                        self.auth.authenticate()
+                        self.auth_headers = self.auth.get_auth_headers()
                 continue
             if resp.status_code == 429:
-                # Czytaj Retry-After z nagłówka HTTP (standard); fallback: 185 s
-                retry_after = int(resp.headers.get("Retry-After", SLEEP_BETWEEN_WINDOWS)) + 2
+                if attempt == 5:
+                    break  # ostatnia próba — bez czekania, od razu błąd
+                # Czytaj Retry-After z nagłówka HTTP (standard);
+                # fallback: co najmniej SLEEP_BETWEEN_WINDOWS (jeden slot limitu 20 req/h)
+                # lub do zwolnienia miejsca w limicie godzinnym, z rozrzutem w górę
+                if "Retry-After" in resp.headers:
+                    retry_after = int(resp.headers["Retry-After"]) + 2
+                else:
+                    retry_after = max(SLEEP_BETWEEN_WINDOWS, self._window_limiter.delay())
+                    retry_after *= random.uniform(1.0, 1.1)
                 logger.warning(
-                    f"HTTP 429 — rate limit, czekam {retry_after}s "
-                    f"(próba {attempt}/5)..."
+                    "HTTP 429 — rate limit, czekam %.0fs (próba %s/5)...", retry_after, attempt
                 )
-                time.sleep(retry_after)
+                if self._cancelled.wait(retry_after):
+                    raise KSeFInvoiceError(f"Pobieranie przerwane (offset={page_offset}, od={date_from})")
                 continue
             self._raise_for_status(resp, f"Błąd zapytania o faktury (offset={page_offset}, od={date_from})")
-            data = resp.json()
+            data = self._json(resp)
             return data
         raise KSeFInvoiceError(
             f"Błąd zapytania o faktury (offset={page_offset}, od={date_from}) "
             f"— przekroczono limit prób"
         )
 
-    def _fetch_window(self, subject_type: str, date_from: str, date_to: str) -> list[dict]:
-        """Pobiera wszystkie strony dla jednego okna czasowego (max 3 miesiące)."""
-        label = SUBJECT_TYPE_LABELS.get(subject_type, subject_type)
-        all_invoices = []
-        offset = 0
-
-        while True:
-            data = self._query_page(subject_type, date_from, date_to, offset)
-            invoices = data.get("invoices", [])  # KSeF API 2.0: pole "invoices"
-
-            if invoices and offset == 0:
-                logger.info(f"  Okno {date_from[:10]}–{date_to[:10]}: znaleziono faktury ({label})")
-
-            if not invoices:
-                break
-
-            for inv in invoices:
-                inv["_typ"] = label
-
-            all_invoices.extend(invoices)
-            offset += len(invoices)
-
-            # KSeF API 2.0: paginacja przez hasMore (nie totalCount)
-            if not data.get("hasMore", False):
-                break
+    def _fetch_window(self, subject_type: str, date_from: str, date_to: str,
+                      label: str) -> list[dict]:
+        """
+        Pobiera wszystkie strony dla jednego okna czasowego (max 3 miesiące).
 
-            time.sleep(0.3)  # między stronami paginacji (limit 8 req/s jest OK)
+        Pierwsza strona mówi, czy są kolejne (hasMore); dalsze strony pobierane są
+        równolegle partiami 1, 2, 4, ... do PAGE_CONCURRENCY zapytań (tempo pilnuje
+        RateLimiter), a wyniki łączone w kolejności offsetów.
+        """
+        body = self._dumps({
+            "subjectType": subject_type,
+            "dateRange": {
+                "dateType": "Invoicing",
+                "from": date_from,
+                "to": date_to,
+            },
+        })
+
+        data = self._query_page(body, date_from, 0)
+        invoices = data.get("invoices", [])  # KSeF API 2.0: pole "invoices"
+        if not invoices:
+            return []
+
+        logger.info("  Okno %.10s–%.10s: znaleziono faktury (%s)", date_from, date_to, label)
+        all_invoices = list(invoices)
+        offset = len(invoices)
+        has_more = data.get("hasMore", False)  # KSeF API 2.0: paginacja przez hasMore (nie totalCount)
+
+        if has_more:
+            # Krok offsetów = faktyczna długość strony (serwer może ograniczyć pageSize)
+            stride = len(invoices)
+            batch_size = 1  # 1, 2, 4, ... PAGE_CONCURRENCY — „jeszcze jedna strona” to jedno zapytanie
+            speculate = True
+            with ThreadPoolExecutor(max_workers=PAGE_CONCURRENCY) as pool:
+                while has_more:
+                    offsets = [offset + i * stride for i in range(batch_size)]
+                    pages = pool.map(
+                        lambda o: self._query_page(body, date_from, o), offsets
+                    )
+                    for page_offset, page in zip(offsets, pages):
+                        if page_offset != offset:
+                            # Poprzednia strona była niepełna — dalsze offsety są nieaktualne
+                            break
+                        invoices = page.get("invoices", [])
+                        all_invoices.extend(invoices)
+                        offset += len(invoices)
+                        has_more = bool(invoices) and page.get("hasMore", False)
+                        if len(invoices) < stride:
+                            # Strona krótsza niż krok — dalej tylko po kolei, bez zgadywania offsetów
+                            speculate = False
+                        if not has_more:
+                            break
+                    batch_size = min(batch_size * 2, PAGE_CONCURRENCY) if speculate else 1
 
         return all_invoices
 
     @staticmethod
-    def _count_windows(dt_from: datetime, dt_to: datetime) -> int:
-        count = 0
+    def _iter_windows(dt_from: date, dt_to: date) -> list[tuple[date, date]]:
+        """Dzieli zakres [dt_from, dt_to] na kolejne okna 3-miesięczne (start, koniec)."""
+        from dateutil.relativedelta import relativedelta  # potrzebne tylko tutaj
+
+        # Okno zapytania: 3 miesiące minus jeden dzień (koniec okna włącznie)
+        window_span = relativedelta(months=3, days=-1)
+        windows = []
         start = dt_from
         while start <= dt_to:
-            end = min(start + relativedelta(months=3) - timedelta(days=1), dt_to)
-            count += 1
-            start = end + timedelta(days=1)
-        return count
+            end = min(start + window_span, dt_to)
+            windows.append((start, end))
+            start = end + ONE_DAY
+        return windows
 
     def fetch_all(self, subject_type: str, date_from: str, date_to: str) -> list[dict]:
         """
         Pobiera wszystkie faktury w zakresie dat, automatycznie dzieląc
         na okna 3-miesięczne (limit API: 20 req/h).
-        Między oknami czeka SLEEP_BETWEEN_WINDOWS sekund.
+        Do WINDOW_REQUESTS_PER_HOUR okien na godzinę idzie bez czekania — łącznie
+        dla wszystkich wywołań fetch_all tego klienta (także równoległych);
+        kolejne czekają, aż najstarsze zapytanie wypadnie z okna godzinnego.
+        Faktury zwracane są bez modyfikacji — typ (SUBJECT_TYPE_LABELS)
+        dopisywany jest dopiero przy zapisie arkusza.
         """
         label = SUBJECT_TYPE_LABELS.get(subject_type, subject_type)
 
-        dt_from = datetime.strptime(date_from[:10], "%Y-%m-%d")
-        dt_to   = datetime.strptime(date_to[:10],   "%Y-%m-%d")
+        dt_from = self._parse_date(date_from)
+        dt_to   = self._parse_date(date_to)
 
-        total_windows = self._count_windows(dt_from, dt_to)
-        eta_min = (total_windows * SLEEP_BETWEEN_WINDOWS) // 60
+        windows = self._iter_windows(dt_from, dt_to)
+        total_windows = len(windows)
+        limiter = self._window_limiter
+        with self._pending_lock:
+            self._pending_windows += total_windows
+            pending = self._pending_windows
+        eta_min = (max(pending - 1, 0) // WINDOW_REQUESTS_PER_HOUR) * QUOTA_PERIOD // 60
 
-        logger.info(f"Pobieranie faktur: {label}")
+        logger.info("Pobieranie faktur: %s", label)
         logger.info(
-            f"Zakres: {date_from[:10]} → {date_to[:10]} | "
-            f"{total_windows} okien 3-miesięcznych | "
-            f"szac. czas: ~{eta_min} min"
+            "Zakres: %.10s → %.10s | %s okien 3-miesięcznych | szac. czas: ~%s min",
+            date_from, date_to, total_windows, eta_min,
         )
 
         all_invoices = []
-        window_start = dt_from
-        window_num   = 0
-
-        while window_start <= dt_to:
-            window_num += 1
-            window_end = min(window_start + relativedelta(months=3) - timedelta(days=1), dt_to)
+        done_windows = 0
+
+        try:
+            for window_num, (window_start, window_end) in enumerate(windows, start=1):
+                if self._cancelled.is_set():
+                    raise KSeFInvoiceError(f"Pobieranie przerwane ({label})")
+                # Limiter wspólny dla obu wątków — zwolnione miejsce może zająć drugi wątek,
+                # więc czekamy (przerywalnie) aż try_acquire() faktycznie się uda
+                while not limiter.try_acquire():
+                    wait_s = limiter.delay()
+                    if wait_s > 0:
+                        # W kolejce liczą się też okna drugiego typu faktur
+                        with self._pending_lock:
+                            remaining_windows = self._pending_windows - 1
+                        remaining_min = int(
+                            wait_s + (remaining_windows // WINDOW_REQUESTS_PER_HOUR) * QUOTA_PERIOD
+                        ) // 60
+                        logger.info(
+                            "  [%s/%s] Czekam %.0fs (limit 20 req/h) — pozostało ~%s min (%s)...",
+                            window_num, total_windows, wait_s, remaining_min, label,
+                        )
+                    if self._cancelled.wait(wait_s):
+                        raise KSeFInvoiceError(f"Pobieranie przerwane ({label})")
+                with self._pending_lock:
+                    self._pending_windows -= 1
+                done_windows += 1
+
+                w_from = window_start.isoformat() + SOD_SUFFIX
+                w_to   = window_end.isoformat()   + EOD_SUFFIX
+
+                batch = self._fetch_window(subject_type, w_from, w_to, label)
+                all_invoices.extend(batch)
+        finally:
+            # Przerwane pobieranie nie zawyża ETA drugiego wątku
+            with self._pending_lock:
+                self._pending_windows -= total_windows - done_windows
+
+        logger.info("✓ Łącznie pobrano: %s faktur (%s)", len(all_invoices), label)
+        return all_invoices
 
-            w_from = self.to_iso(window_start.date(), end_of_day=False)
-            w_to   = self.to_iso(window_end.date(),   end_of_day=True)
+    def cancel(self) -> None:
+        """Przerywa trwające fetch_all (np. w drugim wątku) przy najbliższym oczekiwaniu między oknami."""
+        self._cancelled.set()
 
-            batch = self._fetch_window(subject_type, w_from, w_to)
-            all_invoices.extend(batch)
+    @staticmethod
+    def to_iso(d: str | date | datetime, end_of_day: bool = False) -> str:
+        if isinstance(d, datetime):
+            return d.strftime("%Y-%m-%dT%H:%M:%S.000Z")
+        if isinstance(d, str):
+            d = KSeFInvoices._parse_date(d)
+        return d.isoformat() + (EOD_SUFFIX if end_of_day else SOD_SUFFIX)
 
-            window_start = window_end + timedelta(days=1)
+    @staticmethod
+    def _parse_date(d: str) -> date:
+        """Data z pierwszych 10 znaków: szybkie fromisoformat, fallback strptime (np. 2025-1-5)."""
+        try:
+            return date.fromisoformat(d[:10])
+        except ValueError:
+            return datetime.strptime(d[:10], "%Y-%m-%d").date()
 
-            if window_start <= dt_to:
-                remaining_windows = total_windows - window_num
-                remaining_min     = (remaining_windows * SLEEP_BETWEEN_WINDOWS) // 60
-                logger.info(
-                    f"  [{window_num}/{total_windows}] Czekam {SLEEP_BETWEEN_WINDOWS}s "
-                    f"(limit 20 req/h) — pozostało ~{remaining_min} min..."
-                )
-                time.sleep(SLEEP_BETWEEN_WINDOWS)
+    @staticmethod
+    def _backoff(attempt: int, base: float = 0.5, cap: float = 10.0) -> float:
+        """Wykładnicze opóźnienie z losowym rozrzutem ±50% (wątki nie ponawiają w tym samym momencie)."""
+        return min(cap, base * 2 ** attempt) * random.uniform(0.5, 1.5)
 
-        logger.info(f"✓ Łącznie pobrano: {len(all_invoices)} faktur ({label})")
-        return all_invoices
+    @staticmethod
+    def _dumps(obj) -> bytes:
+        if orjson is not None:
+            return orjson.dumps(obj)
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")
 
     @staticmethod
-    def to_iso(d: str | date | datetime, end_of_day: bool = False) -> str:
-        if isinstance(d, str):
-            d = datetime.strptime(d[:10], "%Y-%m-%d").date()
-        if isinstance(d, date) and not isinstance(d, datetime):
-            if end_of_day:
-                d = datetime(d.year, d.month, d.day, 23, 59, 59)
-            else:
-                d = datetime(d.year, d.month, d.day, 0, 0, 0)
-        return d.strftime("%Y-%m-%dT%H:%M:%S.000Z")
+    def _json(resp: requests.Response):
+        if orjson is not None:
+            return orjson.loads(resp.content)
+        return resp.json()
 
     @staticmethod
     def _raise_for_status(resp: requests.Response, context: str) -> None:
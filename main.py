@@ -14,15 +14,14 @@ import logging
 import os
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from operator import itemgetter
 from pathlib import Path
 
 from dotenv import load_dotenv
-import openpyxl
-from openpyxl.styles import Font, PatternFill, Alignment
-from openpyxl.utils import get_column_letter
 
 from ksef_auth import KSeFAuth, KSeFAuthError
-from ksef_invoices import KSeFInvoices, KSeFInvoiceError
+from ksef_invoices import KSeFInvoices, KSeFInvoiceError, SUBJECT_TYPE_LABELS
 
 # ------------------------------------------------------------------
 # Konfiguracja logowania
@@ -77,104 +76,142 @@ INVOICE_COLUMNS = [
 ]
 
 
-def flatten_invoice(inv: dict) -> dict:
+_EMPTY: dict = {}  # wspólny pusty słownik dla brakujących pól zagnieżdżonych — DO NOT MUTATE
+
+
+def flatten_invoice(inv: dict, label: str = "") -> dict:
     """
     Spłaszcza zagnieżdżone pola faktury do jednopoziomowego słownika.
     KSeF API 2.0 zwraca seller.name, seller.nip, buyer.name, buyer.identifier.value itp.
+    Zawiera wszystkie klucze z INVOICE_COLUMNS; _typ to etykieta arkusza.
     """
-    flat: dict = {}
-
-    for key, _ in INVOICE_COLUMNS:
-        if key == "seller_name":
-            flat[key] = (inv.get("seller") or {}).get("name", "")
-        elif key == "seller_nip":
-            flat[key] = (inv.get("seller") or {}).get("nip", "")
-        elif key == "buyer_name":
-            flat[key] = (inv.get("buyer") or {}).get("name", "")
-        elif key == "buyer_nip":
-            # buyer.identifier.value (NIP nabywcy zagnieżdżony głębiej)
-            flat[key] = ((inv.get("buyer") or {}).get("identifier") or {}).get("value", "")
-        else:
-            flat[key] = inv.get(key, "")
-
-    return flat
+    get    = inv.get
+    seller = get("seller") or _EMPTY
+    buyer  = get("buyer") or _EMPTY
+    # buyer.identifier.value (NIP nabywcy zagnieżdżony głębiej)
+    buyer_id = buyer.get("identifier") or _EMPTY
+    return {
+        "_typ":          label,
+        "ksefNumber":    get("ksefNumber", ""),
+        "invoiceNumber": get("invoiceNumber", ""),
+        "invoiceType":   get("invoiceType", ""),
+        "issueDate":     get("issueDate", ""),
+        "invoicingDate": get("invoicingDate", ""),
+        "seller_name":   seller.get("name", ""),
+        "seller_nip":    seller.get("nip", ""),
+        "buyer_name":    buyer.get("name", ""),
+        "buyer_nip":     buyer_id.get("value", ""),
+        "netAmount":     get("netAmount", ""),
+        "vatAmount":     get("vatAmount", ""),
+        "grossAmount":   get("grossAmount", ""),
+        "currency":      get("currency", ""),
+    }
 
 
 # ------------------------------------------------------------------
 # Zapis do Excel
 # ------------------------------------------------------------------
-HEADER_FILL  = PatternFill("solid", fgColor="1F4E79")  # ciemnoniebieski
-HEADER_FONT  = Font(color="FFFFFF", bold=True, size=11)
-ALT_ROW_FILL = PatternFill("solid", fgColor="D6E4F0")  # jasnobłękitny
+HEADER_FORMAT  = {
+    "bold": True, "font_color": "#FFFFFF", "font_size": 11,
+    "bg_color": "#1F4E79",  # ciemnoniebieski
+    "align": "center", "valign": "vcenter", "text_wrap": True,
+}
+DATA_FORMAT    = {"valign": "top"}
+ALT_ROW_FORMAT = {**DATA_FORMAT, "bg_color": "#D6E4F0"}  # jasnobłękitny
+TITLE_FORMAT   = {"bold": True, "font_size": 14}
+
+FORMATS = {
+    "header":  HEADER_FORMAT,
+    "data":    DATA_FORMAT,
+    "alt_row": ALT_ROW_FORMAT,
+    "title":   TITLE_FORMAT,
+}
 
+COLUMN_WIDTHS = [28, 36, 22, 18, 18, 22, 36, 16, 36, 16, 14, 14, 14, 10]
+COLUMN_KEYS   = [c[0] for c in INVOICE_COLUMNS]
+COLUMN_LABELS = [c[1] for c in INVOICE_COLUMNS]
+# Wartości wiersza w kolejności INVOICE_COLUMNS — po kluczu, nie po kolejności słownika
+_row_values   = itemgetter(*COLUMN_KEYS)
+LAST_COL      = len(INVOICE_COLUMNS) - 1  # indeks ostatniej kolumny (od 0) — dla autofiltra
 
-def write_sheet(ws, invoices: list[dict], title: str) -> None:
-    """Zapisuje listę faktur do arkusza Excel z formatowaniem."""
 
-    col_keys   = [c[0] for c in INVOICE_COLUMNS]
-    col_labels = [c[1] for c in INVOICE_COLUMNS]
+def write_sheet(ws, invoices: list[dict], title: str, label: str, formats: dict) -> None:
+    """
+    Zapisuje listę faktur do arkusza Excel z formatowaniem.
+    Workbook w trybie constant_memory — wiersze zapisywane są po kolei
+    i od razu zrzucane na dysk, więc kolumny, wysokość nagłówka
+    i zamrożenie ustawiamy przed pierwszym wierszem.
+    Kolumna „Typ faktury” to stała label, wspólna dla całego arkusza.
+    """
 
-    # Nagłówek
-    ws.append(col_labels)
-    for col_idx, _ in enumerate(col_labels, start=1):
-        cell = ws.cell(row=1, column=col_idx)
-        cell.fill = HEADER_FILL
-        cell.font = HEADER_FONT
-        cell.alignment = Alignment(horizontal="center", vertical="center", wrap_text=True)
+    # Szerokości kolumn
+    for col_idx, width in enumerate(COLUMN_WIDTHS):
+        ws.set_column(col_idx, col_idx, width)
 
-    ws.row_dimensions[1].height = 28
+    # Zamrożenie nagłówka
+    ws.freeze_panes(1, 0)
+
+    # Nagłówek
+    ws.set_row(0, 28)
+    ws.write_row(0, 0, COLUMN_LABELS, formats["header"])
 
     # Dane
-    for row_idx, inv in enumerate(invoices, start=2):
-        flat = flatten_invoice(inv)
-        for col_idx, key in enumerate(col_keys, start=1):
-            cell = ws.cell(row=row_idx, column=col_idx)
-            cell.value = flat.get(key, "")
-            cell.alignment = Alignment(vertical="top", wrap_text=False)
-            if row_idx % 2 == 0:
-                cell.fill = ALT_ROW_FILL
+    data_fmt, alt_fmt = formats["data"], formats["alt_row"]
+    for row_idx, inv in enumerate(invoices, start=1):
+        # co drugi wiersz wypełniony (wiersze 2, 4, ... w numeracji Excela)
+        fmt = alt_fmt if row_idx % 2 else data_fmt
+        ws.write_row(row_idx, 0, _row_values(flatten_invoice(inv, label)), fmt)
 
-    # Szerokości kolumn
-    column_widths = [28, 36, 22, 18, 18, 22, 36, 16, 36, 16, 14, 14, 14, 10]
-    for col_idx, width in enumerate(column_widths, start=1):
-        ws.column_dimensions[get_column_letter(col_idx)].width = width
+    # Autofiltr — zakres znany z góry: nagłówek + len(invoices) wierszy, bez skanowania arkusza
+    ws.autofilter(0, 0, len(invoices), LAST_COL)
 
-    # Zamrożenie nagłówka
-    ws.freeze_panes = "A2"
 
-    # Autofiltr
-    ws.auto_filter.ref = ws.dimensions
+def add_formats(wb) -> dict:
+    """
+    Rejestruje wszystkie formaty w skoroszycie jeden raz — komórki odwołują się
+    do nich przez indeks w styles.xml, żaden format nie jest tworzony w pętli.
+    """
+    return {name: wb.add_format(spec) for name, spec in FORMATS.items()}
 
 
 def save_to_excel(wystawione: list[dict], otrzymane: list[dict], path: Path) -> None:
     """Tworzy plik Excel z dwoma arkuszami."""
-    wb = openpyxl.Workbook()
+    import xlsxwriter  # importowane dopiero przy zapisie — szybszy start, gdy skrypt kończy się wcześniej
+
+    wb = xlsxwriter.Workbook(str(path), {
+        "constant_memory": True,
+        "strings_to_formulas": False,
+        "strings_to_urls": False,
+    })
+    formats = add_formats(wb)
 
     # Arkusz 1 — Wystawione
-    ws1 = wb.active
-    ws1.title = "Wystawione"
-    write_sheet(ws1, wystawione, "Wystawione")
+    ws1 = wb.add_worksheet("Wystawione")
+    write_sheet(ws1, wystawione, "Wystawione", SUBJECT_TYPE_LABELS["Subject1"], formats)
 
     # Arkusz 2 — Otrzymane
-    ws2 = wb.create_sheet("Otrzymane")
-    write_sheet(ws2, otrzymane, "Otrzymane")
+    ws2 = wb.add_worksheet("Otrzymane")
+    write_sheet(ws2, otrzymane, "Otrzymane", SUBJECT_TYPE_LABELS["Subject2"], formats)
 
     # Arkusz 3 — Podsumowanie
-    ws3 = wb.create_sheet("Podsumowanie")
-    ws3.append(["KSeF API 2.0 — Pobieranie faktur"])
-    ws3.append([])
-    ws3.append(["NIP firmy:",       NIP])
-    ws3.append(["Środowisko:",      ENV.upper()])
-    ws3.append(["Zakres dat:",      f"{DATE_FROM_STR} — {DATE_TO_STR}"])
-    ws3.append(["Faktur wystawionych:", len(wystawione)])
-    ws3.append(["Faktur otrzymanych:",  len(otrzymane)])
-    ws3.append(["Łącznie:",             len(wystawione) + len(otrzymane)])
-
-    ws3.column_dimensions["A"].width = 28
-    ws3.column_dimensions["B"].width = 30
-    ws3["A1"].font = Font(bold=True, size=14)
-
-    wb.save(path)
+    ws3 = wb.add_worksheet("Podsumowanie")
+    ws3.set_column(0, 0, 28)
+    ws3.set_column(1, 1, 30)
+    summary = [
+        ["KSeF API 2.0 — Pobieranie faktur"],
+        [],
+        ["NIP firmy:",       NIP],
+        ["Środowisko:",      ENV.upper()],
+        ["Zakres dat:",      f"{DATE_FROM_STR} — {DATE_TO_STR}"],
+        ["Faktur wystawionych:", len(wystawione)],
+        ["Faktur otrzymanych:",  len(otrzymane)],
+        ["Łącznie:",             len(wystawione) + len(otrzymane)],
+    ]
+    ws3.write(0, 0, summary[0][0], formats["title"])
+    for row_idx, row in enumerate(summary[1:], start=1):
+        ws3.write_row(row_idx, 0, row)
+
+    wb.close()
 
 
 # ------------------------------------------------------------------
@@ -193,7 +230,7 @@ def main() -> None:
         )
         sys.exit(1)
 
-    logger.info(f"NIP: {NIP} | Środowisko: {ENV.upper()} | Zakres: {DATE_FROM_STR} — {DATE_TO_STR}")
+    logger.info("NIP: %s | Środowisko: %s | Zakres: %s — %s", NIP, ENV.upper(), DATE_FROM_STR, DATE_TO_STR)
 
     # ------------------------------------------------------------------
     # 1. Uwierzytelnienie
@@ -202,7 +239,7 @@ def main() -> None:
     try:
         auth.authenticate()
     except KSeFAuthError as e:
-        logger.error(f"Błąd uwierzytelnienia: {e}")
+        logger.error("Błąd uwierzytelnienia: %s", e)
         sys.exit(1)
 
     auth_headers = auth.get_auth_headers()
@@ -213,39 +250,53 @@ def main() -> None:
     # ------------------------------------------------------------------
     date_from = KSeFInvoices.to_iso(DATE_FROM_STR, end_of_day=False)
     date_to   = KSeFInvoices.to_iso(DATE_TO_STR,   end_of_day=True)
-    logger.info(f"Zakres dat ISO: {date_from}  →  {date_to}")
+    logger.info("Zakres dat ISO: %s  →  %s", date_from, date_to)
 
     # ------------------------------------------------------------------
     # 3. Pobieranie faktur
     # ------------------------------------------------------------------
-    # auth przekazany do klienta — obsłuży wygaśnięcie tokena (401) automatycznie
-    client = KSeFInvoices(base_url=BASE_URL, auth_headers=auth_headers, page_size=PAGE_SIZE, auth=auth)
+    # auth przekazany do klienta — obsłuży wygaśnięcie tokena (401) automatycznie;
+    # wspólna sesja HTTP = jedna pula połączeń dla uwierzytelnienia i pobierania
+    client = KSeFInvoices(base_url=BASE_URL, auth_headers=auth_headers, page_size=PAGE_SIZE,
+                          auth=auth, session=auth.session)
 
-    wystawione: list[dict] = []
-    otrzymane:  list[dict] = []
+    # Wystawione (Subject1) i otrzymane (Subject2) to niezależne zapytania —
+    # pobierane w dwóch wątkach, więc oczekiwania między oknami nakładają się
+    results: dict[str, list[dict]] = {}
 
+    logger.info("\n--- FAKTURY WYSTAWIONE I OTRZYMANE (równolegle) ---")
+    pool = ThreadPoolExecutor(max_workers=2)
     try:
-        logger.info("\n--- FAKTURY WYSTAWIONE ---")
-        wystawione = client.fetch_all("Subject1", date_from, date_to)
-
-        logger.info("\n--- FAKTURY OTRZYMANE ---")
-        otrzymane = client.fetch_all("Subject2", date_from, date_to)
+        futures = {
+            pool.submit(client.fetch_all, subject_type, date_from, date_to): subject_type
+            for subject_type in ("Subject1", "Subject2")
+        }
+        for future in as_completed(futures):
+            results[futures[future]] = future.result()
 
     except KSeFInvoiceError as e:
-        logger.error(f"Błąd pobierania faktur: {e}")
+        logger.error("Błąd pobierania faktur: %s", e)
         sys.exit(1)
 
+    finally:
+        client.cancel()  # drugi wątek nie czeka na kolejne okno, gdy pierwszy zawiódł
+        pool.shutdown(wait=True, cancel_futures=True)
+        auth.close()
+
+    wystawione = results["Subject1"]
+    otrzymane  = results["Subject2"]
+
     # ------------------------------------------------------------------
     # 4. Zapis do Excel
     # ------------------------------------------------------------------
-    logger.info(f"\nZapisywanie do pliku: {OUTPUT_FILE.name} ...")
+    logger.info("\nZapisywanie do pliku: %s ...", OUTPUT_FILE.name)
     save_to_excel(wystawione, otrzymane, OUTPUT_FILE)
 
     logger.info("\n" + "=" * 55)
-    logger.info(f"  ✓ Gotowe! Plik zapisany: {OUTPUT_FILE}")
-    logger.info(f"  Faktur wystawionych: {len(wystawione)}")
-    logger.info(f"  Faktur otrzymanych:  {len(otrzymane)}")
-    logger.info(f"  Łącznie:             {len(wystawione) + len(otrzymane)}")
+    logger.info("  ✓ Gotowe! Plik zapisany: %s", OUTPUT_FILE)
+    logger.info("  Faktur wystawionych: %s", len(wystawione))
+    logger.info("  Faktur otrzymanych:  %s", len(otrzymane))
+    logger.info("  Łącznie:             %s", len(wystawione) + len(otrzymane))
     logger.info("=" * 55)
 
 